@@ -0,0 +1,45 @@
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from util_estrutura import ArrayLinkedList
+
+"""
+Compara as políticas de auto-organização da ArrayLinkedList (não ordenada)
+em buscas uniformes e concentradas (Zipf). A profundidade média da busca é
+node_visits por busca; shifts mostra o custo da reorganização.
+"""
+
+TAMANHOS = [1000, 5000]
+N_ROUNDS = 3
+ZIPF_S = 1.1
+ESTRUTURAS = [
+    ("Sem reorganização", lambda: ArrayLinkedList(sorted_insert=False)),
+    ("Move-to-front", lambda: ArrayLinkedList(sorted_insert=False, auto_organizacao='mtf')),
+    ("Transpose", lambda: ArrayLinkedList(sorted_insert=False, auto_organizacao='transpose')),
+    ("Count", lambda: ArrayLinkedList(sorted_insert=False, auto_organizacao='count')),
+]
+METRICAS = ('node_visits', 'shifts', 'wall_time_ms')
+
+if __name__ == "__main__":
+    linhas = []
+    for n in TAMANHOS:
+        for distribuicao in ('uniforme', 'zipf'):
+            for nome, factory in ESTRUTURAS:
+                soma = {m: 0.0 for m in METRICAS}
+                for _ in range(N_ROUNDS):
+                    ds = factory()
+                    ds.carregar_dados(n)
+                    ds.clear_log()                 # mede só as buscas
+                    ds.buscar_dados(n // 4, distribuicao=distribuicao, zipf_s=ZIPF_S)
+                    ds.descarregar_dados()
+                    media = ds.summary('mean').get('search', {})
+                    for m in METRICAS:
+                        soma[m] += media.get(m, 0.0) / N_ROUNDS
+                linhas.append((n, distribuicao, nome, soma))
+
+    print()
+    print(f"{'N':>7} | {'distribuição':<12} | {'política':<20} | " + " | ".join(f"{m:>12}" for m in METRICAS))
+    print('-' * 90)
+    for n, distribuicao, nome, soma in linhas:
+        print(f"{n:>7} | {distribuicao:<12} | {nome:<20} | " + " | ".join(f"{soma[m]:>12.3f}" for m in METRICAS))
@@ -0,0 +1,55 @@
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import random
+import tracemalloc
+from util_dados import get_dados
+from util_estrutura import AVLTreeDS
+from util_estrutura_skiplist import SkipListDS
+from util_estrutura_matricula import RadixTrieDS, DirectAddressDS
+
+"""
+Compara as estruturas especializadas em matrícula (RadixTrie e DirectAddress)
+com as árvores baseadas em comparação: memória ocupada pela estrutura e
+latência/visitas/comparações médias por busca.
+"""
+
+TAMANHOS = [1000, 10000, 50000]
+ESTRUTURAS = [
+    ("AVL Tree balanceada", lambda: AVLTreeDS(balanced=True)),
+    ("Skip List", lambda: SkipListDS()),
+    ("Radix Trie", lambda: RadixTrieDS()),
+    ("Direct Address", lambda: DirectAddressDS()),
+]
+
+def medir(factory, dados, n_buscas):
+    # memória: inclui a alocação inicial (ex.: tabela do DirectAddress) e constrói
+    # via _insert_impl para não contar o log de OpRecord
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    ds = factory()
+    for linha in dados:
+        ds._insert_impl(linha['Matricula'], linha)
+    depois, _ = tracemalloc.get_traced_memory()
+    memoria_kb = (depois - antes) / 1024.0
+
+    for linha in random.sample(dados, n_buscas):
+        ds.search(linha['Matricula'])
+    media = ds.summary('mean').get('search', {})
+    return memoria_kb, media
+
+if __name__ == "__main__":
+    linhas = []
+    for n in TAMANHOS:
+        dados = get_dados(n)
+        for nome, factory in ESTRUTURAS:
+            memoria_kb, media = medir(factory, dados, n // 4)
+            linhas.append((n, nome, memoria_kb, media))
+
+    print()
+    print(f"{'N':>7} | {'estrutura':<20} | {'memória (KB)':>12} | {'wall_time_ms':>12} | {'node_visits':>11} | {'comparisons':>11}")
+    print('-' * 90)
+    for n, nome, memoria_kb, media in linhas:
+        print(f"{n:>7} | {nome:<20} | {memoria_kb:>12.1f} | {media.get('wall_time_ms', 0):>12.4f} | "
+              f"{media.get('node_visits', 0):>11.2f} | {media.get('comparisons', 0):>11.2f}")
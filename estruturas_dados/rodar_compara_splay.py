@@ -0,0 +1,43 @@
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from util_estrutura import AVLTreeDS
+from util_estrutura_splay import SplayTreeDS
+
+"""
+Compara a Splay Tree com a AVL balanceada em buscas uniformes e concentradas (Zipf).
+Mostra a média por busca de comparações, visitas, rotações e tempo.
+"""
+
+TAMANHOS = [1000, 10000, 50000]
+N_ROUNDS = 3
+ZIPF_S = 1.1
+ESTRUTURAS = [
+    ("AVL Tree balanceada", lambda: AVLTreeDS(balanced=True)),
+    ("Splay Tree", lambda: SplayTreeDS()),
+]
+METRICAS = ('comparisons', 'node_visits', 'rotations', 'wall_time_ms')
+
+if __name__ == "__main__":
+    linhas = []
+    for n in TAMANHOS:
+        for distribuicao in ('uniforme', 'zipf'):
+            for nome, factory in ESTRUTURAS:
+                soma = {m: 0.0 for m in METRICAS}
+                for _ in range(N_ROUNDS):
+                    ds = factory()
+                    ds.carregar_dados(n)
+                    ds.clear_log()                 # mede só as buscas
+                    ds.buscar_dados(n // 4, distribuicao=distribuicao, zipf_s=ZIPF_S)
+                    ds.descarregar_dados()
+                    media = ds.summary('mean').get('search', {})
+                    for m in METRICAS:
+                        soma[m] += media.get(m, 0.0) / N_ROUNDS
+                linhas.append((n, distribuicao, nome, soma))
+
+    print()
+    print(f"{'N':>7} | {'distribuição':<12} | {'estrutura':<20} | " + " | ".join(f"{m:>12}" for m in METRICAS))
+    print('-' * 110)
+    for n, distribuicao, nome, soma in linhas:
+        print(f"{n:>7} | {distribuicao:<12} | {nome:<20} | " + " | ".join(f"{soma[m]:>12.3f}" for m in METRICAS))
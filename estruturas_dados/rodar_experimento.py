@@ -3,9 +3,22 @@ import sys, os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from util_estrutura import AVLTreeDS, HashTableDS, ArrayLinkedList, BaseDataStructure
+from util_dados import hash_dados
+from util_resultados import ResultadosDB
+from util_estatistica import remover_outliers_mad, largura_relativa_ic95
+from util_isolamento import GC_MODOS, isolar, ambiente, fixar_cpu
+import util_estrutura
+import util_isolamento
 from util_graficos import GraficosMetricas
-from time import time
+from time import time, perf_counter
+from multiprocessing import Pool, Queue
+from typing import NamedTuple, Optional, Tuple
+import hashlib
+import inspect
 import json
+import math
+import re
+import signal
 
 """
 ESTRUTURAS TESTADAS:
@@ -21,6 +34,368 @@ M_HASH_TABLE = [100,1000,5000]
 N_ROUNDS = 5
 PASTA_ROUNDS = './rounds'
 os.makedirs(PASTA_ROUNDS, exist_ok=True)
+# -checkpoints: cada round carrega só até max(TAMANHOS) e mede os N menores no caminho
+MODO_CHECKPOINTS = '-checkpoints' in sys.argv
+
+def valor_opcao(nome, padrao=None):
+    """Valor de '-nome=valor' na linha de comando; '-nome' sozinho devolve padrao; ausente -> None."""
+    for arg in sys.argv[1:]:
+        if arg == nome:
+            return padrao
+        if arg.startswith(nome + '='):
+            return arg.split('=', 1)[1]
+    return None
+
+# -isolar[=congelar|desligar|normal]: rounds isolados (util_isolamento.isolar): gc congelado ou
+# desligado nas fases medidas e com as coletas registradas por operação, processo preso a um
+# núcleo e ambiente (Python, CPU, governador, carga) anotado em cada round
+ISOLAR_GC = valor_opcao('-isolar', 'congelar')
+if ISOLAR_GC is not None and ISOLAR_GC not in GC_MODOS:
+    sys.exit(f"-isolar={ISOLAR_GC}: use um de {GC_MODOS}")
+# -paralelo[=K]: distribui os jobs (estrutura, N, round) em K processos (padrão: todos os núcleos)
+PROCESSOS = int(valor_opcao('-paralelo', os.cpu_count() or 1) or 0)
+# -fixar-cpu: cada job roda preso a um núcleo livre (os.sched_setaffinity, só Linux); implícito em -isolar
+FIXAR_CPU = '-fixar-cpu' in sys.argv or ISOLAR_GC is not None
+# -timeout=S: jobs que passam de S segundos são abandonados (nada é gravado para eles)
+TIMEOUT_JOB = float(valor_opcao('-timeout') or 0) or None
+# -adaptativo: em vez de N_ROUNDS fixos, repete rounds de cada (estrutura, N) até o IC95 da
+# METRICA_ADAPTATIVA ficar mais estreito que ALVO_IC (relativo à média) ou o orçamento acabar
+MODO_ADAPTATIVO = '-adaptativo' in sys.argv
+ALVO_IC = float(valor_opcao('-ic') or 0.05)              # largura do IC95 / média
+ORCAMENTO_S = float(valor_opcao('-orcamento') or 300)    # segundos por (estrutura, N), aquecimento incluído
+METRICA_ADAPTATIVA = valor_opcao('-metrica') or 'wall_time_ms'
+OPS_ADAPTATIVO = ('insert', 'search', 'remove')
+AQUECIMENTO = 1          # rounds descartados antes do primeiro medido
+MIN_ROUNDS, MAX_ROUNDS = 3, 50
+# -graficos-db: não roda nada, refaz os gráficos consultando o banco de resultados
+SOMENTE_GRAFICOS_DB = '-graficos-db' in sys.argv
+# banco de resultados (util_resultados); todo round salvo ou lido do cache é registrado nele
+RESULTADOS: Optional[ResultadosDB] = None
+
+# Registro das estruturas testadas (nível de módulo: os workers do modo paralelo
+# recriam a estrutura pelo nome, já que lambdas não atravessam processos)
+ESTRUTURAS = [
+    ("AVL Tree balanceada", lambda: AVLTreeDS(balanced=True)),
+    ("AVL Tree não balanceada", lambda: AVLTreeDS(balanced=False)),
+    ("Array LinkedList Não ordenado", lambda: ArrayLinkedList(sorted_insert=False)),
+    ("Array LinkedList Ordenado", lambda: ArrayLinkedList(sorted_insert=True))
+]
+for h in M_HASH_TABLE:
+    ESTRUTURAS.append((f"Hash Table M={h} poly31", lambda h=h: HashTableDS(M=h, hash_fn='poly31')))
+    ESTRUTURAS.append((f"Hash Table M={h} fnv1a", lambda h=h: HashTableDS(M=h, hash_fn='fnv1a')))
+    ESTRUTURAS.append((f"Hash Table M={h} djb2", lambda h=h: HashTableDS(M=h, hash_fn='djb2')))
+FACTORIES = dict(ESTRUTURAS)
+
+def custo_estimado(nome_estrutura, n):
+    """
+    Custo relativo de um round de tamanho n (N inserções + N/4 buscas + N/10 remoções),
+    pelo custo de acesso de cada estrutura; serve só para ordenar os jobs (mais longos primeiro).
+    """
+    if nome_estrutura.startswith("Array LinkedList"):
+        percurso = n / 2                      # busca/remoção percorrem em média meia lista
+        insercao = percurso if nome_estrutura == "Array LinkedList Ordenado" else 1
+    elif nome_estrutura.startswith("Hash Table M="):
+        m = int(nome_estrutura.split()[2][2:])
+        insercao = percurso = 1 + n / m       # encadeamento: buckets com ~n/M elementos
+    else:
+        insercao = percurso = max(1.0, math.log2(n))
+    return n * insercao + (n // 4 + n // 10) * percurso
+
+def _fonte(obj):
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        return getattr(obj, '__qualname__', repr(obj))
+
+def _partes_estrutura(estrutura: BaseDataStructure):
+    # classes da estrutura (inclui BaseDataStructure), codec, params, métricas ignoradas e,
+    # nos envoltórios, o mesmo para a estrutura interna
+    for cls in type(estrutura).__mro__[:-1]:
+        yield _fonte(cls)
+    if estrutura._codec is not None:
+        yield _fonte(type(estrutura._codec))
+    yield json.dumps(estrutura.params, sort_keys=True, default=lambda o: getattr(o, '__qualname__', type(o).__name__))
+    yield ','.join(sorted(estrutura._metricas_ignorar))
+    interna = estrutura.__dict__.get('estrutura')
+    if isinstance(interna, BaseDataStructure):
+        yield from _partes_estrutura(interna)
+
+_DIGESTS = {}   # (nome_estrutura, n, tamanhos) -> digest
+
+def digest_round(nome_estrutura, n, tamanhos=()):
+    """
+    Hash (12 hex) de tudo que determina o resultado de um round e que entra no nome do
+    arquivo de round: código-fonte das classes da estrutura, params, nível de instrumentação
+    (Counters/OpRecord, psutil), protocolo do round, modo de isolamento e conteúdo dos
+    arquivos de dados. Se qualquer parte muda, o round antigo deixa de ser encontrado
+    (e vira lixo para o GC).
+    """
+    chave = (nome_estrutura, n, tuple(tamanhos), ISOLAR_GC)
+    if chave not in _DIGESTS:
+        h = hashlib.sha256()
+        partes = [
+            *_partes_estrutura(FACTORIES[nome_estrutura]()),
+            _fonte(util_estrutura.Counters), _fonte(util_estrutura.OpRecord), str(util_estrutura._HAS_PSUTIL),
+            f"N={n} checkpoints={list(tamanhos)}", _fonte(executar_round) if not tamanhos else '',
+            *(hash_dados(t) for t in (tamanhos or (n,))),
+        ]
+        if ISOLAR_GC is not None:
+            partes += [f"isolamento={ISOLAR_GC}", _fonte(util_isolamento.isolar), _fonte(util_isolamento.MonitorGC)]
+        for parte in partes:
+            h.update(parte.encode('utf-8'))
+            h.update(b'\0')
+        _DIGESTS[chave] = h.hexdigest()[:12]
+    return _DIGESTS[chave]
+
+def arquivo_metricas(round_num, nome_estrutura, n, tamanhos=()):
+    # sufixo '_ckpt' separa os rounds do modo -checkpoints (ordem de inserção diferente)
+    # e '_iso' os do modo -isolar, para que um modo não descarte os rounds do outro
+    sufixo = ('_iso' if ISOLAR_GC is not None else '') + ('_ckpt' if tamanhos else '')
+    digest = digest_round(nome_estrutura, n, tamanhos)
+    return os.path.join(PASTA_ROUNDS, f'metrics_{nome_estrutura.replace(" ","_")}_N{n}_round{round_num}_{digest}{sufixo}.json')
+
+_ARQUIVO_ROUND = re.compile(r'^metrics_(?P<nome>.+)_N(?P<n>\d+)_round\d+(?:_(?P<digest>[0-9a-f]{12}))?(?P<iso>_iso)?(?P<ckpt>_ckpt)?\.json$')
+
+def coletar_rounds_obsoletos():
+    """
+    Remove de PASTA_ROUNDS os rounds de (estrutura, N, modo) usados nesta execução que têm
+    outro digest (código, params, dados ou instrumentação antigos) ou nenhum (formato antigo).
+    Rounds de estruturas/tamanhos que não rodaram agora ficam intactos. Devolve os removidos.
+    """
+    atuais = {(nome.replace(" ", "_"), n, bool(tamanhos), isolamento is not None): digest
+              for (nome, n, tamanhos, isolamento), digest in _DIGESTS.items()}
+    removidos = []
+    for arq in sorted(os.listdir(PASTA_ROUNDS)):
+        m = _ARQUIVO_ROUND.match(arq)
+        if not m:
+            continue
+        grupo = (m['nome'], int(m['n']), bool(m['ckpt']), bool(m['iso']))
+        if grupo in atuais and m['digest'] != atuais[grupo]:
+            os.remove(os.path.join(PASTA_ROUNDS, arq))
+            removidos.append(arq)
+    return removidos
+
+def carregar_round(arq_metricas):
+    """Métricas de um round em disco, ou None se o arquivo não existe ou está corrompido."""
+    if not os.path.exists(arq_metricas):
+        return None
+    try:
+        with open(arq_metricas, 'r') as f:
+            metricas = json.load(f)
+    except Exception as e:
+        print(f"    ❌ Erro ao carregar {arq_metricas}: {e}")
+        return None
+    registrar_resultado(metricas, arq_metricas)
+    return metricas
+
+def registrar_resultado(metricas, arq_metricas):
+    """Enfileira o round no banco de resultados (se aberto); rounds já registrados são ignorados."""
+    if RESULTADOS is not None:
+        modo = ('checkpoints' if 'checkpoint' in metricas else 'padrao') + ('_isolado' if 'ambiente' in metricas else '')
+        RESULTADOS.adicionar_export(metricas, modo=modo, arquivo=arq_metricas)
+
+def salvar_metricas(metricas, arq_metricas):
+    try:
+        with open(arq_metricas, 'w') as f:
+            json.dump(metricas, f, indent=2)
+        print(f"      💾 Métricas salvas em {arq_metricas}")
+    except Exception as e:
+        print(f"      ❌ Erro ao salvar métricas em {arq_metricas}: {e}")
+        exit(1)
+    registrar_resultado(metricas, arq_metricas)
+
+def executar_round(factory_estrutura, n):
+    """Um round do modo padrão: N inserções, N/4 buscas e N/10 remoções numa estrutura nova."""
+    estrutura:BaseDataStructure = factory_estrutura()
+    estrutura.clear_log()  # Limpa logs anteriores
+
+    # Executa operações (com -isolar, sob o gc controlado; info = ambiente do round)
+    with isolar(ISOLAR_GC) as info:
+        estrutura.carregar_dados(n)        # INSERTs
+        estrutura.buscar_dados(n // 4)     # SEARCHs (25% do total)
+        estrutura.remover_dados(n // 10)   # REMOVEs (10% do total)
+    estrutura.descarregar_dados()      # retira o dataset da memória
+    metricas = estrutura.export_metrics_json()
+    if info is not None:
+        metricas["ambiente"] = info
+    return metricas
+
+def executar_round_checkpoints(factory_estrutura, tamanhos):
+    """Um round do modo -checkpoints: uma carga até max(tamanhos), um export por N."""
+    estrutura:BaseDataStructure = factory_estrutura()
+    estrutura.clear_log()
+    with isolar(ISOLAR_GC) as info:
+        exports = estrutura.carregar_com_checkpoints(list(tamanhos))
+    if info is not None:
+        for metricas in exports:
+            metricas["ambiente"] = info
+    return exports
+
+def valor_round(metricas, metrica=None, ops=OPS_ADAPTATIVO):
+    """Valor de um round para o critério de parada: soma da métrica nas operações ops (agg='sum')."""
+    metrica = metrica or METRICA_ADAPTATIVA
+    return sum(float(r.get(metrica) or 0) for r in metricas["metrics"] if r.get("op") in ops)
+
+def rodar_rounds_adaptativo(nome_estrutura, factory_estrutura, n, lista_metricas):
+    """
+    Modo -adaptativo para um (estrutura, N): reaproveita os rounds em disco (0, 1, ...),
+    roda AQUECIMENTO rounds descartados e então um round por vez até que o IC95 da
+    METRICA_ADAPTATIVA, sem os outliers do MAD, tenha largura relativa <= ALVO_IC
+    (com ao menos MIN_ROUNDS), ou até ORCAMENTO_S segundos / MAX_ROUNDS rounds.
+    Devolve (rounds, largura relativa obtida, motivo da parada).
+    """
+    valores = []
+    while len(valores) < MAX_ROUNDS:
+        metricas = carregar_round(arquivo_metricas(len(valores), nome_estrutura, n))
+        if metricas is None:
+            break
+        lista_metricas.append(metricas)
+        valores.append(valor_round(metricas))
+    if valores:
+        print(f"    ✅ {len(valores)} rounds de {nome_estrutura} N = {n} já em disco")
+
+    inicio, aquecido = perf_counter(), False
+    while True:
+        mantidos, outliers = remover_outliers_mad(valores)
+        largura = largura_relativa_ic95(mantidos)
+        if len(mantidos) >= MIN_ROUNDS and largura <= ALVO_IC:
+            motivo = "precisão atingida"
+            break
+        if len(valores) >= MAX_ROUNDS:
+            motivo = f"limite de {MAX_ROUNDS} rounds"
+            break
+        if valores and perf_counter() - inicio > ORCAMENTO_S:     # ao menos um round por configuração
+            motivo = f"orçamento de {ORCAMENTO_S:g} s esgotado"
+            break
+        if not aquecido:
+            for _ in range(AQUECIMENTO):
+                executar_round(factory_estrutura, n)      # aquece caches de dados, alocador e bytecode
+            aquecido = True
+        round_num = len(valores)
+        metricas = executar_round(factory_estrutura, n)
+        salvar_metricas(metricas, arquivo_metricas(round_num, nome_estrutura, n))
+        lista_metricas.append(metricas)
+        valores.append(valor_round(metricas))
+        print(f"    🔄 Round {round_num+1} | {nome_estrutura} N = {n} | IC95 atual: {largura_relativa_ic95(remover_outliers_mad(valores)[0]):.1%} da média")
+    print(f"    📐 {len(valores)} rounds ({len(outliers)} outliers), IC95 = {largura:.1%} da média de {METRICA_ADAPTATIVA} [{motivo}]")
+    return len(valores), largura, motivo
+
+def rodar_rounds_checkpoints(nome_estrutura, factory_estrutura, lista_metricas, pendentes=None):
+    """
+    Modo -checkpoints: um round = uma carga até max(TAMANHOS), com as fases de busca
+    e remoção medidas em cada N (BaseDataStructure.carregar_com_checkpoints).
+    Grava um arquivo por (N, round), no mesmo formato do modo padrão.
+    Com pendentes (modo paralelo), os rounds que faltam viram jobs em vez de rodar aqui.
+    """
+    for round_num in range(N_ROUNDS):
+        arquivos = {n: arquivo_metricas(round_num, nome_estrutura, n, TAMANHOS) for n in TAMANHOS}
+        em_disco = [carregar_round(a) for a in arquivos.values()]
+        if all(m is not None for m in em_disco):
+            print(f"    ✅ Round {round_num+1}/{N_ROUNDS} | {nome_estrutura} N = {TAMANHOS} | [já existente, carregando...]")
+            lista_metricas.extend(em_disco)
+            continue
+        if pendentes is not None:
+            pendentes.append(Job(nome_estrutura, max(TAMANHOS), round_num, tuple(TAMANHOS)))
+            continue
+        print(f"    🔄 Round {round_num+1}/{N_ROUNDS} | {nome_estrutura} checkpoints N = {TAMANHOS}")
+        for metricas in executar_round_checkpoints(factory_estrutura, TAMANHOS):
+            salvar_metricas(metricas, arquivos[metricas["checkpoint"]])
+            lista_metricas.append(metricas)
+
+class Job(NamedTuple):
+    nome_estrutura: str
+    n: int                       # tamanho do round (modo -checkpoints: max(tamanhos))
+    round_num: int
+    tamanhos: Tuple[int, ...] = ()   # modo -checkpoints: Ns medidos na mesma carga
+
+    def custo(self):
+        return custo_estimado(self.nome_estrutura, self.n)
+
+    def arquivo(self, n):
+        """Arquivo de round das métricas de tamanho n produzidas pelo job."""
+        return arquivo_metricas(self.round_num, self.nome_estrutura, n, self.tamanhos)
+
+class TempoEsgotado(Exception):
+    pass
+
+_CPUS_LIVRES: Optional[Queue] = None   # núcleos ainda não usados por nenhum job (-fixar-cpu)
+_TIMEOUT_WORKER: Optional[float] = None
+
+def _iniciar_worker(cpus_livres, timeout, isolamento):
+    global _CPUS_LIVRES, _TIMEOUT_WORKER, ISOLAR_GC
+    _CPUS_LIVRES, _TIMEOUT_WORKER, ISOLAR_GC = cpus_livres, timeout, isolamento
+
+def _estourou_tempo(signum, frame):
+    raise TempoEsgotado()
+
+def _executar_job(job: Job):
+    """
+    Roda um job num worker (um processo novo por job, sem heap/tracemalloc herdado do anterior).
+    Devolve (job, métricas, erro, segundos, cpu); quem grava os arquivos é o processo principal.
+    """
+    cpu = _CPUS_LIVRES.get() if _CPUS_LIVRES is not None else None
+    inicio = perf_counter()
+    try:
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+        if _TIMEOUT_WORKER:
+            signal.signal(signal.SIGALRM, _estourou_tempo)
+            signal.setitimer(signal.ITIMER_REAL, _TIMEOUT_WORKER)
+        factory_estrutura = FACTORIES[job.nome_estrutura]
+        if job.tamanhos:
+            metricas = executar_round_checkpoints(factory_estrutura, job.tamanhos)
+        else:
+            metricas = [executar_round(factory_estrutura, job.n)]
+        erro = None
+    except TempoEsgotado:
+        metricas, erro = [], f"tempo esgotado ({_TIMEOUT_WORKER:g} s)"
+    except Exception as e:
+        metricas, erro = [], f"{type(e).__name__}: {e}"
+    finally:
+        if _TIMEOUT_WORKER:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        if cpu is not None:
+            _CPUS_LIVRES.put(cpu)
+    return job, metricas, erro, perf_counter() - inicio, cpu
+
+def rodar_jobs_paralelos(jobs, processos=None, fixar_cpu=FIXAR_CPU, timeout=TIMEOUT_JOB):
+    """
+    Distribui os jobs num pool de processos, os mais caros primeiro (custo_estimado), para
+    que os rounds quadráticos de N grande não fiquem para o fim com os outros núcleos ociosos.
+    Cada resultado é gravado no arquivo de round correspondente assim que chega.
+    Devolve as métricas na ordem dos jobs; jobs com erro ou tempo esgotado ficam de fora.
+    """
+    processos = processos or PROCESSOS or os.cpu_count() or 1
+    cpus_livres = None
+    if fixar_cpu:
+        if hasattr(os, 'sched_setaffinity'):
+            cpus = sorted(os.sched_getaffinity(0))
+            processos = min(processos, len(cpus))
+            cpus_livres = Queue()
+            for c in cpus:
+                cpus_livres.put(c)
+        else:
+            print("  ⚠️ -fixar-cpu indisponível nesta plataforma (sem os.sched_setaffinity)")
+    if timeout and not hasattr(signal, 'setitimer'):
+        print("  ⚠️ -timeout indisponível nesta plataforma (sem signal.setitimer)")
+        timeout = None
+    ordem = sorted(jobs, key=lambda j: j.custo(), reverse=True)
+    print(f"\n⚙️ {len(ordem)} jobs em {processos} processos (mais longos primeiro)"
+          f"{', fixados por núcleo' if cpus_livres is not None else ''}"
+          f"{f', timeout {timeout:g} s' if timeout else ''}")
+
+    resultados = {}
+    with Pool(processos, initializer=_iniciar_worker, initargs=(cpus_livres, timeout, ISOLAR_GC), maxtasksperchild=1) as pool:
+        for k, (job, metricas, erro, segundos, cpu) in enumerate(pool.imap_unordered(_executar_job, ordem, chunksize=1), 1):
+            rotulo = f"{job.nome_estrutura} N = {job.tamanhos or job.n} round {job.round_num+1}"
+            if erro:
+                print(f"    ❌ [{k}/{len(ordem)}] {rotulo}: {erro}")
+                continue
+            print(f"    ✅ [{k}/{len(ordem)}] {rotulo} | {segundos:.1f} s{f' | CPU {cpu}' if cpu is not None else ''}")
+            for m in metricas:
+                salvar_metricas(m, job.arquivo(m.get("checkpoint", job.n)))
+            resultados[job] = metricas
+    return [m for job in jobs for m in resultados.get(job, [])]
 
 def gerar_experimento_completo():
     """
@@ -35,16 +410,7 @@ def gerar_experimento_completo():
     lista_metricas = []
     
     # Definição das estruturas a serem testadas
-    estruturas = [
-        ("AVL Tree balanceada", lambda: AVLTreeDS(balanced=True)),
-        ("AVL Tree não balanceada", lambda: AVLTreeDS(balanced=False)),
-        ("Array LinkedList Não ordenado", lambda: ArrayLinkedList(sorted_insert=False)),
-        ("Array LinkedList Ordenado", lambda: ArrayLinkedList(sorted_insert=True))
-    ]
-    for h in M_HASH_TABLE:
-        estruturas.append((f"Hash Table M={h} poly31", lambda h=h: HashTableDS(M=h, hash_fn='poly31')))
-        estruturas.append((f"Hash Table M={h} fnv1a", lambda h=h: HashTableDS(M=h, hash_fn='fnv1a')))
-        estruturas.append((f"Hash Table M={h} djb2", lambda h=h: HashTableDS(M=h, hash_fn='djb2')))
+    estruturas = list(ESTRUTURAS)
     
     # Para debug/testes rápidos: descomente a linha abaixo para testar apenas AVL Trees
     # com parâmetro debug, roda o experimento rápido
@@ -57,9 +423,14 @@ def gerar_experimento_completo():
 
     if '-limpar' in sys.argv:
         print("⚠️ Limpar cache: remove métricas antigas na pasta rounds")
+        removidos = []
         for f in os.listdir(PASTA_ROUNDS):
             if f.endswith('.json'):
                 os.remove(os.path.join(PASTA_ROUNDS, f))
+                removidos.append(f)
+        # os rounds apagados também saem do banco de resultados
+        if RESULTADOS is not None and removidos:
+            RESULTADOS.remover_arquivos(removidos)
         print("   ✅ Cache limpo com sucesso!")
     
     print(f"📊 Configuração do experimento:")
@@ -71,87 +442,109 @@ def gerar_experimento_completo():
     print(f"  - {len(TAMANHOS)} tamanhos: {TAMANHOS}")
     print(f"  - {N_ROUNDS} rounds por configuração")
     print(f"  - Total: {len(estruturas) * len(TAMANHOS) * N_ROUNDS} execuções")
+    if MODO_CHECKPOINTS:
+        print(f"  - Modo checkpoints: {len(estruturas) * N_ROUNDS} cargas até N = {max(TAMANHOS)}")
+    if MODO_ADAPTATIVO and MODO_CHECKPOINTS:
+        print("  - ⚠️ -adaptativo não se aplica com -checkpoints (rounds de carga única): usando N_ROUNDS")
+    elif MODO_ADAPTATIVO:
+        print(f"  - Modo adaptativo: rounds até IC95 <= {ALVO_IC:.0%} da média de {METRICA_ADAPTATIVA} "
+              f"({MIN_ROUNDS}-{MAX_ROUNDS} rounds, {AQUECIMENTO} de aquecimento, {ORCAMENTO_S:g} s por configuração); ignora N_ROUNDS"
+              f"{' e -paralelo' if PROCESSOS else ''}")
+    if ISOLAR_GC is not None:
+        print(f"  - Modo isolado: gc '{ISOLAR_GC}' nas fases medidas (coletas em x_gc_coletas/x_gc_pausa_ms), "
+              f"processo preso a um núcleo, ambiente anotado em cada round")
+    if PROCESSOS:
+        print(f"  - Modo paralelo: {PROCESSOS} processos{' fixados por núcleo' if FIXAR_CPU else ''}"
+              f"{f', timeout de {TIMEOUT_JOB:g} s por job' if TIMEOUT_JOB else ''}")
     print()
 
     
     # Coleta dados para todas as combinações
     total_execucoes = len(estruturas) * len(TAMANHOS) * N_ROUNDS
     execucao_atual = 0
+    # modo paralelo: rounds que faltam em disco (o adaptativo decide round a round, então roda em série)
+    pendentes = [] if PROCESSOS and (MODO_CHECKPOINTS or not MODO_ADAPTATIVO) else None
+    if ISOLAR_GC is not None and pendentes is None:
+        # em série, o próprio processo fica num núcleo só (no paralelo, cada worker)
+        cpu = fixar_cpu()
+        print(f"📌 Processo preso à CPU {cpu}" if cpu is not None else "  ⚠️ afinidade de CPU indisponível nesta plataforma")
     
     for i, (nome_estrutura, factory_estrutura) in enumerate(estruturas):
         print(f"🔧 ESTRUTURA {i+1}/{len(estruturas)}: {nome_estrutura}")
+        if MODO_CHECKPOINTS:
+            rodar_rounds_checkpoints(nome_estrutura, factory_estrutura, lista_metricas, pendentes)
+            continue
         
         for n in TAMANHOS:
             print(f"  📏 N = {n:,} elementos")
+            if MODO_ADAPTATIVO:
+                rodar_rounds_adaptativo(nome_estrutura, factory_estrutura, n, lista_metricas)
+                continue
 
-            # verifica se todos os rounds estão em disco e usa os dados carregados
-            gerar_arq_metricas = lambda rn,nm, _n:os.path.join(PASTA_ROUNDS,f'metrics_{nm.replace(" ","_")}_N{_n}_round{rn}.json')
-            metricas_disco = []
+            # reaproveita cada round já em disco; só os que faltam são executados
+            faltando = []
             for round_num in range(N_ROUNDS):
-                arq_metricas = gerar_arq_metricas(round_num, nome_estrutura, n)
-                if os.path.exists(arq_metricas):
-                    print(f"    ✅ Round {round_num+1}/{N_ROUNDS} | {nome_estrutura} N = {n} | [já existente, carregando...]")
-                    # Carrega métricas do arquivo JSON
-                    try:
-                        with open(arq_metricas, 'r') as f:
-                            metricas_json = json.load(f)
-                        metricas_disco.append(metricas_json)
-                    except Exception as e:
-                        print(f"    ❌ Erro ao carregar {arq_metricas}: {e}")
-                        metricas_disco = []
-                        break
-                else:
-                    metricas_disco = []
-                    break
-
-            if len(metricas_disco) == N_ROUNDS:
+                metricas_json = carregar_round(arquivo_metricas(round_num, nome_estrutura, n))
+                if metricas_json is None:
+                    faltando.append(round_num)
+                    continue
+                print(f"    ✅ Round {round_num+1}/{N_ROUNDS} | {nome_estrutura} N = {n} | [já existente, carregando...]")
+                lista_metricas.append(metricas_json)
+
+            if not faltando:
                 print(f"    🎉 Todos os {N_ROUNDS} rounds já existem em disco. Usando dados carregados.")
-                lista_metricas.extend(metricas_disco)
                 continue  # pula para o próximo tamanho n
+            execucao_atual += N_ROUNDS - len(faltando)
+
+            if pendentes is not None:
+                pendentes.extend(Job(nome_estrutura, n, round_num) for round_num in faltando)
+                continue
             
-            for round_num in range(N_ROUNDS):
+            for round_num in faltando:
                 execucao_atual += 1
                 progresso = (execucao_atual / total_execucoes) * 100
                 
                 print(f"    🔄 Round {round_num+1}/{N_ROUNDS} | {nome_estrutura} N = {n} | [{progresso:.1f}%]")
                 
-                # Cria nova instância da estrutura
-                estrutura:BaseDataStructure = factory_estrutura()
-                estrutura.clear_log()  # Limpa logs anteriores
-                                
-                # Executa operações
-                estrutura.carregar_dados(n)        # INSERTs
-                estrutura.buscar_dados(n // 4)     # SEARCHs (25% do total)
-                estrutura.remover_dados(n // 10)   # REMOVEs (10% do total)
-                estrutura.descarregar_dados()      # retira o dataset da memória
-                
-                # Adiciona à lista
-                metricas = estrutura.export_metrics_json()
+                # Cria nova instância da estrutura e executa as operações
+                metricas = executar_round(factory_estrutura, n)
                 # Salva métricas em arquivo JSON para possível reuso futuro
-                arq_metricas = gerar_arq_metricas(round_num, nome_estrutura, n)
-                try:
-                    with open(arq_metricas, 'w') as f:
-                        json.dump(metricas, f, indent=2)
-                    print(f"      💾 Métricas salvas em {arq_metricas}")
-                except Exception as e:
-                    print(f"      ❌ Erro ao salvar métricas em {arq_metricas}: {e}")
-                    exit(1)
+                salvar_metricas(metricas, arquivo_metricas(round_num, nome_estrutura, n))
                 lista_metricas.append(metricas)
+
+    if pendentes:
+        lista_metricas.extend(rodar_jobs_paralelos(pendentes))
+
+    # rounds de versões anteriores das mesmas configurações não serão mais lidos
+    obsoletos = coletar_rounds_obsoletos()
+    if obsoletos:
+        print(f"🧹 {len(obsoletos)} rounds obsoletos removidos de {PASTA_ROUNDS}")
+        if RESULTADOS is not None:
+            RESULTADOS.remover_arquivos(obsoletos)
+    if RESULTADOS is not None:
+        RESULTADOS.descarregar()
     
     print("\n✅ Coleta de dados concluída!")
     print(f"📊 {len(lista_metricas)} estruturas prontas para análise")
     
     return lista_metricas, estruturas
 
-def gerar_graficos_comparativos(lista_metricas):
+def gerar_graficos_comparativos(lista_metricas, db=None):
     """
     Gera gráficos comparativos com um gráfico por métrica.
     Cada gráfico compara todas as estruturas para uma única métrica.
+    Com db (ResultadosDB), consulta os rounds do banco em vez de lista_metricas.
     """
     print("\n📈 GERANDO GRÁFICOS COMPARATIVOS...")
     print("=" * 40)
     
     # Converte estruturas para o formato de métricas JSON ou utiliza as que foram recuperadas
+    modo_db = ('checkpoints' if MODO_CHECKPOINTS else 'padrao') + ('_isolado' if ISOLAR_GC is not None else '')
+    rejeitar = MODO_ADAPTATIVO and not MODO_CHECKPOINTS
+    def dados(lista, **filtros_db):
+        if db is None:
+            return dict(metrics_data=lista, rejeitar_outliers=rejeitar)
+        return dict(db=db, experimento='estruturas_dados', modo=modo_db, rejeitar_outliers=rejeitar, **filtros_db)
    
     gm = GraficosMetricas()
     caminhos_gerados = []
@@ -164,6 +557,9 @@ def gerar_graficos_comparativos(lista_metricas):
         ('mem_moves', 'Movimentações de Memória', ('insert', 'search', 'remove')),
         ('proc_time_ms', 'Tempo de CPU (ms)', ('insert', 'search', 'remove'))
     ]
+    if ISOLAR_GC is not None:
+        # extras registrados por util_isolamento durante as fases medidas
+        metricas_principais.append(('x_gc_pausa_ms', 'Pausas do GC (ms)', ('insert', 'search', 'remove')))
     
     # Gera um gráfico por métrica principal
     print("📊 Gerando gráficos individuais por métrica...")
@@ -173,14 +569,14 @@ def gerar_graficos_comparativos(lista_metricas):
             
             # Filtra métricas para estruturas que suportam esta métrica
             metricas_filtradas = []
-            for metrica_json in lista_metricas:
+            for metrica_json in lista_metricas or []:
                 # Verifica se a métrica json alguma estrutura correspondente ignora esta métrica
                 if metrica not in metrica_json.get('metrics_out',[]):
                    metricas_filtradas.append(metrica_json)
             
             # Gera gráfico comparativo para esta métrica
             caminho = gm.plotar_metricas(
-                metrics_data=metricas_filtradas,
+                **dados(metricas_filtradas, ignorar_metrics_out=True),
                 metrics=[metrica],  # Uma métrica por gráfico
                 agg='sum',
                 escala=escala,
@@ -195,7 +591,7 @@ def gerar_graficos_comparativos(lista_metricas):
     for escala in ['linear', 'log']:
         print(f"  5. Tempo de Execução (ms). {escala}...")
         caminho_time = gm.plotar_metricas(
-            metrics_data=lista_metricas,
+            **dados(lista_metricas),
             metrics=['wall_time_ms'],
             agg='sum',
             escala=escala,
@@ -206,7 +602,7 @@ def gerar_graficos_comparativos(lista_metricas):
         # Análise específica de inserções
         print(f"  6. Comparações em Inserções. {escala}...")
         caminho_insert = gm.plotar_metricas(
-            metrics_data=lista_metricas,
+            **dados(lista_metricas),
             metrics=['comparisons'],
             agg='sum',
             escala=escala,
@@ -218,7 +614,7 @@ def gerar_graficos_comparativos(lista_metricas):
         # Análise específica de buscas
         print(f"  7. Comparações em Buscas. {escala}...")
         caminho_search = gm.plotar_metricas(
-            metrics_data=lista_metricas,
+            **dados(lista_metricas),
             metrics=['comparisons'],
             agg='sum',
             escala=escala,
@@ -229,13 +625,14 @@ def gerar_graficos_comparativos(lista_metricas):
     
         # Separar métricas de estruturas hash para análise específica
         hash_metricas = []
-        for metrica_json in lista_metricas:
+        for metrica_json in lista_metricas or []:
             # Verifica se é uma estrutura hash
             if 'HashTable' in metrica_json.get('ds_name', ''):
                 hash_metricas.append(metrica_json)
+        hash_nomes = [d for d in db.ds_names('estruturas_dados', modo_db) if 'HashTable' in d] if db is not None else []
         
         # Gráficos específicos para Hash Tables (se existirem)
-        if hash_metricas:
+        if hash_metricas or hash_nomes:
             print(f"📊 Gerando gráficos específicos para Hash Tables.{escala}...")
             
             # Métricas específicas de hash tables
@@ -250,7 +647,7 @@ def gerar_graficos_comparativos(lista_metricas):
                 
                 # Gera gráfico específico para hash tables
                 caminho_hash = gm.plotar_metricas(
-                    metrics_data=hash_metricas,  # Apenas métricas de hash tables
+                    **dados(hash_metricas, ds_names=hash_nomes),  # Apenas métricas de hash tables
                     metrics=[metrica_hash],
                     agg='sum',
                     escala=escala,
@@ -266,11 +663,21 @@ if __name__ == "__main__":
     inicio = time()
     # limpando pasta de gráficos antigos
     GraficosMetricas.limpar_pasta_graficos()
-    # Gera experimento
-    lista_metricas, estruturas = gerar_experimento_completo()
-    
-    # Gera gráficos
-    caminhos = gerar_graficos_comparativos(lista_metricas)
+    RESULTADOS = ResultadosDB()
+    if SOMENTE_GRAFICOS_DB:
+        print(f"📚 Refazendo os gráficos a partir de {RESULTADOS.arquivo}")
+        lista_metricas, estruturas = [], ESTRUTURAS
+        caminhos = gerar_graficos_comparativos(None, db=RESULTADOS)
+    else:
+        RESULTADOS.iniciar_run('estruturas_dados', dict(
+            tamanhos=TAMANHOS, n_rounds=N_ROUNDS, estruturas=[nome for nome, _ in ESTRUTURAS],
+            checkpoints=MODO_CHECKPOINTS, isolamento=ISOLAR_GC, ambiente=ambiente(ISOLAR_GC), argv=sys.argv[1:]))
+        # Gera experimento
+        lista_metricas, estruturas = gerar_experimento_completo()
+
+        # Gera gráficos
+        caminhos = gerar_graficos_comparativos(lista_metricas)
+    RESULTADOS.fechar()
 
     print("\n🎉 EXPERIMENTO CONCLUÍDO COM SUCESSO!")
     print("=" * 50)
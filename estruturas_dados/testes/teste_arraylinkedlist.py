@@ -126,11 +126,197 @@ def test_position_insertion():
     
     print()
 
+def test_storage_array():
+    """Compara storage='array' (pool de nós) com storage='nodes'."""
+    print("=== Teste de Storage em Array ===")
+
+    chaves = [f"{(i * 7919) % 500:06d}" for i in range(500)]
+    resultados = {}
+    for storage in ('nodes', 'array'):
+        ds = ArrayLinkedList(sorted_insert=True, storage=storage, capacidade=16)
+        for k in chaves:
+            ds.insert(k, {"Matricula": k})
+        for k in chaves[:200]:
+            ds.remove(k)
+        for k in chaves[:100]:
+            ds.insert(k, {"Matricula": k})
+        for k in chaves:
+            ds.search(k)
+        s = ds.summary("sum")
+        resultados[storage] = (ds.to_list(), {op: (m.get('comparisons'), m.get('shifts'), m.get('node_visits'))
+                                              for op, m in s.items()})
+        print(f"  {storage}: tamanho={ds.length} capacidade={ds.capacidade}")
+
+    print(f"Mesma ordem: {resultados['nodes'][0] == resultados['array'][0]} (esperado: True)")
+    print(f"Mesmas métricas: {resultados['nodes'][1] == resultados['array'][1]} (esperado: True)")
+
+    ds = ArrayLinkedList(default_pos=0, storage='array', capacidade=4)
+    for k in ("000001", "000002", "000003", "000004"):
+        ds.insert(k, {})
+    ds.remove("000002")
+    ds.insert("000005", {})
+    print(f"Slot reaproveitado da free-list: {ds.capacidade} (esperado: 4)")
+    print(f"Ordem: {[k for k, _ in ds.to_list()]} (esperado: ['000005', '000004', '000003', '000001'])")
+    print()
+
+def test_skip_index():
+    """Verifica que o índice de âncoras mantém o resultado e reduz as visitas."""
+    print("=== Teste de Skip Index ===")
+
+    chaves = [f"{(i * 7919) % 2000:06d}" for i in range(2000)]
+    visitas, listas = {}, {}
+    for skip in (False, True):
+        ds = ArrayLinkedList(sorted_insert=True, skip_index=skip)
+        for k in chaves:
+            ds.insert(k, {"Matricula": k})
+        for k in chaves[::3]:
+            ds.remove(k)
+        for k in chaves[:500]:
+            ds.search(k)
+        s = ds.summary("sum")
+        visitas[skip] = {op: s[op].get('node_visits', 0) for op in ('insert', 'search', 'remove')}
+        listas[skip] = [k for k, _ in ds.to_list()]
+        print(f"  skip_index={skip}: visitas {visitas[skip]}")
+
+    print(f"Mesma ordem: {listas[False] == listas[True]} (esperado: True)")
+    print(f"Menos visitas na inserção: {visitas[True]['insert'] < visitas[False]['insert'] / 10} (esperado: True)")
+    print(f"Âncoras: {len(ds._anc_h)} (esperado: ~sqrt({ds.length}))")
+
+    ds = ArrayLinkedList(default_pos=0, skip_index=True)
+    for i in range(1000):
+        ds.insert(f"{i:06d}", {})
+    ds.clear_log()
+    no = ds._node_at(700)
+    print(f"Nó na posição 700: {no.key} (esperado: 000299)")
+    print(f"Visitas para chegar lá: {ds.counters.node_visits} (esperado: <= {2 * ds._anc_passo + 1})")
+    print()
+
+def test_hash_index():
+    """Verifica busca/remoção O(1) pelo índice hash em todos os caminhos de inserção."""
+    print("=== Teste de Hash Index ===")
+
+    chaves = [f"{(i * 7919) % 3000:06d}" for i in range(3000)]
+    for kw in (dict(default_pos=-1), dict(default_pos=0), dict(default_pos=1), dict(sorted_insert=True)):
+        ds = ArrayLinkedList(hash_index=True, **kw)
+        for k in chaves:
+            ds.insert(k, {"Matricula": k})
+        for k in chaves[::2]:
+            ds.remove(k)
+        ds.clear_log()
+        encontrados = sum(1 for k in chaves[1::2] if ds.search(k) is not None)
+        removidos_de_novo = sum(1 for k in chaves[::2] if ds.remove(k))
+        s = ds.summary("sum")
+        print(f"  {kw}: encontrados={encontrados} (esperado: 1500), "
+              f"removidos de novo={removidos_de_novo} (esperado: 0), "
+              f"visitas/busca={s['search']['node_visits'] / 1500:.1f} (esperado: 1.0)")
+
+    ds = ArrayLinkedList(default_pos=0, hash_index=True)
+    ds.insert("000001", {"v": "antigo"})
+    ds.insert("000002", {})
+    ds.insert("000001", {"v": "novo"})
+    print(f"Duplicata mais próxima do head: {ds.search('000001')['v']} (esperado: novo)")
+    ds.remove("000001")
+    print(f"Após remover: {ds.search('000001')['v']} (esperado: antigo)")
+    s = ds.summary("sum")
+    print(f"Manutenção do índice (x_hash_updates): {s['insert'].get('x_hash_updates', 0)} nas inserções")
+
+    # inserção no meio sem vizinho de mesma chave: lista [x, a3, b, a1]
+    ds = ArrayLinkedList(default_pos=1, hash_index=True)
+    for k, v in (("x", {}), ("a", {"s": 1}), ("b", {}), ("a", {"s": 3})):
+        ds.insert(k, v)
+    print(f"default_pos=1, duplicata antes da antiga: {ds.search('a')} (esperado: {{'s': 3}})")
+    ds.remove("a")
+    print(f"Após remover: {ds.search('a')} (esperado: {{'s': 1}})")
+
+    # mesmas buscas e remoções com e sem índice, com muitas duplicatas
+    import random
+    rnd = random.Random(7)
+    ops = [(rnd.choice("irs"), f"{rnd.randrange(40):06d}", {"i": i}) for i in range(3000)]
+    for kw in (dict(default_pos=1), dict(default_pos=5), dict(default_pos=3, storage='array')):
+        resultados = []
+        for indice in (False, True):
+            ds = ArrayLinkedList(hash_index=indice, **kw)
+            saida = []
+            for op, k, v in ops:
+                if op == 'i':
+                    ds.insert(k, v)
+                elif op == 'r':
+                    saida.append(ds.remove(k))
+                else:
+                    saida.append(ds.search(k))
+            resultados.append(saida)
+        print(f"  {kw}: com e sem índice iguais: {resultados[0] == resultados[1]} (esperado: True)")
+    print()
+
+def test_bulk_load():
+    """Carga em lote deve produzir a mesma lista das inserções ordenadas."""
+    print("=== Teste de Bulk Load Ordenado ===")
+
+    existentes = [(f"{(i * 37) % 50:06d}", {"origem": "lista", "i": i}) for i in range(40)]
+    lote = [(f"{(i * 7919) % 60:06d}", {"origem": "lote", "i": i}) for i in range(200)]
+
+    seq = ArrayLinkedList(sorted_insert=True)
+    bulk = ArrayLinkedList(sorted_insert=True)
+    for k, v in existentes:
+        seq.insert(k, v)
+        bulk.insert(k, v)
+    for k, v in lote:
+        seq.insert(k, v)
+    bulk.clear_log()
+    bulk.bulk_load(lote)
+
+    print(f"Listas idênticas (inclusive duplicatas): {seq.to_list() == bulk.to_list()} (esperado: True)")
+    print(f"Tail correto: {bulk.tail.key == seq.tail.key} (esperado: True)")
+    s = bulk.summary("sum")["bulk_load"]
+    print(f"Comparações no bulk: {s['comparisons']:.0f} (esperado: << {seq.summary('sum')['insert']['comparisons']:.0f})")
+
+    ds = ArrayLinkedList(sorted_insert=True)
+    ds.carregar_dados(1000, sorted=True)
+    chaves = [k for k, _ in ds.to_list()]
+    print(f"carregar_dados(sorted=True) ordenado: {chaves == sorted(chaves)} (esperado: True)")
+    print()
+
+def test_auto_organizacao():
+    """Políticas de auto-organização reduzem a profundidade em buscas concentradas."""
+    print("=== Teste de Auto-organização ===")
+
+    chaves = [f"{i:06d}" for i in range(1000)]
+    quentes = chaves[-10:]
+    consultas = [quentes[i % 10] for i in range(500)]
+    for politica in (None, 'mtf', 'transpose', 'count'):
+        ds = ArrayLinkedList(auto_organizacao=politica)
+        for k in chaves:
+            ds.insert(k, {"Matricula": k})
+        ds.clear_log()
+        ok = all(ds.search(k)["Matricula"] == k for k in consultas)
+        s = ds.summary("mean")["search"]
+        mesmas = sorted(k for k, _ in ds.to_list()) == chaves
+        print(f"  {str(politica):<9}: buscas ok={ok} conteúdo preservado={mesmas} "
+              f"profundidade média={s['node_visits']:.1f} shifts/busca={s['shifts']:.2f}")
+
+    ds = ArrayLinkedList(auto_organizacao='mtf')
+    for k in ("000001", "000002", "000003"):
+        ds.insert(k, {})
+    ds.search("000003")
+    print(f"MTF: {[k for k, _ in ds.to_list()]} (esperado: ['000003', '000001', '000002'])")
+    print(f"Tail após MTF: {ds.tail.key} (esperado: 000002)")
+    try:
+        ArrayLinkedList(sorted_insert=True, auto_organizacao='mtf')
+        print("Lista ordenada aceita (esperado: ValueError)")
+    except ValueError:
+        print("Lista ordenada rejeitada (esperado: ValueError)")
+    print()
+
 if __name__ == "__main__":
     test_basic_functionality()
     test_metrics_counting()
     test_sorted_insertion()
     test_position_insertion()
+    test_storage_array()
+    test_skip_index()
+    test_hash_index()
+    test_bulk_load()
+    test_auto_organizacao()
     
     print("=== Teste com Dados Reais ===")
     # Teste rápido com dados reais
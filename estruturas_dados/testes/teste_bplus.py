@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar a árvore B+ em disco (BPlusTreeDiskDS).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+import tempfile
+from util_estrutura_bplus import BPlusTreeDiskDS
+
+def test_basic_functionality():
+    """Testa inserção, busca e remoção com splits forçados (páginas pequenas)."""
+    print("=== Teste de Funcionalidade Básica B+ ===")
+
+    ds = BPlusTreeDiskDS(page_size=256, pool_pages=4)
+    chaves = [f"{(i * 7919) % 1000:06d}" for i in range(1000)]
+    for k in chaves:
+        ds.insert(k, {"Matricula": k})
+
+    encontrados = sum(1 for k in chaves if ds.search(k) is not None)
+    ordenadas = [k for k, _ in ds.items()]
+    print(f"Encontrados: {encontrados} (esperado: 1000)")
+    print(f"Folhas em ordem: {ordenadas == sorted(chaves)} (esperado: True)")
+    print(f"Altura: {ds.height()} (esperado: > 2)")
+    print(f"Busca inexistente: {ds.search('999999') is not None} (esperado: False)")
+
+    removidos = sum(1 for k in chaves[:300] if ds.remove(k))
+    print(f"Removidos: {removidos} (esperado: 300)")
+    print(f"Busca removido: {ds.search(chaves[0]) is not None} (esperado: False)")
+    print(f"Itens: {ds.n_items} (esperado: 700)")
+    print(f"Evictions no pool: {ds.evictions} (esperado: > 0)")
+    ds.close()
+    print()
+
+def test_bulk_load():
+    """Compara bulk load com inserções sequenciais."""
+    print("=== Teste de Bulk Load ===")
+
+    pares = [(f"{i:06d}", {"Matricula": f"{i:06d}"}) for i in range(2000)]
+    ds = BPlusTreeDiskDS(page_size=512, pool_pages=8)
+    ds.bulk_load(pares)
+    print(f"Itens: {ds.n_items} (esperado: 2000)")
+    print(f"Ordem preservada: {[k for k, _ in ds.items()] == [k for k, _ in pares]} (esperado: True)")
+    print(f"Busca 001234: {ds.search('001234')} (esperado: {{'Matricula': '001234'}})")
+    ds.insert("999999", {"Matricula": "999999"})
+    print(f"Insert após bulk: {ds.search('999999') is not None} (esperado: True)")
+    print(f"Páginas (bulk): {ds.n_pages}")
+    ds.close()
+
+    # fill_factor=1.0 com um filho sobrando no nível interno: o último nó já está cheio
+    ds = BPlusTreeDiskDS(page_size=256)
+    n = (ds.cap_interna + 2) * ds.cap_folha
+    pares = [(f"{i:06d}", {"Matricula": f"{i:06d}"}) for i in range(n)]
+    ds.bulk_load(pares, fill_factor=1.0)
+    print(f"fill_factor=1.0: itens {ds.n_items} (esperado: {n}), "
+          f"ordem preservada: {[k for k, _ in ds.items()] == [k for k, _ in pares]} (esperado: True)")
+    print(f"Busca última chave: {ds.search(pares[-1][0]) is not None} (esperado: True)")
+    ds.close()
+
+    # durante a carga o pool não pode crescer além de pool_pages + páginas fixadas
+    # (folha corrente e página de heap corrente)
+    ds = BPlusTreeDiskDS(page_size=512, pool_pages=8)
+    residentes = []
+    ajustar = ds._ajustar_pool
+    def _ajustar_medindo():
+        ajustar()
+        residentes.append(len(ds._pool))
+    ds._ajustar_pool = _ajustar_medindo
+    ds.bulk_load((f"{i:06d}", {"Matricula": f"{i:06d}"}) for i in range(20000))
+    print(f"Pool no bulk load de 20000: máx. {max(residentes)} páginas residentes (esperado: <= 10)")
+    print(f"Itens: {ds.n_items} (esperado: 20000), busca 019999: {ds.search('019999') is not None} (esperado: True)")
+    ds.close()
+
+    try:
+        BPlusTreeDiskDS(page_size=65536)
+        print("page_size=65536 aceito (esperado: AssertionError)")
+    except AssertionError:
+        print("page_size=65536 recusado (esperado: AssertionError)")
+    print()
+
+def test_persistencia():
+    """Grava em arquivo, fecha e reabre a árvore."""
+    print("=== Teste de Persistência ===")
+
+    arquivo = os.path.join(tempfile.mkdtemp(), "teste.bpt")
+    ds = BPlusTreeDiskDS(arquivo=arquivo, page_size=512, pool_pages=4)
+    for i in range(500):
+        ds.insert(f"{i:06d}", {"Matricula": f"{i:06d}", "Idade": i % 50})
+    ds.close()
+
+    ds2 = BPlusTreeDiskDS(arquivo=arquivo, page_size=512, pool_pages=4)
+    print(f"Itens após reabrir: {ds2.n_items} (esperado: 500)")
+    print(f"Busca 000321: {ds2.search('000321')} (esperado: Idade 21)")
+    ds2.close()
+    os.remove(arquivo)
+    print()
+
+def test_metricas_io():
+    """Verifica as métricas de E/S por operação."""
+    print("=== Teste de Métricas de E/S ===")
+
+    ds = BPlusTreeDiskDS(pool_pages=8)
+    ds.carregar_dados(1000)
+    ds.buscar_dados(100)
+    summary = ds.summary("mean")
+    print(f"  - leituras de página por busca: {summary['search'].get('x_page_reads', 0):.2f}")
+    print(f"  - hit rate médio nas buscas: {summary['search'].get('x_buffer_hit_rate', 0):.3f}")
+    print(f"  - hit rate total: {ds.buffer_hit_rate():.3f}")
+    ds.close()
+    print()
+
+if __name__ == "__main__":
+    test_basic_functionality()
+    test_bulk_load()
+    test_persistencia()
+    test_metricas_io()
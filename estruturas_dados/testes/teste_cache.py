@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar as políticas de cache e o CacheDS.
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_estrutura import AVLTreeDS, HashTableDS
+from util_estrutura_cache import CacheDS, PoliticaARC, POLITICAS
+
+CHAVES = [f"{(i * 7919) % 100000:06d}" for i in range(2000)]
+
+def _acessos(qtd, seed=42):
+    """Acessos concentrados: 80% em 10% das chaves."""
+    rnd = random.Random(seed)
+    quentes = CHAVES[:200]
+    return [rnd.choice(quentes) if rnd.random() < 0.8 else rnd.choice(CHAVES) for _ in range(qtd)]
+
+def test_politicas():
+    """Testa capacidade, acertos e invariantes de cada política isolada."""
+    print("=== Teste políticas de substituição ===")
+
+    for nome, cls in POLITICAS.items():
+        pol = cls(256)
+        acertos = despejos = 0
+        maior = 0
+        for k in _acessos(20000):
+            achou, v = pol.buscar(k)
+            if achou:
+                acertos += 1
+                if v != k:
+                    print(f"{nome}: valor errado para {k}")
+            else:
+                despejos += pol.guardar(k, k)
+            maior = max(maior, len(pol))
+        print(f"{nome}: taxa de acerto {acertos / 20000:.1%} (esperado: > 60%) | "
+              f"máx. em cache {maior} (esperado: 256) | despejos {despejos}")
+        print(f"{nome}: invalidar presente {pol.invalidar(CHAVES[0]) or pol.invalidar(CHAVES[1])} (esperado: True)")
+        print(f"{nome}: invalidar ausente {pol.invalidar('999999')} (esperado: False)")
+
+    arc = PoliticaARC(64)
+    rnd = random.Random(7)
+    ok = True
+    for k in _acessos(5000, seed=3) + [rnd.choice(CHAVES) for _ in range(5000)]:
+        if not arc.buscar(k)[0]:
+            arc.guardar(k, k)
+        t1, t2, b1, b2 = len(arc._t1), len(arc._t2), len(arc._b1), len(arc._b2)
+        ok &= t1 + t2 <= 64 and t1 + b1 <= 64 and t1 + t2 + b1 + b2 <= 128 and 0 <= arc.p <= 64
+    print(f"ARC invariantes (|T1|+|T2|<=c, |T1|+|B1|<=c, total<=2c): {ok} (esperado: True)")
+    print()
+
+def test_cache_ds():
+    """Testa o wrapper contra a estrutura sem cache, incluindo invalidação."""
+    print("=== Teste CacheDS ===")
+
+    for nome in POLITICAS:
+        ds = CacheDS(HashTableDS(), capacidade=128, politica=nome)
+        ref = HashTableDS()     # mesma estrutura sem cache como referência
+        rnd = random.Random(11)
+        divergencias = 0
+        for i, k in enumerate(_acessos(6000)):
+            r = rnd.random()
+            if r < 0.1:
+                v = {"Matricula": k, "versao": i}
+                ds.insert(k, v)
+                ref.insert(k, v)
+            elif r < 0.15:
+                ds.remove(k)
+                ref.remove(k)
+            elif ds.search(k) is not ref.search(k):
+                divergencias += 1
+        print(f"{ds.name}: divergências {divergencias} (esperado: 0) | taxa de acerto {ds.taxa_acerto():.1%}")
+
+        buscas = [r for r in ds.log if r.op == "search"]
+        acertos = [r for r in buscas if r.extras.get("cache_hit")]
+        print(f"  comparações+probes nos acertos: {sum(r.comparisons + r.probes for r in acertos)} (esperado: 0)")
+        print(f"  despejos registrados: {sum(r.extras.get('cache_evictions', 0) for r in ds.log)} (esperado: {ds.despejos})")
+        print(f"  invalidações registradas > 0: {any(r.extras.get('cache_invalidations') for r in ds.log)} (esperado: True)")
+        print(f"  cache_bytes > 0: {buscas[-1].extras['cache_bytes'] > 0} (esperado: True)")
+
+    ds = CacheDS(AVLTreeDS(), capacidade=10)
+    for k in CHAVES[:100]:
+        ds.insert(k, {"Matricula": k})
+    ds.search(CHAVES[0])
+    c_miss = ds.log[-1].comparisons
+    ds.search(CHAVES[0])
+    print(f"AVL: comparações no miss {c_miss} (esperado: > 0), no acerto {ds.log[-1].comparisons} (esperado: 0)")
+    print(f"Delegação: n_items {CacheDS(ref).n_items == ref.n_items} (esperado: True)")
+    print()
+
+if __name__ == "__main__":
+    test_politicas()
+    test_cache_ds()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar o CACHE_DADOS e a leitura sob demanda (iter_dados).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_dados import get_dados, get_registros, iter_dados, CacheDados, CACHE_DADOS
+
+def test_iter_dados():
+    """A leitura em lotes devolve os mesmos registros do arquivo."""
+    print("=== Teste iter_dados ===")
+    dados = get_dados(1000, usar_cache=False)
+    lidos = list(iter_dados(1000, tamanho_lote=64))
+    print(f"Mesmos registros: {lidos == dados} (esperado: True)")
+    gen = iter_dados(1000, tamanho_lote=10)
+    print(f"Gerador preguiçoso: {next(gen) == dados[0]} (esperado: True)")
+    gen.close()
+    print()
+
+def test_cache_dados():
+    """Chamadas repetidas reaproveitam a lista; o limite de memória descarta a mais antiga."""
+    print("=== Teste CACHE_DADOS ===")
+    CACHE_DADOS.limpar()
+    a = get_dados(1000)
+    acertos = CACHE_DADOS.acertos
+    b = get_dados(1000)
+    print(f"Mesma lista na 2ª chamada: {a is b} (esperado: True)")
+    print(f"Acertos: {CACHE_DADOS.acertos - acertos} (esperado: 1)")
+    print(f"Sem cache relê o arquivo: {get_dados(1000, usar_cache=False) is a} (esperado: False)")
+    r = get_registros(1000)
+    print(f"Colunar compartilhado: {get_registros(1000) is r} (esperado: True)")
+    print(f"Bytes estimados > 0: {CACHE_DADOS.total_bytes > 0} (esperado: True)")
+
+    cache = CacheDados(limite_mb=1)
+    cache.guardar('a', [1], 600 * 1024)
+    cache.guardar('b', [2], 300 * 1024)
+    cache.obter('a')                      # 'a' passa a ser o mais recente
+    cache.guardar('c', [3], 300 * 1024)
+    print(f"Descartado o menos usado: {'b' not in cache and 'a' in cache} (esperado: True)")
+    cache.guardar('d', [4], 5 * 1024 ** 2)
+    print(f"Maior que o limite fica sozinho: {len(cache)} (esperado: 1)")
+    print(f"Descartes: {cache.descartes} (esperado: 3)")
+    print()
+
+if __name__ == "__main__":
+    test_iter_dados()
+    test_cache_dados()
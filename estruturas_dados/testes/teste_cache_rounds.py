@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar o cache de rounds endereçado por conteúdo (rodar_experimento.digest_round).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+import rodar_experimento as rx
+from rodar_experimento import digest_round, arquivo_metricas
+from util_dados import hash_dados
+from util_estrutura import HashTableDS
+from util_resultados import ResultadosDB
+
+class HashTableAlterada(HashTableDS):
+    """Mesma estrutura com um método a mais: o código mudou."""
+    def _n_buckets(self):
+        return self.M
+
+def test_digest():
+    """O digest muda com o código, os params, o N e os dados."""
+    print("=== Teste digest_round ===")
+    a = digest_round("Hash Table M=100 djb2", 1000)
+    print(f"Estável: {a == digest_round('Hash Table M=100 djb2', 1000)} (esperado: True)")
+    print(f"Params diferentes: {a != digest_round('Hash Table M=1000 djb2', 1000)} (esperado: True)")
+    print(f"N diferente: {a != digest_round('Hash Table M=100 djb2', 5000)} (esperado: True)")
+    print(f"Checkpoints diferem do modo padrão: {a != digest_round('Hash Table M=100 djb2', 1000, (1000, 5000))} (esperado: True)")
+    print(f"Digest no nome do arquivo: {a in arquivo_metricas(0, 'Hash Table M=100 djb2', 1000)} (esperado: True)")
+
+    rx.FACTORIES["teste original"] = lambda: HashTableDS(M=100, hash_fn='djb2')
+    rx.FACTORIES["teste alterada"] = lambda: HashTableAlterada(M=100, hash_fn='djb2')
+    try:
+        print(f"Código diferente: {digest_round('teste original', 1000) != digest_round('teste alterada', 1000)} (esperado: True)")
+    finally:
+        del rx.FACTORIES["teste original"], rx.FACTORIES["teste alterada"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        h1 = hash_dados(10, tmp)
+        print(f"hash_dados memorizado: {hash_dados(10, tmp) == h1} (esperado: True)")
+        with open(os.path.join(tmp, "dados_10.json"), "a") as f:
+            f.write("\n")
+        print(f"Arquivo de dados alterado: {hash_dados(10, tmp) != h1} (esperado: True)")
+    print()
+
+def test_reuso_parcial():
+    """Só os rounds que faltam rodam de novo; versões antigas da mesma configuração são removidas."""
+    print("=== Teste reuso parcial e GC ===")
+    originais = (rx.ESTRUTURAS, rx.TAMANHOS, rx.N_ROUNDS, rx.PASTA_ROUNDS, rx.PROCESSOS)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)      # ./graficos e ./dados do experimento ficam no diretório temporário
+        nome = "Hash Table M=100 djb2"
+        rx.ESTRUTURAS = [(nome, rx.FACTORIES[nome])]
+        rx.TAMANHOS, rx.N_ROUNDS, rx.PASTA_ROUNDS, rx.PROCESSOS = [1000], 3, os.path.join(tmp, 'rounds'), 0
+        os.makedirs(rx.PASTA_ROUNDS)
+        try:
+            lista, _ = rx.gerar_experimento_completo()
+            arquivos = [arquivo_metricas(r, nome, 1000) for r in range(3)]
+            print(f"Rounds gravados: {sum(os.path.exists(a) for a in arquivos)} (esperado: 3)")
+
+            mtimes = [os.stat(a).st_mtime_ns for a in arquivos]
+            os.remove(arquivos[1])
+            prefixo = os.path.join(rx.PASTA_ROUNDS, "metrics_Hash_Table_M=100_djb2_N1000_round0")
+            for velho in (prefixo + "_000000000000.json", prefixo + ".json"):
+                with open(velho, "w") as f:
+                    f.write("{}")
+            outra = os.path.join(rx.PASTA_ROUNDS, "metrics_AVL_Tree_balanceada_N1000_round0_000000000000.json")
+            with open(outra, "w") as f:
+                f.write("{}")
+
+            lista, _ = rx.gerar_experimento_completo()
+            print(f"Métricas: {len(lista)} (esperado: 3)")
+            print(f"Round que faltava refeito: {os.path.exists(arquivos[1])} (esperado: True)")
+            print(f"Rounds existentes intactos: {[os.stat(arquivos[r]).st_mtime_ns == mtimes[r] for r in (0, 2)]} (esperado: [True, True])")
+            print(f"Versões antigas removidas: {os.path.exists(prefixo + '_000000000000.json') or os.path.exists(prefixo + '.json')} (esperado: False)")
+            print(f"Outras estruturas intactas: {os.path.exists(outra)} (esperado: True)")
+        finally:
+            rx.ESTRUTURAS, rx.TAMANHOS, rx.N_ROUNDS, rx.PASTA_ROUNDS, rx.PROCESSOS = originais
+            os.chdir(cwd)
+    print()
+
+def test_limpar():
+    """-limpar apaga os rounds em disco e também as linhas deles no banco de resultados."""
+    print("=== Teste -limpar ===")
+    originais = (rx.ESTRUTURAS, rx.TAMANHOS, rx.N_ROUNDS, rx.PASTA_ROUNDS, rx.PROCESSOS, rx.RESULTADOS, list(sys.argv))
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        nome = "Hash Table M=100 djb2"
+        rx.ESTRUTURAS = [(nome, rx.FACTORIES[nome])]
+        rx.TAMANHOS, rx.N_ROUNDS, rx.PASTA_ROUNDS, rx.PROCESSOS = [1000], 2, os.path.join(tmp, 'rounds'), 0
+        os.makedirs(rx.PASTA_ROUNDS)
+        rx.RESULTADOS = ResultadosDB(os.path.join(tmp, 'r.sqlite3'))
+        contar = lambda: rx.RESULTADOS.con.execute("SELECT COUNT(*) FROM rounds").fetchone()[0]
+        try:
+            rx.gerar_experimento_completo()
+            print(f"Rounds no banco: {contar()} (esperado: 2)")
+            sys.argv.append('-limpar')
+            rx.gerar_experimento_completo()
+            print(f"Rounds no banco depois de -limpar: {contar()} (esperado: 2)")
+            arquivos = sorted(a for (a,) in rx.RESULTADOS.con.execute("SELECT arquivo FROM rounds"))
+            print(f"Arquivos no banco existem em disco: {all(os.path.exists(os.path.join(rx.PASTA_ROUNDS, a)) for a in arquivos)} (esperado: True)")
+        finally:
+            rx.RESULTADOS.fechar()
+            rx.ESTRUTURAS, rx.TAMANHOS, rx.N_ROUNDS, rx.PASTA_ROUNDS, rx.PROCESSOS, rx.RESULTADOS, sys.argv[:] = originais
+            os.chdir(cwd)
+    print()
+
+if __name__ == "__main__":
+    test_digest()
+    test_reuso_parcial()
+    test_limpar()
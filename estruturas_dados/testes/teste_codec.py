@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar os codecs de chave (CodecMatricula, CodecTextoFixo).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+import time
+from util_estrutura import AVLTreeDS, ArrayLinkedList, HashTableDS, CodecMatricula, CodecTextoFixo
+
+CHAVES = [f"{(i * 7919) % 100000:06d}" for i in range(3000)]
+
+def test_ordem_preservada():
+    """A ordem dos inteiros codificados é a mesma das strings."""
+    print("=== Teste de Ordem Preservada ===")
+
+    for codec in (CodecMatricula(), CodecTextoFixo(8)):
+        cod = [codec.codificar(k) for k in CHAVES]
+        ordem = sorted(range(len(CHAVES)), key=lambda i: cod[i]) == sorted(range(len(CHAVES)), key=lambda i: CHAVES[i])
+        volta = all(codec.decodificar(c) == k for c, k in zip(cod, CHAVES))
+        print(f"  {codec.nome}: ordem igual={ordem} (esperado: True) ida e volta={volta} (esperado: True)")
+    try:
+        CodecMatricula().codificar("12345")
+        print("Largura errada aceita (esperado: ValueError)")
+    except ValueError:
+        print("Largura errada rejeitada (esperado: ValueError)")
+    print()
+
+def test_mesmos_resultados():
+    """Com e sem codec as estruturas devolvem as mesmas chaves e contagens."""
+    print("=== Teste de Resultados com Codec ===")
+
+    for nome, factory in (("AVL", lambda **kw: AVLTreeDS(balanced=True, **kw)),
+                          ("LinkedList ordenada", lambda **kw: ArrayLinkedList(sorted_insert=True, **kw)),
+                          ("HashTable", lambda **kw: HashTableDS(M=1009, **kw))):
+        resultados = []
+        for codec in (None, CodecMatricula()):
+            ds = factory(codec=codec) if codec else factory()
+            for k in CHAVES:
+                ds.insert(k, {"Matricula": k})
+            achados = [ds.search(k) is not None for k in CHAVES[:500] + ["999999"]]
+            removidos = [ds.remove(k) for k in CHAVES[::4]]
+            s = ds.summary("sum")
+            resultados.append((achados, removidos, s["search"]["comparisons"]))
+        print(f"  {nome}: mesmos resultados={resultados[0][:2] == resultados[1][:2]} (esperado: True)")
+    ds = ArrayLinkedList(sorted_insert=True, codec=CodecMatricula())
+    ds.insert("000010", {})
+    ds.insert("000002", {})
+    print(f"Chaves devolvidas decodificadas: {[k for k, _ in ds.to_list()]} (esperado: ['000002', '000010'])")
+    print(f"Nome com codec: {ds.name}")
+    print()
+
+def test_desempenho():
+    """Tempo de processamento em carga com muitas comparações (lista ordenada)."""
+    print("=== Teste de Desempenho com Codec ===")
+
+    for codec in (None, CodecMatricula()):
+        ds = ArrayLinkedList(sorted_insert=True, codec=codec) if codec else ArrayLinkedList(sorted_insert=True)
+        t0 = time.process_time()
+        for k in CHAVES:
+            ds.insert(k, {})
+        dt = time.process_time() - t0
+        cmp = ds.summary("sum")["insert"]["comparisons"]
+        print(f"  codec={codec.nome if codec else None}: {dt:.2f}s para {cmp:.0f} comparações")
+
+    for codec in (None, CodecMatricula()):
+        ds = HashTableDS(M=1009, hash_fn="fnv1a", codec=codec) if codec else HashTableDS(M=1009, hash_fn="fnv1a")
+        for k in CHAVES:
+            ds.insert(k, {})
+        ds.clear_log()
+        t0 = time.process_time()
+        for _ in range(20):
+            for k in CHAVES:
+                ds._search_impl(ds._enc(k))
+        dt = time.process_time() - t0
+        print(f"  HashTable codec={codec.nome if codec else None}: {dt:.2f}s para {20 * len(CHAVES)} buscas (sem instrumentação)")
+    print()
+
+if __name__ == "__main__":
+    test_ordem_preservada()
+    test_mesmos_resultados()
+    test_desempenho()
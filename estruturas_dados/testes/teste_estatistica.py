@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar a estatística dos rounds (util_estatistica) e o modo -adaptativo.
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+import math
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+import rodar_experimento as rx
+from util_estatistica import t_critico_95, remover_outliers_mad, ic95, largura_relativa_ic95
+from util_estrutura import HashTableDS, BaseDataStructure
+
+def test_estatistica():
+    """MAD, t de Student e IC95 contra valores conhecidos."""
+    print("=== Teste util_estatistica ===")
+    print(f"t(0,975; 4 g.l.): {t_critico_95(4)} (esperado: 2.776)")
+    print(f"t(0,975; 120 g.l.): {t_critico_95(120):.3f} (esperado: 1.980)")
+    mantidos, rejeitados = remover_outliers_mad([10, 11, 10.5, 9.8, 10.2, 40])
+    print(f"Outliers MAD: {rejeitados} (esperado: [40]), mantidos: {len(mantidos)} (esperado: 5)")
+    print(f"MAD = 0 não rejeita: {remover_outliers_mad([5, 5, 5, 9])[1]} (esperado: [])")
+    baixo, alto = ic95([1, 2, 3, 4, 5])
+    print(f"IC95 de 1..5: ({baixo:.3f}, {alto:.3f}) (esperado: (1.037, 4.963))")
+    print(f"IC95 com 1 valor: {[math.isnan(x) for x in ic95([3])]} (esperado: [True, True])")
+    print(f"Largura relativa de 1..5: {largura_relativa_ic95([1, 2, 3, 4, 5]):.3f} (esperado: 1.309)")
+    print()
+
+def test_resumo_ic():
+    """rounds_summary_df traz o IC95 e descarta o round anômalo com rejeitar_outliers."""
+    print("=== Teste rounds_summary_df com IC95 ===")
+    exports = []
+    for _ in range(5):
+        ds = HashTableDS(M=100, hash_fn='djb2')
+        ds.carregar_dados(1000)
+        exports.append(ds.export_metrics_json())
+    # tempos sintéticos: rounds estáveis (±2%) e um contaminado (ex.: GC, outro processo)
+    for fator, m in zip((1.0, 1.02, 0.98, 1.01, 100.0), exports):
+        for rec in m['metrics']:
+            rec['wall_time_ms'] = 0.01 * fator
+    cols = ["mean_per_round", "ci95_low", "ci95_high", "ci95_rel_width", "outliers", "rounds"]
+    bruto = BaseDataStructure.rounds_summary_df(metrics_data=exports, metrics=['wall_time_ms']).iloc[0]
+    limpo = BaseDataStructure.rounds_summary_df(metrics_data=exports, metrics=['wall_time_ms'], rejeitar_outliers=True).iloc[0]
+    print(f"Colunas novas: {all(c in bruto for c in cols)} (esperado: True)")
+    print(f"Média dentro do IC: {bruto['ci95_low'] <= bruto['mean_per_round'] <= bruto['ci95_high']} (esperado: True)")
+    print(f"Sem rejeição: outliers {bruto['outliers']} (esperado: 0), rounds {bruto['rounds']} (esperado: 5)")
+    print(f"Com rejeição: outliers {limpo['outliers']} (esperado: 1), rounds {limpo['rounds']} (esperado: 4)")
+    print(f"IC mais estreito sem o outlier: {limpo['ci95_rel_width'] < bruto['ci95_rel_width']} (esperado: True)")
+    print()
+
+def test_adaptativo():
+    """Para ao atingir a precisão, respeita MAX_ROUNDS e reaproveita rounds em disco."""
+    print("=== Teste rodar_rounds_adaptativo ===")
+    originais = (rx.PASTA_ROUNDS, rx.ALVO_IC, rx.ORCAMENTO_S, rx.MAX_ROUNDS, rx.METRICA_ADAPTATIVA)
+    nome = "Hash Table M=100 djb2"
+    with tempfile.TemporaryDirectory() as tmp:
+        rx.PASTA_ROUNDS = tmp
+        try:
+            # comparações variam pouco entre rounds (só as buscas são sorteadas): IC folgado
+            rx.METRICA_ADAPTATIVA, rx.ALVO_IC = 'comparisons', 10.0
+            lista = []
+            rounds, largura, motivo = rx.rodar_rounds_adaptativo(nome, rx.FACTORIES[nome], 1000, lista)
+            print(f"Precisão folgada: {rounds >= rx.MIN_ROUNDS} (esperado: True), motivo: {motivo} (esperado: precisão atingida)")
+            print(f"Um arquivo por round: {len(os.listdir(tmp)) == rounds} (esperado: True)")
+
+            rx.METRICA_ADAPTATIVA, rx.ALVO_IC, rx.MAX_ROUNDS = 'wall_time_ms', 0.0, 5
+            lista = []
+            rounds, _, motivo = rx.rodar_rounds_adaptativo(nome, rx.FACTORIES[nome], 1000, lista)
+            print(f"Precisão inalcançável: {rounds} rounds (esperado: 5), motivo: {motivo} (esperado: limite de 5 rounds)")
+            print(f"Rounds reaproveitados + novos: {len(lista)} métricas, {len(os.listdir(tmp))} arquivos (esperado: 5, 5)")
+
+            rx.MAX_ROUNDS, rx.ORCAMENTO_S = 50, 0.0
+            rounds, _, motivo = rx.rodar_rounds_adaptativo(nome, rx.FACTORIES[nome], 5000, [])
+            print(f"Orçamento zerado: {rounds} round (esperado: 1), motivo: {motivo} (esperado: orçamento de 0 s esgotado)")
+        finally:
+            rx.PASTA_ROUNDS, rx.ALVO_IC, rx.ORCAMENTO_S, rx.MAX_ROUNDS, rx.METRICA_ADAPTATIVA = originais
+    print()
+
+if __name__ == "__main__":
+    test_estatistica()
+    test_resumo_ic()
+    test_adaptativo()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar os filtros de Bloom e o FiltroBloomDS.
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_estrutura import ArrayLinkedList, CodecMatricula
+from util_estrutura_filtros import BloomFilter, CountingBloomFilter, FiltroBloomDS
+
+PRESENTES = [f"{(i * 7919) % 100000:06d}" for i in range(2000)]
+AUSENTES = [f"{100000 + i:06d}" for i in range(2000)]
+
+def test_filtros():
+    """Testa ausência de falsos negativos, taxa de falsos positivos e remove com contagem."""
+    print("=== Teste BloomFilter / CountingBloomFilter ===")
+
+    for cls in (BloomFilter, CountingBloomFilter):
+        f = cls(len(PRESENTES), bits_por_chave=10)
+        for k in PRESENTES:
+            f.add(k)
+        falsos_neg = sum(1 for k in PRESENTES if k not in f)
+        fp = sum(1 for k in AUSENTES if k in f) / len(AUSENTES)
+        print(f"{cls.__name__}: falsos negativos {falsos_neg} (esperado: 0)")
+        print(f"{cls.__name__}: FP observado {fp:.3%} | teórico {f.taxa_falso_positivo():.3%} (esperado: ~1%)")
+
+    f = CountingBloomFilter(len(PRESENTES))
+    for k in PRESENTES:
+        f.add(k)
+    for k in PRESENTES[:1000]:
+        f.remove(k)
+    falsos_neg = sum(1 for k in PRESENTES[1000:] if k not in f)
+    removidas = sum(1 for k in PRESENTES[:1000] if k not in f)
+    print(f"Após remover 1000: falsos negativos {falsos_neg} (esperado: 0)")
+    print(f"Removidas descartadas pelo filtro: {removidas} (esperado: > 950)")
+    print()
+
+def test_front_end():
+    """Testa buscas/remoções de chaves ausentes curto-circuitadas pelo filtro."""
+    print("=== Teste FiltroBloomDS ===")
+
+    for codec in (None, CodecMatricula()):
+        ds = FiltroBloomDS(ArrayLinkedList(codec=codec), n_esperado=len(PRESENTES))
+        print(f"Estrutura: {ds.name}")
+        for k in PRESENTES:
+            ds.insert(k, {"Matricula": k})
+        encontrados = sum(1 for k in PRESENTES if ds.search(k) is not None)
+        print(f"Encontrados: {encontrados} (esperado: 2000)")
+        achados = sum(1 for k in AUSENTES if ds.search(k) is not None)
+        print(f"Ausentes encontrados: {achados} (esperado: 0)")
+        print(f"Negativos do filtro: {ds.negativos} (esperado: > 1900)")
+        print(f"FP observado: {ds.taxa_falso_positivo_observada():.3%} (esperado: ~1%)")
+        print(f"Tamanho interno: {ds.length} (esperado: 2000)")
+
+        buscas = [r for r in ds.log if r.op == "search"]
+        neg = [r for r in buscas if r.extras.get("bloom_negative")]
+        print(f"Comparações nos negativos: {sum(r.comparisons for r in neg)} (esperado: 0)")
+        print(f"Economia estimada > 0: {sum(r.extras.get('saved_comparisons', 0) for r in neg) > 0} (esperado: True)")
+        print(f"bits_per_key: {buscas[-1].extras['bits_per_key']:.1f} (esperado: ~10)")
+
+        removidos = sum(1 for k in PRESENTES[:1000] if ds.remove(k))
+        print(f"Removidos: {removidos} (esperado: 1000)")
+        print(f"Removidos ainda no filtro: {sum(1 for k in PRESENTES[:1000] if ds._enc(k) in ds.filtro)} (esperado: < 50)")
+        print(f"Remover ausente: {ds.remove(AUSENTES[0])} (esperado: False)")
+        print()
+
+    # economia medida exatamente pela busca na sombra
+    ds = FiltroBloomDS(ArrayLinkedList(), n_esperado=500, medir_economia=True)
+    for k in PRESENTES[:500]:
+        ds.insert(k, {"Matricula": k})
+    ds.search(AUSENTES[0])
+    rec = ds.log[-1]
+    if rec.extras.get("bloom_negative"):
+        print(f"Comparações poupadas (medidas): {rec.extras['saved_comparisons']:.0f} (esperado: 500)")
+        print(f"Comparações registradas: {rec.comparisons} (esperado: 0)")
+    print()
+
+if __name__ == "__main__":
+    test_filtros()
+    test_front_end()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar a geração vetorizada de dados (util_dados._gerar_vetorizado).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+import filecmp
+import tempfile
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+import util_dados
+
+def test_byte_a_byte():
+    """Versão vetorizada (em memória, em blocos e com processos) igual à versão em Python puro."""
+    print("=== Teste geração vetorizada ===")
+    if not util_dados._HAS_NUMPY:
+        print("numpy indisponível: gerar_dados_jsonl usa a versão em Python puro")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (0, 1, 1000, 10000, 130000):
+            ref = Path(tmp, f"py_{n}.json")
+            util_dados._gerar_python(ref, n)
+            variantes = {
+                "memória": dict(),
+                "blocos": dict(tamanho_chunk=4099),
+                "blocos+2 processos": dict(tamanho_chunk=4099, processos=2),
+            }
+            for nome, kw in variantes.items():
+                arq = Path(tmp, f"np_{n}.json")
+                util_dados._gerar_vetorizado(arq, n, **kw)
+                print(f"n={n} {nome}: idêntico {filecmp.cmp(ref, arq, shallow=False)} (esperado: True)")
+    print()
+
+if __name__ == "__main__":
+    test_byte_a_byte()
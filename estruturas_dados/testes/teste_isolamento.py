@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar o modo de isolamento dos rounds (util_isolamento e rodar_experimento -isolar).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+import gc
+import platform
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+import rodar_experimento as rx
+from util_isolamento import isolar, ambiente, fixar_cpu, MONITOR_GC
+from util_estrutura import HashTableDS, BaseDataStructure
+
+class HashTableComColeta(HashTableDS):
+    """Cada busca força uma coleta do gc: deve aparecer só nas buscas."""
+    def _search_impl(self, key):
+        gc.collect()
+        return super()._search_impl(key)
+
+def test_isolar():
+    """O gc fica congelado/desligado só dentro do bloco e tudo volta ao estado anterior."""
+    print("=== Teste isolar ===")
+    with isolar('congelar') as info:
+        congelados = gc.get_freeze_count()
+        print(f"Congelados dentro: {congelados > 0} (esperado: True), monitor ligado: {MONITOR_GC.ativo} (esperado: True)")
+    print(f"Depois: congelados {gc.get_freeze_count()} (esperado: 0), monitor ligado: {MONITOR_GC.ativo} (esperado: False)")
+    with isolar('desligar'):
+        print(f"gc ligado dentro de 'desligar': {gc.isenabled()} (esperado: False)")
+    print(f"gc ligado depois: {gc.isenabled()} (esperado: True)")
+    with isolar(None) as nada:
+        print(f"Sem isolamento: {nada}, monitor {MONITOR_GC.ativo} (esperado: None, False)")
+    try:
+        with isolar('parar'):
+            pass
+        print("Modo inválido aceito (esperado: ValueError)")
+    except ValueError:
+        print("Modo inválido: ValueError (esperado: ValueError)")
+
+    print(f"Ambiente: python {info['python'].endswith(platform.python_version())} (esperado: True), "
+          f"gc_modo {info['gc_modo']} (esperado: congelar)")
+    print(f"Campos: {sorted(ambiente())}")
+    print(f"  (esperado: afinidade, carga_1_5_15min, cpu_modelo, cpus, gc_limiares, gc_modo, governador, plataforma, python)")
+    print()
+
+def test_coletas_por_operacao():
+    """As coletas viram extras x_gc_coletas/x_gc_pausa_ms de cada operação, só no modo isolado."""
+    print("=== Teste coletas do gc por operação ===")
+    ds = HashTableComColeta(M=100, hash_fn='djb2')
+    with isolar('normal'):
+        ds.carregar_dados(1000)
+        ds.buscar_dados(50)
+    registros = ds.export_metrics_json()['metrics']
+    por_op = lambda op: [r['x_gc_coletas'] for r in registros if r['op'] == op]
+    print(f"Coletas nas buscas: {set(por_op('search'))} (esperado: {{1}})")
+    print(f"Pausa registrada: {all(r['x_gc_pausa_ms'] > 0 for r in registros if r['op'] == 'search')} (esperado: True)")
+    df = BaseDataStructure.rounds_summary_df(metrics_data=[ds.export_metrics_json()], metrics=['x_gc_coletas'], op_filter=('search',))
+    print(f"rounds_summary_df(x_gc_coletas): {df['mean_per_round'].tolist()} (esperado: [50.0])")
+
+    fora = HashTableComColeta(M=100, hash_fn='djb2')
+    fora.carregar_dados(1000)
+    fora.buscar_dados(5)
+    print(f"Fora do modo isolado sem extras de gc: {not any('x_gc_coletas' in r for r in fora.export_metrics_json()['metrics'])} (esperado: True)")
+    print()
+
+def test_fixar_cpu():
+    print("=== Teste fixar_cpu ===")
+    if not hasattr(os, 'sched_setaffinity'):
+        print("os.sched_setaffinity indisponível: nada a testar")
+        return
+    antes = os.sched_getaffinity(0)
+    try:
+        cpu = fixar_cpu()
+        print(f"Preso ao último núcleo permitido: {cpu == max(antes)} (esperado: True), "
+              f"afinidade: {os.sched_getaffinity(0) == {cpu}} (esperado: True)")
+    finally:
+        os.sched_setaffinity(0, antes)
+    print()
+
+def test_rounds_isolados():
+    """Rounds -isolar levam o ambiente, têm digest e arquivo próprios e não apagam os do modo padrão."""
+    print("=== Teste rounds -isolar ===")
+    originais = (rx.ISOLAR_GC, rx.PASTA_ROUNDS)
+    nome = "Hash Table M=100 djb2"
+    with tempfile.TemporaryDirectory() as tmp:
+        rx.PASTA_ROUNDS = tmp
+        try:
+            padrao = rx.arquivo_metricas(0, nome, 1000)
+            with open(padrao, "w") as f:
+                f.write("{}")
+            rx.ISOLAR_GC = 'congelar'
+            isolado = rx.arquivo_metricas(0, nome, 1000)
+            print(f"Arquivo próprio: {isolado.endswith('_iso.json')} (esperado: True), "
+                  f"digest diferente: {os.path.basename(isolado)[:-9] != os.path.basename(padrao)[:-5]} (esperado: True)")
+            metricas = rx.executar_round(rx.FACTORIES[nome], 1000)
+            print(f"Ambiente no round: {metricas['ambiente']['gc_modo']} (esperado: congelar)")
+            print(f"Coletas registradas: {all('x_gc_coletas' in r for r in metricas['metrics'])} (esperado: True)")
+            print(f"Checkpoints com ambiente: {[('ambiente' in m) for m in rx.executar_round_checkpoints(rx.FACTORIES[nome], (1000, 5000))]} (esperado: [True, True])")
+            rx.salvar_metricas(metricas, isolado)
+            print(f"GC dos rounds preserva o modo padrão: {rx.coletar_rounds_obsoletos()} (esperado: [])")
+        finally:
+            rx.ISOLAR_GC, rx.PASTA_ROUNDS = originais
+    print()
+
+if __name__ == "__main__":
+    test_isolar()
+    test_coletas_por_operacao()
+    test_fixar_cpu()
+    test_rounds_isolados()
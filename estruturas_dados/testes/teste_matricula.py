@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar RadixTrieDS e DirectAddressDS.
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_estrutura_matricula import RadixTrieDS, DirectAddressDS
+
+CHAVES = [f"{(i * 7919) % 100000:06d}" for i in range(2000)]
+
+def test_radix_trie():
+    """Testa inserção, busca, remoção e compressão de caminho da trie."""
+    print("=== Teste RadixTrieDS ===")
+
+    ds = RadixTrieDS()
+    for k in CHAVES:
+        ds.insert(k, {"Matricula": k})
+    nos_cheia = ds.n_nodes
+    encontrados = sum(1 for k in CHAVES if ds.search(k) is not None)
+    print(f"Encontrados: {encontrados} (esperado: 2000)")
+    print(f"Ordem: {[k for k, _ in ds.items()] == sorted(CHAVES)} (esperado: True)")
+    print(f"Busca inexistente: {ds.search('999999') is not None} (esperado: False)")
+    print(f"Nós: {nos_cheia} (esperado: < {2000 * 6} sem compressão)")
+
+    removidos = sum(1 for k in CHAVES[:1000] if ds.remove(k))
+    print(f"Removidos: {removidos} (esperado: 1000)")
+    print(f"Tamanho: {ds.length} (esperado: 1000)")
+    print(f"Ordem após remoções: {[k for k, _ in ds.items()] == sorted(CHAVES[1000:])} (esperado: True)")
+    print(f"Nós após remoções: {ds.n_nodes} (esperado: < {nos_cheia})")
+
+    try:
+        ds.insert("12A", {})
+        print("Chave inválida aceita (esperado: ValueError)")
+    except ValueError:
+        print("Chave inválida rejeitada (esperado: ValueError)")
+    print()
+
+def test_direct_address():
+    """Testa operações O(1) e consultas de sucessor."""
+    print("=== Teste DirectAddressDS ===")
+
+    ds = DirectAddressDS(universo=100000)
+    for k in CHAVES:
+        ds.insert(k, {"Matricula": k})
+    encontrados = sum(1 for k in CHAVES if ds.search(k) is not None)
+    print(f"Encontrados: {encontrados} (esperado: 2000)")
+    print(f"Ordem: {[k for k, _ in ds.items()] == sorted(CHAVES)} (esperado: True)")
+
+    ordenadas = sorted(CHAVES)
+    suc = ds.successor(ordenadas[10])
+    print(f"Sucessor de {ordenadas[10]}: {suc[0]} (esperado: {ordenadas[11]})")
+    print(f"Sucessor da maior: {ds.successor(ordenadas[-1])} (esperado: None)")
+
+    for k in ordenadas[11:20]:
+        ds.remove(k)
+    print(f"Sucessor após remover 11..19: {ds.successor(ordenadas[10])[0]} (esperado: {ordenadas[20]})")
+
+    ds.insert("250000", {"Matricula": "250000"})
+    print(f"Universo após crescer: {ds.universo} (esperado: >= 250001)")
+    print(f"Busca após crescer: {ds.search('250000') is not None} (esperado: True)")
+    summary = ds.summary("sum")
+    print(f"Palavras examinadas nos sucessores: {summary['successor'].get('probes', 0)}")
+    print()
+
+if __name__ == "__main__":
+    test_radix_trie()
+    test_direct_address()
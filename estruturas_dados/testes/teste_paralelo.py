@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar o agendador paralelo de rounds (rodar_experimento.rodar_jobs_paralelos).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+import json
+import tempfile
+from collections import Counter
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+import rodar_experimento as rx
+from rodar_experimento import Job, rodar_jobs_paralelos, custo_estimado
+
+def test_ordem_custos():
+    """Rounds quadráticos (listas encadeadas) de N grande vêm antes de todo o resto."""
+    print("=== Teste custo_estimado ===")
+    jobs = [Job(nome, n, 0) for nome, _ in rx.ESTRUTURAS for n in rx.TAMANHOS]
+    ordem = sorted(jobs, key=lambda j: j.custo(), reverse=True)
+    print(f"Primeiros: {[(j.nome_estrutura, j.n) for j in ordem[:2]]} "
+          f"(esperado: lista ordenada e não ordenada com N = {max(rx.TAMANHOS)})")
+    print(f"Hash M=100 mais cara que M=5000: "
+          f"{custo_estimado('Hash Table M=100 fnv1a', 10000) > custo_estimado('Hash Table M=5000 fnv1a', 10000)} (esperado: True)")
+    print()
+
+def test_jobs_paralelos():
+    """Os resultados chegam gravados nos arquivos de round e iguais aos de um round serial."""
+    print("=== Teste rodar_jobs_paralelos ===")
+    pasta_original = rx.PASTA_ROUNDS
+    with tempfile.TemporaryDirectory() as tmp:
+        rx.PASTA_ROUNDS = tmp
+        try:
+            jobs = [Job(nome, 1000, r) for nome in ("AVL Tree balanceada", "Hash Table M=100 djb2") for r in range(2)]
+            jobs.append(Job("AVL Tree balanceada", 5000, 0, (1000, 5000)))
+            metricas = rodar_jobs_paralelos(jobs, processos=2, fixar_cpu=hasattr(os, 'sched_setaffinity'))
+            print(f"Métricas devolvidas: {len(metricas)} (esperado: 6)")
+            print(f"Ordem dos jobs preservada: {[m['ds_name'] for m in metricas[:4]] == [metricas[0]['ds_name']] * 2 + [metricas[2]['ds_name']] * 2} (esperado: True)")
+            arquivos = sorted(os.listdir(tmp))
+            print(f"Arquivos gravados: {len(arquivos)} (esperado: 6), checkpoints: {sum(a.endswith('_ckpt.json') for a in arquivos)} (esperado: 2)")
+            with open(rx.arquivo_metricas(1, "AVL Tree balanceada", 1000)) as f:
+                disco = json.load(f)
+            serial = rx.executar_round(rx.FACTORIES["AVL Tree balanceada"], 1000)
+            # buscas e remoções sorteiam chaves: compara as inserções e a contagem por operação
+            assinatura = lambda m: ([(r['key'], r['comparisons']) for r in m['metrics'] if r['op'] == 'insert'],
+                                    sorted(Counter(r['op'] for r in m['metrics']).items()))
+            print(f"Mesmas operações que o round serial: {assinatura(disco) == assinatura(serial)} (esperado: True)")
+
+            lento = rodar_jobs_paralelos([Job("Array LinkedList Ordenado", 50000, 0)], processos=1, timeout=0.5)
+            print(f"Job com tempo esgotado: {lento} (esperado: [])")
+            print(f"Nada gravado para ele: {len(os.listdir(tmp))} (esperado: 6)")
+        finally:
+            rx.PASTA_ROUNDS = pasta_original
+    print()
+
+if __name__ == "__main__":
+    test_ordem_custos()
+    test_jobs_paralelos()
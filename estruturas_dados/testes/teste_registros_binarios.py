@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar o formato binário mapeado em memória (RegistrosBinarios).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+import pickle
+import random
+import tempfile
+from multiprocessing import Pool
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_dados import get_dados, get_binario, gerar_dados_binario, RegistrosBinarios
+from util_estrutura_skiplist import SkipListDS
+
+def _linhas(args):
+    registros, rows = args
+    return [registros[r] for r in rows]
+
+def test_formato():
+    """Cada linha lida do binário é igual ao registro de get_dados."""
+    print("=== Teste RegistrosBinarios ===")
+
+    dados = get_dados(1000)
+    registros = get_binario(1000)
+    print(f"Linhas: {len(registros)} (esperado: 1000)")
+    print(f"Registros idênticos: {all(registros[i] == dados[i] for i in range(1000))} (esperado: True)")
+    print(f"Mesma instância compartilhada: {get_binario(1000) is registros} (esperado: True)")
+    print(f"Registro por row: {registros.registros.itemsize} bytes (esperado: 32)")
+
+    alvo = dados[321]["Matricula"]
+    print(f"Índice por matrícula: {registros.row_da_matricula(alvo)} (esperado: 321)")
+    print(f"Matrícula ausente: {registros.row_da_matricula('999999')} (esperado: None)")
+    amostra = registros.amostra(10, random.Random(1))
+    print(f"Amostra: {len(amostra)} registros, todos válidos {all(a in dados for a in amostra)} (esperado: 10, True)")
+
+    copia = pickle.loads(pickle.dumps(registros))
+    print(f"Pickle reabre o arquivo: {copia.arquivo == registros.arquivo and copia[5] == dados[5]} (esperado: True)")
+    with Pool(2) as pool:
+        partes = pool.map(_linhas, [(registros, range(0, 500)), (registros, range(500, 1000))])
+    print(f"Leitura em 2 processos: {partes[0] + partes[1] == dados} (esperado: True)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        arq = os.path.join(tmp, "vazio.bin")
+        gerar_dados_binario(arq, [])
+        print(f"Arquivo vazio: {len(RegistrosBinarios(arq))} (esperado: 0)")
+    print()
+
+def test_estrutura_binaria():
+    """carregar_dados(binario=True) guarda row ids e materializa pelo mapeamento."""
+    print("=== Teste carregar_dados(binario=True) ===")
+    ds = SkipListDS()
+    ds.carregar_dados(1000, binario=True)
+    registros = get_binario(1000)
+    chave = registros.matricula(10)
+    print(f"Valor armazenado: {ds.search(chave)} (esperado: 10)")
+    print(f"Materializado: {ds.search(chave, materializar=True) == registros[10]} (esperado: True)")
+    ds.buscar_dados(100)
+    ds.remover_dados(100)
+    print(f"Buscas e remoções pelo lote binário: {all(r.success for r in ds.log)} (esperado: True)")
+    print()
+
+if __name__ == "__main__":
+    test_formato()
+    test_estrutura_binaria()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar o armazenamento colunar (RegistrosColunares)
+e a carga de estruturas com row ids.
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+import gc
+import tracemalloc
+from util_dados import get_dados, get_registros
+from util_estrutura import AVLTreeDS, HashTableDS
+
+def test_materializacao():
+    """Cada linha materializada é igual ao registro de get_dados."""
+    print("=== Teste de Materialização ===")
+
+    dados = get_dados(1000)
+    registros = get_registros(1000)
+    print(f"Linhas: {len(registros)} (esperado: 1000)")
+    print(f"Registros idênticos: {all(registros[i] == d for i, d in enumerate(dados))} (esperado: True)")
+    print(f"Mesma instância compartilhada: {get_registros(1000) is registros} (esperado: True)")
+    print(f"Nomes internados: {len(registros.nomes)} (esperado: <= 1000)")
+    print()
+
+def test_estrutura_colunar():
+    """Estruturas guardam row ids e materializam o registro sob demanda."""
+    print("=== Teste de Estrutura Colunar ===")
+
+    registros = get_registros(1000)
+    ds = AVLTreeDS(balanced=True)
+    ds.carregar_dados(1000, colunar=True)
+    matricula = registros.matricula(10)
+    print(f"Valor armazenado: {ds.search(matricula)} (esperado: 10)")
+    print(f"Materializado: {ds.search(matricula, materializar=True) == registros[10]} (esperado: True)")
+    ds.buscar_dados(100)
+    ds.remover_dados(100)
+    s = ds.summary("sum")
+    print(f"Buscas e remoções pelo lote colunar: {s['search']['comparisons'] > 0 and s['remove']['comparisons'] > 0} (esperado: True)")
+    print()
+
+def test_memoria():
+    """Memória retida por estrutura: dicionários vs row ids."""
+    print("=== Teste de Memória por Estrutura ===")
+
+    get_registros(10000)     # colunas compartilhadas ficam fora da medição
+    memoria = {}
+    for colunar in (False, True):
+        gc.collect()
+        antes, _ = tracemalloc.get_traced_memory()
+        ds = HashTableDS(M=1009)
+        ds.carregar_dados(10000, colunar=colunar)
+        ds.descarregar_dados()
+        ds.clear_log()
+        gc.collect()
+        depois, _ = tracemalloc.get_traced_memory()
+        memoria[colunar] = (depois - antes) / 1024.0
+        print(f"  colunar={colunar}: {memoria[colunar]:.0f} KB retidos")
+        del ds
+    print(f"Redução: {memoria[False] / max(memoria[True], 1):.1f}x (esperado: > 3x)")
+    print()
+
+if __name__ == "__main__":
+    test_materializacao()
+    test_estrutura_colunar()
+    test_memoria()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar o banco de resultados em SQLite (util_resultados.ResultadosDB).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+import sqlite3
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_resultados import ResultadosDB
+from util_estrutura import AVLTreeDS, HashTableDS, BaseDataStructure
+
+def _rounds():
+    exports = []
+    for factory in (lambda: HashTableDS(M=100, hash_fn='djb2'), lambda: AVLTreeDS(balanced=True)):
+        for n in (1000, 5000):
+            for _ in range(2):
+                ds = factory()
+                ds.clear_log()
+                ds.carregar_dados(n)
+                ds.buscar_dados(n // 4)
+                ds.remover_dados(n // 10)
+                exports.append(ds.export_metrics_json())
+    return exports
+
+def _colunas(df):
+    return df[["ds_name", "instances", "metric", "mean_per_round", "rounds", "std_per_round"]].values.tolist()
+
+def test_resumo_igual():
+    """rounds_summary_df(db=...) dá o mesmo DataFrame que a partir da lista de exports."""
+    print("=== Teste rounds_summary_df(db=...) ===")
+    exports = _rounds()
+    with tempfile.TemporaryDirectory() as tmp:
+        with ResultadosDB(os.path.join(tmp, "r.sqlite3")) as db:
+            db.iniciar_run('estruturas_dados', {'teste': True})
+            novos = sum(db.adicionar_export(m, arquivo=f"round{i}.json") for i, m in enumerate(exports))
+            print(f"Rounds gravados: {novos} (esperado: {len(exports)})")
+            print(f"Regravar não duplica: {sum(db.adicionar_export(m) for m in exports)} (esperado: 0)")
+            for agg in ("sum", "mean"):
+                for ops in (("insert",), ("insert", "search", "remove")):
+                    json_df = BaseDataStructure.rounds_summary_df(metrics_data=exports, agg=agg, op_filter=ops)
+                    db_df = BaseDataStructure.rounds_summary_df(db=db, agg=agg, op_filter=ops)
+                    print(f"{agg} {ops}: iguais {_colunas(json_df) == _colunas(db_df)} (esperado: True)")
+
+            df = BaseDataStructure.rounds_summary_df(db=db, metrics=['rotations'], ignorar_metrics_out=True)
+            print(f"metrics_out respeitado: {sorted(df['ds_name'].unique())} (esperado: só a AVL)")
+            hashes = [d for d in db.ds_names() if d.startswith('HashTable')]
+            df = BaseDataStructure.rounds_summary_df(db=db, metrics=['load_factor'], ds_names=hashes)
+            print(f"load_factor: {df['mean_per_round'].tolist()} (esperado: [10.0, 50.0])")
+
+            print(f"Removidos pelo arquivo: {db.remover_arquivos(['round0.json', 'round1.json'])} (esperado: 2)")
+            df = BaseDataStructure.rounds_summary_df(db=os.path.join(tmp, "r.sqlite3"), metrics=['comparisons'])
+            grupos = sorted(zip(df['ds_name'], df['instances'], df['rounds']))
+            print(f"Hash com N=1000 saiu do banco: {grupos} (esperado: 3 grupos, todos com 2 rounds)")
+    print()
+
+def test_lotes():
+    """As escritas só chegam ao arquivo em lotes (uma transação por lote)."""
+    print("=== Teste escrita em lotes ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        arq = os.path.join(tmp, "r.sqlite3")
+        db = ResultadosDB(arq, tamanho_lote=3)
+        contar = lambda: sqlite3.connect(arq).execute("SELECT COUNT(*) FROM rounds").fetchone()[0]
+        for i in range(5):
+            db.adicionar_round(f"r{i}", "BFS", {"grafo": "g"}, 0, {("encontrar_caminho", "tempo_execucao"): [1, i, i, i]},
+                               experimento='grafos', modo='g_A_B', info={'caminho': 'A->B'})
+        print(f"Depois de 5 rounds com lote de 3: {contar()} no arquivo (esperado: 3)")
+        db.descarregar()
+        print(f"Depois de descarregar: {contar()} (esperado: 5)")
+
+        db.iniciar_run('grafos')
+        db.adicionar_round("r5", "BFS", {"grafo": "g"}, 0, {("encontrar_caminho", "tempo_execucao"): [1, 9, 9, 9]},
+                           experimento='grafos', modo='g_A_B', info={'caminho': 'A->C'})
+        ultimos = db.execucoes('grafos', 'g_A_B', 'encontrar_caminho', ultimo_run=True)
+        print(f"Último run: {[(e['tempo_execucao'], e['info']['caminho']) for e in ultimos]} (esperado: [(9.0, 'A->C')])")
+        print(f"Todas as execuções: {len(db.execucoes('grafos', 'g_A_B'))} (esperado: 6)")
+        db.fechar()
+    print()
+
+if __name__ == "__main__":
+    test_resumo_igual()
+    test_lotes()
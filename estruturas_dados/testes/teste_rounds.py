@@ -87,8 +87,35 @@ def teste_rounds_summary():
         return False
 
 
+def teste_checkpoints():
+    """Testa a curva de crescimento medida em uma única carga (carregar_com_checkpoints)."""
+    print("\n🧪 TESTE DE CHECKPOINTS")
+    print("=" * 50)
+
+    avl = AVLTreeDS()
+    metricas = avl.carregar_com_checkpoints([1000, 5000])
+    ok = True
+    for m in metricas:
+        ops = {}
+        for r in m["metrics"]:
+            ops[r["op"]] = ops.get(r["op"], 0) + 1
+        n = m["checkpoint"]
+        print(f"  - N={n}: {ops} (esperado: insert={n}, search={n // 4}, remove={n // 10})")
+        ok &= ops == {"insert": n, "search": n // 4, "remove": n // 10}
+        ok &= len({r["round_id"] for r in m["metrics"]}) == 1
+    print(f"  - Estrutura final com 5000 chaves: {len(list(avl._inorder(avl.root)))} (esperado: 5000)")
+    ok &= len(list(avl._inorder(avl.root))) == 5000
+
+    df = BaseDataStructure.rounds_summary_df(metrics_data=metricas, metrics=['comparisons'], op_filter=('search',))
+    print(f"  - N no rounds_summary_df: {df['instances'].tolist()} (esperado: [1000, 5000])")
+    ok &= df['instances'].tolist() == [1000, 5000]
+    print("✅ Checkpoints OK" if ok else "❌ Checkpoints com divergências")
+    return ok
+
+
 if __name__ == '__main__':
     success2 = teste_rounds_summary()
+    success2 = teste_checkpoints() and success2
     
     if  success2:
         print("\n🎉 TODOS OS TESTES PASSARAM!")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar a skip list (SkipListDS).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_estrutura import AVLTreeDS
+from util_estrutura_skiplist import SkipListDS
+
+def test_basic_functionality():
+    """Testa inserção, busca, remoção e reaproveitamento de slots."""
+    print("=== Teste de Funcionalidade Básica SkipList ===")
+
+    ds = SkipListDS(p=0.5, max_level=16)
+    chaves = [f"{(i * 7919) % 1000:06d}" for i in range(1000)]
+    for k in chaves:
+        ds.insert(k, {"Matricula": k})
+
+    encontrados = sum(1 for k in chaves if ds.search(k) is not None)
+    print(f"Encontrados: {encontrados} (esperado: 1000)")
+    print(f"Ordem: {[k for k, _ in ds.items()] == sorted(chaves)} (esperado: True)")
+    print(f"Busca inexistente: {ds.search('999999') is not None} (esperado: False)")
+
+    removidos = sum(1 for k in chaves[:400] if ds.remove(k))
+    print(f"Removidos: {removidos} (esperado: 400)")
+    print(f"Tamanho: {ds.length} (esperado: 600)")
+    for k in chaves[:400]:
+        ds.insert(k, {"Matricula": k})
+    print(f"Slots alocados após reinserir: {len(ds._keys) - 1} (esperado: 1000)")
+    print()
+
+def test_range_scan():
+    """Testa o range scan e o registro da operação 'range'."""
+    print("=== Teste de Range Scan ===")
+
+    ds = SkipListDS()
+    for i in range(0, 200, 2):
+        ds.insert(f"{i:06d}", {"i": i})
+    faixa = ds.range_scan("000011", "000021")
+    print(f"Chaves: {[k for k, _ in faixa]} (esperado: 000012..000020 pares)")
+    summary = ds.summary("sum")
+    print(f"Visitas no range: {summary['range'].get('node_visits', 0)}")
+    print()
+
+def test_comparacao_avl():
+    """Compara rotações/comparações com a AVL balanceada."""
+    print("=== Comparação com AVL ===")
+
+    for ds in (AVLTreeDS(balanced=True), SkipListDS()):
+        ds.carregar_dados(1000)
+        ds.buscar_dados(250)
+        s = ds.summary("mean")
+        print(f"  {ds.name}: insert.comparisons={s['insert'].get('comparisons', 0):.1f} "
+              f"insert.rotations={s['insert'].get('rotations', 0):.2f} "
+              f"search.node_visits={s['search'].get('node_visits', 0):.1f}")
+    print()
+
+if __name__ == "__main__":
+    test_basic_functionality()
+    test_range_scan()
+    test_comparacao_avl()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar o array ordenado (SortedArrayDS) e seus layouts.
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_estrutura_array import SortedArrayDS
+
+CHAVES = [f"{(i * 7919) % 5000:06d}" for i in range(5000)]
+
+def test_basic_functionality():
+    """Testa inserção, busca, upsert e remoção nos três layouts."""
+    print("=== Teste de Funcionalidade Básica SortedArray ===")
+
+    for layout in ('plain', 'gap', 'tiered'):
+        ds = SortedArrayDS(layout=layout)
+        for k in CHAVES:
+            ds.insert(k, {"Matricula": k})
+        ds.insert(CHAVES[0], {"Matricula": CHAVES[0], "novo": True})
+        encontrados = sum(1 for k in CHAVES if ds.search(k) is not None)
+        removidos = sum(1 for k in CHAVES[:2500] if ds.remove(k))
+        ordem = [k for k, _ in ds.items()] == sorted(CHAVES[2500:])
+        print(f"  {layout:<6}: encontrados={encontrados} (esperado: 5000) removidos={removidos} (esperado: 2500) "
+              f"tamanho={ds.length} (esperado: 2500) ordem={ordem} (esperado: True)")
+        print(f"          remoção repetida: {ds.remove(CHAVES[0])} (esperado: False), "
+              f"busca inexistente: {ds.search('999999') is not None} (esperado: False)")
+    print()
+
+def test_comparisons():
+    """Busca binária: comparações por busca ~ log2(n)."""
+    print("=== Teste de Comparações ===")
+
+    ds = SortedArrayDS()
+    for k in CHAVES:
+        ds.insert(k, {})
+    ds.clear_log()
+    for k in CHAVES[:1000]:
+        ds.search(k)
+    media = ds.summary("mean")["search"]["comparisons"]
+    print(f"Comparações médias por busca: {media:.2f} (esperado: <= 13, log2(5000) ~ 12.3)")
+    print()
+
+def test_shifts_por_layout():
+    """Inserções aleatórias: gap e tiered movem menos elementos que o array simples."""
+    print("=== Teste de Shifts por Layout ===")
+
+    shifts = {}
+    for layout in ('plain', 'gap', 'tiered'):
+        ds = SortedArrayDS(layout=layout)
+        for k in CHAVES:
+            ds.insert(k, {})
+        shifts[layout] = ds.summary("sum")["insert"]["shifts"]
+        print(f"  {layout:<6}: shifts nas inserções = {shifts[layout]:.0f}")
+    print(f"Tiered move menos que plain: {shifts['tiered'] < shifts['plain'] / 10} (esperado: True)")
+
+    ds = SortedArrayDS(layout='gap')
+    for i in range(2000):
+        ds.insert(f"{i:06d}", {})
+    ds.clear_log()
+    for i in range(2000):
+        ds.insert(f"{i:06d}a", {})     # inserções consecutivas: o gap acompanha
+    print(f"Gap com edições locais: {ds.summary('sum')['insert']['shifts']:.0f} shifts (esperado: ~4000 = 2000 no 1º deslocamento + 1 por inserção)")
+    print()
+
+if __name__ == "__main__":
+    test_basic_functionality()
+    test_comparisons()
+    test_shifts_por_layout()
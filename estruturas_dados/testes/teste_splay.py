@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar a splay tree (SplayTreeDS).
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_estrutura_splay import SplayTreeDS
+
+def test_basic_functionality():
+    """Testa inserção, busca (com splay) e remoção."""
+    print("=== Teste de Funcionalidade Básica Splay ===")
+
+    ds = SplayTreeDS()
+    chaves = [f"{(i * 7919) % 1000:06d}" for i in range(1000)]
+    for k in chaves:
+        ds.insert(k, {"Matricula": k})
+
+    encontrados = sum(1 for k in chaves if ds.search(k) is not None)
+    print(f"Encontrados: {encontrados} (esperado: 1000)")
+    print(f"Raiz após buscar {chaves[-1]}: {ds.root.key} (esperado: {chaves[-1]})")
+    print(f"Ordem: {[k for k, _ in ds.inorder_items()] == sorted(chaves)} (esperado: True)")
+    print(f"Busca inexistente: {ds.search('999999') is not None} (esperado: False)")
+
+    removidos = sum(1 for k in chaves[:500] if ds.remove(k))
+    print(f"Removidos: {removidos} (esperado: 500)")
+    print(f"Remoção repetida: {ds.remove(chaves[0])} (esperado: False)")
+    print(f"Tamanho: {ds.length} (esperado: 500)")
+    print(f"Ordem após remoções: {[k for k, _ in ds.inorder_items()] == sorted(chaves[500:])} (esperado: True)")
+    print()
+
+def test_sequencial():
+    """Inserções em ordem crescente não devem estourar a pilha (splay iterativo)."""
+    print("=== Teste de Inserção Sequencial ===")
+
+    ds = SplayTreeDS()
+    for i in range(20000):
+        ds.insert(f"{i:06d}", {"i": i})
+    print(f"Altura após inserção crescente: {ds.height()} (esperado: 20000 - caminho degenerado)")
+    ds.search("000000")
+    print(f"Altura após buscar a menor chave: {ds.height()} (esperado: ~10000)")
+    print()
+
+def test_hot_keys():
+    """Buscas repetidas na mesma chave ficam baratas (chave na raiz)."""
+    print("=== Teste de Chaves Quentes ===")
+
+    ds = SplayTreeDS()
+    ds.carregar_dados(1000)
+    ds.clear_log()
+    ds.buscar_dados(250, distribuicao='zipf', zipf_s=1.2)
+    s = ds.summary("mean")
+    print(f"  - comparações por busca (zipf): {s['search'].get('comparisons', 0):.2f}")
+    print(f"  - rotações por busca (zipf): {s['search'].get('rotations', 0):.2f}")
+    print()
+
+if __name__ == "__main__":
+    test_basic_functionality()
+    test_sequencial()
+    test_hot_keys()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Teste específico para validar o gerador de workloads (util_workload) e executar_workload.
+"""
+# Adiciona o diretório atual ao path
+import sys, os
+from collections import Counter
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.extend(['../','./'])
+
+from util_workload import GeradorWorkload, workload_ycsb, chaves_do_dataset, WORKLOADS_YCSB
+from util_estrutura import AVLTreeDS
+from util_estrutura_skiplist import SkipListDS
+from util_estrutura_cache import CacheDS
+from util_estrutura_filtros import FiltroBloomDS
+
+CHAVES = [f"{i:06d}" for i in range(10000)]
+
+def test_gerador():
+    """Determinismo, proporções, buscas negativas e concentração das distribuições."""
+    print("=== Teste GeradorWorkload ===")
+
+    a = GeradorWorkload(CHAVES, {'read': 0.7, 'insert': 0.1, 'update': 0.1, 'delete': 0.05, 'scan': 0.05}, seed=7)
+    b = GeradorWorkload(CHAVES, {'read': 0.7, 'insert': 0.1, 'update': 0.1, 'delete': 0.05, 'scan': 0.05}, seed=7)
+    ops = a.gerar(20000)
+    print(f"Mesma semente, mesmo fluxo: {ops == b.gerar(20000)} (esperado: True)")
+    print(f"Semente diferente muda o fluxo: {ops != GeradorWorkload(CHAVES, seed=8).gerar(20000)} (esperado: True)")
+    freq = Counter(o.op for o in ops)
+    print(f"Proporção de reads: {freq['read'] / len(ops):.2f} (esperado: ~0.70)")
+    print(f"Proporção de inserts: {freq['insert'] / len(ops):.2f} (esperado: ~0.10)")
+
+    vivas, ok = set(CHAVES), True
+    for o in ops:
+        if o.op == 'insert':
+            ok &= o.key not in vivas
+            vivas.add(o.key)
+        elif o.op == 'delete':
+            ok &= o.key in vivas
+            vivas.discard(o.key)
+        elif o.op in ('read', 'update'):
+            ok &= (o.key in vivas) == o.existe
+    print(f"Chaves coerentes com inserts/deletes: {ok} (esperado: True)")
+
+    neg = GeradorWorkload(CHAVES, negativas=0.3, seed=1).gerar(10000)
+    print(f"Buscas negativas: {sum(not o.existe for o in neg) / len(neg):.2f} (esperado: ~0.30)")
+
+    for dist in ('uniforme', 'zipfian', 'latest'):
+        g = GeradorWorkload(CHAVES, distribuicao=dist, seed=3)
+        freq = Counter(o.key for o in g.gerar(20000))
+        top = sum(c for _, c in freq.most_common(100)) / 20000
+        print(f"{dist}: 1% das chaves recebe {top:.0%} das buscas (esperado: {'< 5%' if dist == 'uniforme' else '> 30%'})")
+    quentes = set(CHAVES[:2000])
+    hot = GeradorWorkload(CHAVES, distribuicao='hotspot', seed=3).gerar(20000)
+    print(f"hotspot: 20% das chaves recebe {sum(o.key in quentes for o in hot) / 20000:.0%} das buscas (esperado: ~80%)")
+    recentes = GeradorWorkload(CHAVES, distribuicao='latest', seed=3).gerar(5000)
+    print(f"latest favorece as últimas: {sum(o.key >= '009000' for o in recentes) / 5000:.0%} (esperado: > 50%)")
+
+    f = GeradorWorkload(CHAVES, **{**WORKLOADS_YCSB['F'], 'seed': 6}).gerar(10000)
+    pares = [(a, b) for a, b in zip(f, f[1:]) if b.op == 'update']
+    print(f"F: todo update vem depois do read da mesma chave: {all(a.op == 'read' and a.key == b.key for a, b in pares)} (esperado: True)")
+    print(f"F: proporção de updates: {len(pares) / len(f):.2f} (esperado: ~0.33)")
+    for theta in (0.0, 1.0):
+        try:
+            GeradorWorkload(CHAVES, zipf_theta=theta)
+            print(f"zipf_theta={theta} aceito (esperado: ValueError)")
+        except ValueError:
+            print(f"zipf_theta={theta}: ValueError (esperado: ValueError)")
+    print()
+
+def test_replay():
+    """As operações reexecutadas acham exatamente as chaves que existiam ao gerar o fluxo."""
+    print("=== Teste executar_workload ===")
+
+    g = workload_ycsb('A', 1000, negativas=0.1, seed=5)
+    for ds in (SkipListDS(), AVLTreeDS()):
+        ds.carregar_dados(1000)
+        ds.clear_log()
+        ops = g.gerar(3000) + GeradorWorkload(chaves_do_dataset(1000), {'scan': 0.5, 'delete': 0.5}, seed=2).gerar(200)
+        contagem = ds.executar_workload(ops)
+        print(f"{ds.name}: {contagem}")
+        registradas = [o for o in ops if o.op != 'scan' or hasattr(ds, 'range_scan')]
+        coerentes = all(r.success == o.existe for o, r in zip(registradas, ds.log) if o.op in ('read', 'update'))
+        print(f"  reads/updates coerentes: {coerentes} (esperado: True)")
+        print(f"  operações registradas: {len(ds.log)} (esperado: {len(registradas)})")
+        print(f"  updates no summary: {ds.summary('sum').get('update', {}).get('wall_time_ms', 0) > 0} (esperado: True)")
+    print()
+
+def test_replay_envoltorio():
+    """Scans em envoltórios ficam no log do envoltório; sem range_scan na base, viram ignoradas."""
+    print("=== Teste executar_workload em envoltórios ===")
+
+    ops = GeradorWorkload(chaves_do_dataset(1000), {'scan': 0.5, 'read': 0.5}, seed=4).gerar(100)
+    qtd_scans = sum(o.op == 'scan' for o in ops)
+    ds = CacheDS(FiltroBloomDS(SkipListDS()), capacidade=50)
+    ds.carregar_dados(1000)
+    ds.clear_log()
+    contagem = ds.executar_workload(ops)
+    print(f"{ds.name}: {contagem}")
+    ranges = [r for r in ds.log if r.op == 'range']
+    print(f"  scans no log do envoltório: {len(ranges)} (esperado: {qtd_scans})")
+    print(f"  scans no log da interna: {sum(r.op == 'range' for r in ds.estrutura.estrutura.log)} (esperado: 0)")
+    print(f"  nós visitados registrados: {all(r.node_visits > 0 for r in ranges)} (esperado: True)")
+    print(f"  scans no export: {sum(m['op'] == 'range' for m in ds.export_metrics_json()['metrics'])} (esperado: {qtd_scans})")
+
+    sem_scan = CacheDS(AVLTreeDS(), capacidade=50)
+    sem_scan.carregar_dados(1000)
+    print(f"Sem range_scan na base: hasattr {hasattr(sem_scan, 'range_scan')} (esperado: False), "
+          f"ignoradas {sem_scan.executar_workload(ops).get('ignoradas')} (esperado: {qtd_scans})")
+    print()
+
+if __name__ == "__main__":
+    test_gerador()
+    test_replay()
+    test_replay_envoltorio()
@@ -1,65 +1,97 @@
 # arquivo: util_dados.py
+import hashlib
 import json
-from typing import List
+import mmap
+import random
+import struct
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from collections import OrderedDict
+from collections.abc import Sequence
+from array import array
 from pathlib import Path
+from itertools import islice
+import multiprocessing
 import os
+import sys
+import tempfile
 
-def gerar_dados_jsonl(arquivo: str, n: int) -> None:
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except Exception:
+    _HAS_NUMPY = False
+
+PRIMEIROS_NOMES: List[str] = [
+    "Ana","Bruno","Carla","Diego","Eduarda","Felipe","Gabriela","Henrique","Isabela","João",
+    "Karen","Lucas","Mariana","Nicolas","Olívia","Paulo","Queila","Rafael","Sofia","Tiago",
+    "Úrsula","Vitor","Wagner","Xênia","Yasmin","Zeca","Bianca","Caio","Daniela","Elaine",
+    "Fábio","Gustavo","Heloísa","Ian","Júlia","Leandro","Marta","Natália","Otávio","Patrícia",
+    "Renato","Sérgio","Talita","Ubirajara","Valentina","William","Yuri","Zuleica","Alice","Bernardo"
+]
+NOMES_MEIO: List[str] = [
+    "Almeida","Barros","Cardoso","Dantas","Esteves","Ferraz","Gonçalves","Heitor","Ibrahim","Junqueira",
+    "Klein","Lourenço","Machado","Nogueira","Oliveira","Pereira","Queiroz","Ramos","Silva","Teixeira",
+    "Uchoa","Vasconcelos","Werneck","Xavier","Yamada","Zanetti","Andrade","Bittencourt","Castro","Dias",
+    "Farias","Garcia","Henriques","Iglesias","Jacob","Leal","Martins","Novaes","Ortega","Prado",
+    "Quintana","Rocha","Souza","Tavares","Ulhoa","Vieira","Watanabe","Ximenes","Youssef","Zucolotto"
+]
+SOBRENOMES: List[str] = [
+    "Silva","Santos","Oliveira","Souza","Rodrigues","Ferreira","Almeida","Costa","Gomes","Ribeiro",
+    "Carvalho","Lima","Barbosa","Rocha","Dias","Nunes","Moreira","Teixeira","Correia","Cardoso",
+    "Pinto","Araújo","Cruz","Melo","Castro","Fernandes","Vieira","Andrade","Sales","Cavalcanti",
+    "Meireles","Peixoto","Moura","Macedo","Figueiredo","Mendes","Batista","Ramos","Pires","Prado",
+    "Freitas","Matos","Machado","Assis","Camargo","Mesquita","Queiroz","Xavier","Amaral","Rezende"
+]
+
+CODIGOS_SETOR: List[int] = [101, 102, 103, 104, 105, 201, 202, 203, 301, 302, 401, 402]
+
+# Parâmetros determinísticos para salário (centavos para evitar ruído de float)
+SAL_MIN = 1500_00
+SAL_MAX = 25000_00
+SAL_RANGE = SAL_MAX - SAL_MIN
+MUL = 37_123
+INC = 9_871
+MOD = 100_003
+
+
+def gerar_dados_jsonl(arquivo: str, n: int, tamanho_chunk: int = 1_000_000, processos: int = 1) -> None:
     """
     Gera um arquivo JSONL com n registros reproduzíveis.
-    Cada linha é um JSON com: Matricula (9 dígitos), Nome, Salario, CodigoSetor, Idade.
+    Cada linha é um JSON com: Matricula (6 dígitos), Nome, Salario, CodigoSetor, Idade.
 
     Regras de reprodutibilidade (determinísticas):
-    - Matrícula: zero-padded a 9 dígitos a partir do índice (000000000, 000000001, ...).
+    - Matrícula: zero-padded a 6 dígitos a partir do índice (000000, 000001, ...).
     - Nome: combinação determinística de listas fixas (primeiro, meio e sobrenome).
     - Salário: valor em [1500.00, 25000.00] via congruência linear sobre o índice.
     - Código do Setor: escolhe de lista fixa, ciclando deterministicamente.
     - Idade: inteiro em [18, 65] por aritmética modular sobre o índice.
 
     * Ao final da geração, os dados são ordenados pelo código do setor + nome para que a matrícula não seja sequencial.
-    """
-    primeiros_nomes: List[str] = [
-        "Ana","Bruno","Carla","Diego","Eduarda","Felipe","Gabriela","Henrique","Isabela","João",
-        "Karen","Lucas","Mariana","Nicolas","Olívia","Paulo","Queila","Rafael","Sofia","Tiago",
-        "Úrsula","Vitor","Wagner","Xênia","Yasmin","Zeca","Bianca","Caio","Daniela","Elaine",
-        "Fábio","Gustavo","Heloísa","Ian","Júlia","Leandro","Marta","Natália","Otávio","Patrícia",
-        "Renato","Sérgio","Talita","Ubirajara","Valentina","William","Yuri","Zuleica","Alice","Bernardo"
-    ]
-    nomes_meio: List[str] = [
-        "Almeida","Barros","Cardoso","Dantas","Esteves","Ferraz","Gonçalves","Heitor","Ibrahim","Junqueira",
-        "Klein","Lourenço","Machado","Nogueira","Oliveira","Pereira","Queiroz","Ramos","Silva","Teixeira",
-        "Uchoa","Vasconcelos","Werneck","Xavier","Yamada","Zanetti","Andrade","Bittencourt","Castro","Dias",
-        "Farias","Garcia","Henriques","Iglesias","Jacob","Leal","Martins","Novaes","Ortega","Prado",
-        "Quintana","Rocha","Souza","Tavares","Ulhoa","Vieira","Watanabe","Ximenes","Youssef","Zucolotto"
-    ]
-    sobrenomes: List[str] = [
-        "Silva","Santos","Oliveira","Souza","Rodrigues","Ferreira","Almeida","Costa","Gomes","Ribeiro",
-        "Carvalho","Lima","Barbosa","Rocha","Dias","Nunes","Moreira","Teixeira","Correia","Cardoso",
-        "Pinto","Araújo","Cruz","Melo","Castro","Fernandes","Vieira","Andrade","Sales","Cavalcanti",
-        "Meireles","Peixoto","Moura","Macedo","Figueiredo","Mendes","Batista","Ramos","Pires","Prado",
-        "Freitas","Matos","Machado","Assis","Camargo","Mesquita","Queiroz","Xavier","Amaral","Rezende"
-    ]
-
-    codigos_setor: List[int] = [101, 102, 103, 104, 105, 201, 202, 203, 301, 302, 401, 402]
-
-    # Parâmetros determinísticos para salário (centavos para evitar ruído de float)
-    SAL_MIN = 1500_00
-    SAL_MAX = 25000_00
-    SAL_RANGE = SAL_MAX - SAL_MIN
-    MUL = 37_123
-    INC = 9_871
-    MOD = 100_003
 
+    Com numpy instalado a geração é vetorizada e em blocos de tamanho_chunk
+    (ver _gerar_vetorizado), com saída idêntica byte a byte à versão em Python puro;
+    processos > 1 formata as linhas em paralelo.
+    """
     path = Path(arquivo)
     path.parent.mkdir(parents=True, exist_ok=True)
+    if _HAS_NUMPY:
+        _gerar_vetorizado(path, n, tamanho_chunk, processos)
+    else:
+        _gerar_python(path, n)
+    print(f'Número de registros gerados:', n)
+    print(f'Registros gravados no arquivo:', arquivo)
+    print(f'Máximo de registros com nomes diferentes:', len(PRIMEIROS_NOMES)*len(NOMES_MEIO)*len(SOBRENOMES))
+
 
+def _gerar_python(path: Path, n: int) -> None:
+    """ Geração de referência: monta todos os registros, ordena em memória e grava. """
     dados = []
     for i in range(n):
         matricula = f"{i:06d}"
 
-        p = primeiros_nomes[i % len(primeiros_nomes)]
-        m = nomes_meio[(i // len(primeiros_nomes)) % len(nomes_meio)]
-        s = sobrenomes[(i // (len(primeiros_nomes) * len(nomes_meio))) % len(sobrenomes)]
+        p = PRIMEIROS_NOMES[i % len(PRIMEIROS_NOMES)]
+        m = NOMES_MEIO[(i // len(PRIMEIROS_NOMES)) % len(NOMES_MEIO)]
+        s = SOBRENOMES[(i // (len(PRIMEIROS_NOMES) * len(NOMES_MEIO))) % len(SOBRENOMES)]
         nome = f"{p} {m} {s}"
 
         # Sequência congruente linear para espalhar salários de forma estável
@@ -67,23 +99,113 @@ def gerar_dados_jsonl(arquivo: str, n: int) -> None:
         sal_centavos = SAL_MIN + (seq % (SAL_RANGE + 1))
         salario = round(sal_centavos / 100.0, 2)
 
-        codigo_setor = codigos_setor[i % len(codigos_setor)]
+        codigo_setor = CODIGOS_SETOR[i % len(CODIGOS_SETOR)]
         idade = 18 + ((i * 7 + 11) % (65 - 18 + 1))
 
         registro = { "Matricula": matricula,      "Nome": nome,  "Salario": salario,
                      "CodigoSetor": codigo_setor, "Idade": idade, }
         dados.append(registro)
 
-    print(f'Número de registros gerados:', len(dados))
     # Gravando o arquivo final
     with path.open("w", encoding="utf-8") as f:
         for registro in sorted(dados, key=lambda x: (x["CodigoSetor"], x["Nome"])):
             f.write(json.dumps(registro, ensure_ascii=False) + "\n")
-    print(f'Registros gravados no arquivo:', arquivo)
-    print(f'Máximo de registros com nomes diferentes:', len(primeiros_nomes)*len(nomes_meio)*len(sobrenomes))
 
 
-def get_dados(qtd = 1000, path = './dados'):
+# -----------------------------
+# Geração vetorizada (numpy)
+# -----------------------------
+# Todos os campos são funções do índice i, então a ordenação trabalha só com
+# uma chave int64 por registro: (posto do setor, posto do nome) * n + i.
+# O "+ i" torna a chave única e reproduz a estabilidade do sorted original.
+# Os nomes "P M S" comparam como a tupla (P, M, S) porque o espaço é menor
+# que qualquer caractere dos nomes.
+_NP, _NM, _NS = len(PRIMEIROS_NOMES), len(NOMES_MEIO), len(SOBRENOMES)
+_NOMES_CICLO = _NP * _NM * _NS
+
+def _posto(lista: List[Any]) -> List[int]:
+    """ posto[j] = posição de lista[j] entre os valores distintos ordenados (iguais têm o mesmo posto) """
+    distintos = {v: r for r, v in enumerate(sorted(set(lista)))}
+    return [distintos[v] for v in lista]
+
+def _chaves_ordenacao(ini: int, fim: int, n: int):
+    i = np.arange(ini, fim, dtype=np.int64)
+    c = i % _NOMES_CICLO
+    p, m, s = c % _NP, (c // _NP) % _NM, c // (_NP * _NM)
+    rp, rm, rs = (np.asarray(_posto(l), dtype=np.int64) for l in (PRIMEIROS_NOMES, NOMES_MEIO, SOBRENOMES))
+    rsetor = np.asarray(_posto(CODIGOS_SETOR), dtype=np.int64)[i % len(CODIGOS_SETOR)]
+    rnome = (rp[p] * _NM + rm[m]) * _NS + rs[s]
+    return (rsetor * _NOMES_CICLO + rnome) * n + i
+
+def _intercalar(runs: List[Any], bloco: int):
+    """
+    K-way merge vetorizado de runs ordenados com valores únicos: a cada passo
+    emite tudo que é <= ao menor último elemento carregado entre os runs que
+    ainda têm dados fora do buffer.
+    """
+    pos = [0] * len(runs)
+    while True:
+        bufs, limite = [], None
+        for r, run in enumerate(runs):
+            buf = run[pos[r]:pos[r] + bloco]
+            bufs.append(buf)
+            if len(buf) and pos[r] + len(buf) < len(run):
+                limite = buf[-1] if limite is None else min(limite, buf[-1])
+        if not any(len(b) for b in bufs):
+            return
+        saida = []
+        for r, buf in enumerate(bufs):
+            k = len(buf) if limite is None else int(np.searchsorted(buf, limite, side='right'))
+            saida.append(np.asarray(buf[:k]))
+            pos[r] += k
+        yield np.sort(np.concatenate(saida))
+
+def _formatar_bloco(ids) -> str:
+    """ Linhas JSONL dos índices ids, iguais às de json.dumps(registro, ensure_ascii=False). """
+    i = np.asarray(ids, dtype=np.int64)
+    c = i % _NOMES_CICLO
+    p, m, s = (c % _NP).tolist(), ((c // _NP) % _NM).tolist(), (c // (_NP * _NM)).tolist()
+    sal = ((SAL_MIN + ((MUL * (i + 1) + INC) % MOD) % (SAL_RANGE + 1)) / 100.0).tolist()
+    setor = np.asarray(CODIGOS_SETOR)[i % len(CODIGOS_SETOR)].tolist()
+    idade = (18 + ((i * 7 + 11) % (65 - 18 + 1))).tolist()
+    pn, mn, sn = PRIMEIROS_NOMES, NOMES_MEIO, SOBRENOMES
+    return "".join(
+        f'{{"Matricula": "{ii:06d}", "Nome": "{pn[a]} {mn[b]} {sn[d]}", "Salario": {sa!r}, '
+        f'"CodigoSetor": {se}, "Idade": {ida}}}\n'
+        for ii, a, b, d, sa, se, ida in zip(i.tolist(), p, m, s, sal, setor, idade))
+
+def _gerar_vetorizado(path: Path, n: int, tamanho_chunk: int = 1_000_000, processos: int = 1) -> None:
+    """
+    Ordenação externa: cada bloco de tamanho_chunk índices vira um run ordenado
+    de chaves (em disco quando há mais de um bloco); os runs são intercalados
+    em fatias e as linhas são formatadas e gravadas incrementalmente.
+    """
+    tamanho_chunk = max(1, int(tamanho_chunk))
+    bloco = max(1, min(tamanho_chunk, 100_000))
+    with tempfile.TemporaryDirectory(prefix='dados_runs_') as tmp:
+        runs = []
+        for ini in range(0, n, tamanho_chunk):
+            run = np.sort(_chaves_ordenacao(ini, min(n, ini + tamanho_chunk), n))
+            if n > tamanho_chunk:
+                arq = os.path.join(tmp, f'run_{len(runs)}.npy')
+                np.save(arq, run)
+                run = np.load(arq, mmap_mode='r')
+            runs.append(run)
+        fatias = (chaves % max(1, n) for chaves in _intercalar(runs, bloco))
+        pool = multiprocessing.Pool(processos) if processos > 1 else None
+        try:
+            linhas = pool.imap(_formatar_bloco, fatias) if pool else map(_formatar_bloco, fatias)
+            with path.open("w", encoding="utf-8") as f:
+                for texto in linhas:
+                    f.write(texto)
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+
+def _arquivo_dados(qtd, path):
+    """ Caminho do arquivo com qtd registros; gera o arquivo se ainda não existir. """
     if not os.path.isdir(path):
         os.makedirs(path)
     arquivo = f'dados_{qtd}.json'
@@ -91,13 +213,353 @@ def get_dados(qtd = 1000, path = './dados'):
     if not os.path.isfile(arquivo):
         print(f'Gerando arquivo com {qtd} dados ...')
         gerar_dados_jsonl(arquivo, qtd)
-    dados = open(arquivo, 'r', encoding='utf-8').readlines()
-    dados = [json.loads(d) for d in dados]
+    return arquivo
+
+def iter_dados(qtd = 1000, path = './dados', tamanho_lote = 10_000) -> Iterator[Dict[str, Any]]:
+    """ Lê os registros sob demanda, decodificando tamanho_lote linhas por vez.
+        Nunca mantém o arquivo inteiro em memória (útil para arquivos muito grandes).
+    """
+    arquivo = _arquivo_dados(qtd, path)
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        while True:
+            linhas = list(islice(f, tamanho_lote))
+            if not linhas:
+                break
+            yield from (json.loads(linha) for linha in linhas)
+
+
+class CacheDados:
+    """
+    Cache do processo para conjuntos de dados já lidos, por (tipo, qtd, caminho).
+
+    Mantém os conjuntos em ordem de uso (LRU) e descarta os mais antigos quando a
+    memória estimada passa de limite_mb; o conjunto recém-guardado nunca é
+    descartado, mesmo se sozinho passar do limite.
+    Os dados devolvidos são compartilhados: trate-os como somente leitura.
+    """
+
+    def __init__(self, limite_mb: float = 1024) -> None:
+        self.limite_bytes = int(limite_mb * 1024 ** 2)
+        self._itens: OrderedDict = OrderedDict()    # chave -> (dados, bytes)
+        self.total_bytes = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+
+    def __contains__(self, chave) -> bool:
+        return chave in self._itens
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def obter(self, chave):
+        item = self._itens.get(chave)
+        if item is None:
+            self.faltas += 1
+            return None
+        self._itens.move_to_end(chave)
+        self.acertos += 1
+        return item[0]
+
+    def guardar(self, chave, dados, nbytes: int) -> None:
+        if chave in self._itens:
+            self.total_bytes -= self._itens.pop(chave)[1]
+        self._itens[chave] = (dados, nbytes)
+        self.total_bytes += nbytes
+        while self.total_bytes > self.limite_bytes and len(self._itens) > 1:
+            _, (_, b) = self._itens.popitem(last=False)
+            self.total_bytes -= b
+            self.descartes += 1
+
+    def limpar(self) -> None:
+        self._itens.clear()
+        self.total_bytes = 0
+
+
+CACHE_DADOS = CacheDados()
+
+def _bytes_registros(dados: List[Dict[str, Any]], amostra: int = 200) -> int:
+    """ Estimativa da memória da lista de dicionários (média de uma amostra de linhas). """
+    if not dados:
+        return sys.getsizeof(dados)
+    linhas = dados[:amostra]
+    media = sum(sys.getsizeof(d) + sum(sys.getsizeof(v) for v in d.values()) for d in linhas) / len(linhas)
+    return sys.getsizeof(dados) + int(media * len(dados))
+
+def get_dados(qtd = 1000, path = './dados', usar_cache = True):
+    """ Lista de registros do arquivo dados_<qtd>.json (gerado se preciso).
+        Com usar_cache=True a lista fica no CACHE_DADOS e as próximas chamadas
+        com os mesmos (qtd, path) não releem o arquivo.
+    """
+    chave = ('dados', qtd, os.path.abspath(path))
+    dados = CACHE_DADOS.obter(chave) if usar_cache else None
+    if dados is not None:
+        return dados
+    dados = list(iter_dados(qtd, path))
     print(f'Arquivo com {qtd} dados carregados _o/')
     print(f'Exemplo: {dados[0]}')
     print('='*60)
+    if usar_cache:
+        CACHE_DADOS.guardar(chave, dados, _bytes_registros(dados))
     return dados
 
+_HASHES_DADOS: Dict[Tuple[str, int, int], str] = {}
+
+def hash_dados(qtd = 1000, path = './dados') -> str:
+    """ SHA-256 do conteúdo de dados_<qtd>.json (gerado se preciso).
+        Memorizado por (arquivo, tamanho, mtime): só relê o arquivo se ele mudar.
+    """
+    arquivo = os.path.abspath(_arquivo_dados(qtd, path))
+    st = os.stat(arquivo)
+    chave = (arquivo, st.st_size, st.st_mtime_ns)
+    if chave not in _HASHES_DADOS:
+        h = hashlib.sha256()
+        with open(arquivo, 'rb') as f:
+            for bloco in iter(lambda: f.read(1 << 20), b''):
+                h.update(bloco)
+        _HASHES_DADOS[chave] = h.hexdigest()
+    return _HASHES_DADOS[chave]
+
+class RegistrosColunares(Sequence):
+    """
+    Armazena os funcionários em colunas de largura fixa, para que as estruturas
+    guardem apenas o número da linha (row id) como valor.
+
+    - matriculas: array('q') com a matrícula como inteiro (largura original preservada)
+    - salarios: array('d'); setores: array('l'); idades: array('l')
+    - nomes: tabela de nomes internados + array('l') com o id do nome de cada linha
+
+    registros[i] materializa o dicionário da linha i (mesmo formato de get_dados),
+    por isso a instância pode ser usada no lugar da lista de get_dados.
+    """
+
+    def __init__(self, dados: Iterable[Dict[str, Any]] = ()):
+        self.largura = 0
+        self.matriculas = array('q')
+        self.salarios = array('d')
+        self.setores = array('l')
+        self.idades = array('l')
+        self.nome_ids = array('l')
+        self.nomes: List[str] = []
+        self._nome_id: Dict[str, int] = {}
+        for registro in dados:
+            self.append(registro)
+
+    def append(self, registro: Dict[str, Any]) -> int:
+        """Acrescenta um registro e devolve o seu row id."""
+        matricula = str(registro["Matricula"])
+        self.largura = max(self.largura, len(matricula))
+        nome = registro["Nome"]
+        nid = self._nome_id.get(nome)
+        if nid is None:
+            nid = self._nome_id[nome] = len(self.nomes)
+            self.nomes.append(sys.intern(nome))
+        self.matriculas.append(int(matricula))
+        self.salarios.append(float(registro["Salario"]))
+        self.setores.append(int(registro["CodigoSetor"]))
+        self.idades.append(int(registro["Idade"]))
+        self.nome_ids.append(nid)
+        return len(self.matriculas) - 1
+
+    def __len__(self) -> int:
+        return len(self.matriculas)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self.linha(i) for i in range(*row.indices(len(self)))]
+        return self.linha(row)
+
+    def matricula(self, row: int) -> str:
+        return f"{self.matriculas[row]:0{self.largura}d}"
+
+    def linha(self, row: int) -> Dict[str, Any]:
+        """Materializa o registro da linha row como dicionário."""
+        return {"Matricula": self.matricula(row), "Nome": self.nomes[self.nome_ids[row]],
+                "Salario": self.salarios[row], "CodigoSetor": self.setores[row],
+                "Idade": self.idades[row]}
+
+    def pares(self) -> Iterable[Tuple[str, int]]:
+        """Pares (matrícula, row id) para carregar as estruturas."""
+        return ((self.matricula(i), i) for i in range(len(self)))
+
+    def memoria_bytes(self) -> int:
+        """Bytes ocupados pelas colunas e pela tabela de nomes."""
+        colunas = (self.matriculas, self.salarios, self.setores, self.idades, self.nome_ids)
+        total = sum(sys.getsizeof(c) for c in colunas)
+        total += sys.getsizeof(self.nomes) + sum(sys.getsizeof(n) for n in self.nomes)
+        return total + sys.getsizeof(self._nome_id)
+
+
+# -----------------------------
+# Formato binário de largura fixa (mmap)
+# -----------------------------
+# Layout do arquivo dados_<qtd>.bin (little-endian, seções alinhadas em 8 bytes):
+#   cabeçalho  : _CAB_BIN (magic, versão, largura da matrícula, n e offsets)
+#   registros  : n x DTYPE_REGISTRO (32 bytes por linha)
+#   índice     : n x int64 com as matrículas ordenadas + n x uint32 com o row id de cada uma
+#   heap       : nomes em UTF-8 sem repetição; cada registro aponta (offset, tamanho)
+_MAGIC_BIN = b'EDB1'
+_CAB_BIN = struct.Struct('<4sHHQQQQQQ')
+
+if _HAS_NUMPY:
+    DTYPE_REGISTRO = np.dtype({
+        'names':   ['matricula', 'salario', 'setor', 'idade', 'nome_off', 'nome_len'],
+        'formats': ['<i8', '<f8', '<i4', '<i4', '<u4', '<u2'],
+        'offsets': [0, 8, 16, 20, 24, 28],
+        'itemsize': 32,
+    })
+
+def _alinhar(f) -> int:
+    pos = f.tell()
+    if pos % 8:
+        f.write(b'\0' * (8 - pos % 8))
+    return f.tell()
+
+def gerar_dados_binario(arquivo: str, dados: Iterable[Dict[str, Any]], tamanho_lote: int = 100_000) -> None:
+    """
+    Converte registros (ex.: iter_dados) para o formato binário de largura fixa,
+    gravando os registros em lotes; só o heap de nomes distintos fica em memória.
+    """
+    if not _HAS_NUMPY:
+        raise RuntimeError("O formato binário requer numpy instalado.")
+    heap = bytearray()
+    nomes: Dict[str, Tuple[int, int]] = {}
+    largura = n = 0
+    tmp = f'{arquivo}.tmp'
+    with open(tmp, 'w+b') as f:
+        f.write(b'\0' * _CAB_BIN.size)
+        off_reg = _alinhar(f)
+        lote = iter(dados)
+        while True:
+            bloco = list(islice(lote, tamanho_lote))
+            if not bloco:
+                break
+            linhas = []
+            for d in bloco:
+                matricula = str(d["Matricula"])
+                largura = max(largura, len(matricula))
+                ref = nomes.get(d["Nome"])
+                if ref is None:
+                    b = d["Nome"].encode('utf-8')
+                    ref = nomes[d["Nome"]] = (len(heap), len(b))
+                    heap += b
+                linhas.append((int(matricula), d["Salario"], d["CodigoSetor"], d["Idade"], ref[0], ref[1]))
+            f.write(np.array(linhas, dtype=DTYPE_REGISTRO).tobytes())
+            n += len(bloco)
+        f.flush()
+        matriculas = np.memmap(tmp, dtype=DTYPE_REGISTRO, mode='r', offset=off_reg, shape=(n,))['matricula'] \
+            if n else np.zeros(0, dtype='<i8')
+        ordem = np.argsort(matriculas, kind='stable')
+        off_chaves = _alinhar(f)
+        f.write(np.ascontiguousarray(matriculas[ordem], dtype='<i8').tobytes())
+        off_rows = _alinhar(f)
+        f.write(ordem.astype('<u4').tobytes())
+        del matriculas
+        off_heap = _alinhar(f)
+        f.write(heap)
+        f.seek(0)
+        f.write(_CAB_BIN.pack(_MAGIC_BIN, 1, largura, n, off_reg, off_chaves, off_rows, off_heap, len(heap)))
+    os.replace(tmp, arquivo)
+
+
+class RegistrosBinarios(Sequence):
+    """
+    Leitura do formato binário por mmap (somente leitura): colunas e índice são
+    views numpy sobre o mapeamento, então nada é copiado para a memória do
+    processo e várias instâncias/processos compartilham as mesmas páginas.
+
+    Mesma interface de RegistrosColunares (registros[i], matricula, linha,
+    pares, memoria_bytes); acessar k linhas toca só as páginas dessas k linhas.
+    Ao ser enviada a outro processo (pickle), a instância só reabre o arquivo.
+    """
+
+    def __init__(self, arquivo: str):
+        if not _HAS_NUMPY:
+            raise RuntimeError("O formato binário requer numpy instalado.")
+        self.arquivo = os.path.abspath(arquivo)
+        with open(self.arquivo, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, versao, self.largura, self.n, off_reg, off_chaves, off_rows, off_heap, tam_heap = \
+            _CAB_BIN.unpack_from(self._mm, 0)
+        if magic != _MAGIC_BIN or versao != 1:
+            raise ValueError(f"Arquivo binário inválido: {arquivo}")
+        self.registros = np.frombuffer(self._mm, dtype=DTYPE_REGISTRO, count=self.n, offset=off_reg)
+        self._chaves = np.frombuffer(self._mm, dtype='<i8', count=self.n, offset=off_chaves)
+        self._rows = np.frombuffer(self._mm, dtype='<u4', count=self.n, offset=off_rows)
+        self._heap = memoryview(self._mm)[off_heap:off_heap + tam_heap]
+
+    def __reduce__(self):
+        return (RegistrosBinarios, (self.arquivo,))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self.linha(i) for i in range(*row.indices(len(self)))]
+        return self.linha(row)
+
+    def matricula(self, row: int) -> str:
+        return f"{int(self.registros[row]['matricula']):0{self.largura}d}"
+
+    def linha(self, row: int) -> Dict[str, Any]:
+        """Materializa o registro da linha row como dicionário (lê só essa linha e o nome)."""
+        mat, sal, setor, idade, off, tam = self.registros[row].item()
+        return {"Matricula": f"{mat:0{self.largura}d}",
+                "Nome": bytes(self._heap[off:off + tam]).decode('utf-8'),
+                "Salario": sal, "CodigoSetor": setor, "Idade": idade}
+
+    def amostra(self, k: int, rnd: Optional[random.Random] = None) -> List[Dict[str, Any]]:
+        """k registros sorteados sem reposição (só as k linhas são lidas)."""
+        rows = (rnd or random).sample(range(self.n), k)
+        return [self.linha(r) for r in rows]
+
+    def row_da_matricula(self, matricula: str) -> Optional[int]:
+        """Busca binária no índice ordenado: toca O(log n) páginas."""
+        m = int(matricula)
+        i = int(np.searchsorted(self._chaves, m))
+        if i < self.n and self._chaves[i] == m:
+            return int(self._rows[i])
+        return None
+
+    def pares(self) -> Iterable[Tuple[str, int]]:
+        """Pares (matrícula, row id) para carregar as estruturas (lidos em blocos)."""
+        w = self.largura
+        for ini in range(0, self.n, 100_000):
+            bloco = self.registros['matricula'][ini:ini + 100_000].tolist()
+            yield from ((f"{m:0{w}d}", ini + j) for j, m in enumerate(bloco))
+
+    def memoria_bytes(self) -> int:
+        """Tamanho do mapeamento (páginas do arquivo, carregadas sob demanda e compartilhadas)."""
+        return len(self._mm)
+
+
+def get_registros(qtd = 1000, path = './dados') -> RegistrosColunares:
+    """ Versão colunar de get_dados, compartilhada por todas as estruturas do processo.
+        As colunas são montadas direto do iter_dados, sem materializar a lista de dicionários.
+    """
+    chave = ('colunar', qtd, os.path.abspath(path))
+    registros = CACHE_DADOS.obter(chave)
+    if registros is None:
+        registros = RegistrosColunares(iter_dados(qtd, path))
+        CACHE_DADOS.guardar(chave, registros, registros.memoria_bytes())
+    return registros
+
+def get_binario(qtd = 1000, path = './dados') -> RegistrosBinarios:
+    """ Versão binária (mmap) de get_dados: converte dados_<qtd>.json para dados_<qtd>.bin
+        na primeira chamada e depois só mapeia o arquivo.
+    """
+    arquivo = os.path.join(path, f'dados_{qtd}.bin')
+    chave = ('binario', qtd, os.path.abspath(path))
+    registros = CACHE_DADOS.obter(chave)
+    if registros is None:
+        if not os.path.isfile(arquivo):
+            gerar_dados_binario(arquivo, iter_dados(qtd, path))
+        registros = RegistrosBinarios(arquivo)
+        # o mapeamento não ocupa memória do processo: só o objeto entra na conta
+        CACHE_DADOS.guardar(chave, registros, sys.getsizeof(registros))
+    return registros
+
 if __name__ == "__main__":
     # Gera arquivos de dados padrão para o experimento
     for qtd in (1000, 5000, 10000, 50000, 100000):
@@ -0,0 +1,64 @@
+# arquivo: util_estatistica.py
+"""
+Estatística dos rounds: rejeição de outliers pelo desvio absoluto mediano (MAD)
+e intervalo de confiança de 95% (t de Student) da média entre rounds.
+Usado por rounds_summary_df e pelo modo -adaptativo do rodar_experimento.
+"""
+from __future__ import annotations
+from typing import List, Sequence, Tuple
+import math
+import statistics
+
+# quantis t(0,975) para 1..30 graus de liberdade
+_T_975 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+
+def t_critico_95(graus_liberdade: int) -> float:
+    """Quantil 0,975 da t de Student (tabela até 30 g.l.; depois, expansão de Cornish-Fisher)."""
+    if graus_liberdade < 1:
+        raise ValueError("são necessários ao menos 2 valores")
+    if graus_liberdade <= len(_T_975):
+        return _T_975[graus_liberdade - 1]
+    z, v = 1.959964, float(graus_liberdade)
+    return z + (z ** 3 + z) / (4 * v) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * v ** 2)
+
+
+def remover_outliers_mad(valores: Sequence[float], limite: float = 3.5) -> Tuple[List[float], List[float]]:
+    """
+    Separa (mantidos, rejeitados) pelo z-score modificado de Iglewicz-Hoaglin:
+    0,6745·|x − mediana| / MAD > limite. Com menos de 3 valores ou MAD = 0 nada é rejeitado.
+    """
+    valores = list(valores)
+    if len(valores) < 3:
+        return valores, []
+    mediana = statistics.median(valores)
+    mad = statistics.median(abs(v - mediana) for v in valores)
+    if mad == 0:
+        return valores, []
+    mantidos, rejeitados = [], []
+    for v in valores:
+        (rejeitados if 0.6745 * abs(v - mediana) / mad > limite else mantidos).append(v)
+    return mantidos, rejeitados
+
+
+def ic95(valores: Sequence[float]) -> Tuple[float, float]:
+    """Intervalo de confiança de 95% da média; (nan, nan) com menos de 2 valores."""
+    n = len(valores)
+    if n < 2:
+        return math.nan, math.nan
+    media = statistics.fmean(valores)
+    meia = t_critico_95(n - 1) * statistics.stdev(valores) / math.sqrt(n)
+    return media - meia, media + meia
+
+
+def largura_relativa_ic95(valores: Sequence[float]) -> float:
+    """Largura do IC95 dividida pela |média| (0,05 = intervalo de 5% da média); inf se indefinida."""
+    inf, sup = ic95(valores)
+    media = statistics.fmean(valores) if valores else 0.0
+    if math.isnan(inf) or media == 0:
+        return math.inf
+    return (sup - inf) / abs(media)
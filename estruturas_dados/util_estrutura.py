@@ -3,13 +3,20 @@ from __future__ import annotations
 from dataclasses import dataclass, asdict, field
 from typing import Any, Dict, Optional, List, Tuple, Callable, Iterable
 from collections import defaultdict
+from array import array
+import bisect
+import builtins
+import functools
+import math
 import time
 import tracemalloc
 import json
 import csv
 import random
 import uuid
-from util_dados import get_dados
+from util_dados import get_dados, get_registros, get_binario
+from util_estatistica import remover_outliers_mad, ic95, largura_relativa_ic95
+from util_isolamento import MONITOR_GC
 random.seed(42)
 
 try:
@@ -108,6 +115,55 @@ class OpRecord:
         return d
 
 
+# -----------------------------
+# Codecs de chave (opcionais): convertem a chave na fronteira da API
+# para um inteiro com a mesma ordem da string original
+# -----------------------------
+class CodecMatricula:
+    """
+    Matrícula decimal de largura fixa <-> int.
+    Com largura fixa e zero à esquerda, a ordem numérica é igual à ordem da string.
+    """
+    def __init__(self, largura: int = 6) -> None:
+        self.largura = int(largura)
+        self.nome = f"int{self.largura}"
+
+    def codificar(self, key: Any) -> int:
+        if type(key) is int:
+            return key
+        if len(key) != self.largura or not key.isdigit():
+            raise ValueError(f"matrícula '{key}' não tem {self.largura} dígitos")
+        return int(key)
+
+    def decodificar(self, x: int) -> str:
+        return f"{x:0{self.largura}d}"
+
+
+class CodecTextoFixo:
+    """
+    Texto qualquer (até largura bytes em UTF-8, sem bytes NUL) <-> int big-endian.
+    A ordem dos bytes UTF-8 é a ordem dos code points, então a ordem se preserva.
+    """
+    def __init__(self, largura: int = 16) -> None:
+        self.largura = int(largura)
+        self.nome = f"bytes{self.largura}"
+
+    def codificar(self, key: Any) -> int:
+        if type(key) is int:
+            return key
+        raw = key.encode("utf-8")
+        if len(raw) > self.largura:
+            raise ValueError(f"chave '{key}' excede {self.largura} bytes")
+        return int.from_bytes(raw.ljust(self.largura, b"\0"), "big")
+
+    def decodificar(self, x: int) -> str:
+        return x.to_bytes(self.largura, "big").rstrip(b"\0").decode("utf-8")
+
+
+def _sem_codec(key: Any) -> Any:
+    return key
+
+
 # -----------------------------
 # Base: define interface e instrumentação
 # -----------------------------
@@ -123,9 +179,20 @@ class BaseDataStructure:
     Observação:
     - Chave: matrícula (string zero-padded).
     - Valor: dicionário com os dados completos.
+    - codec (parâmetro opcional de todas as estruturas, ex.: CodecMatricula()):
+      insert/remove/search codificam a chave antes de chamar os _impl, então
+      comparações, hashes e armazenamento internos trabalham com int; os
+      utilitários de iteração devolvem a chave decodificada.
     """
 
     def __init__(self, name: str, **params: Any) -> None:
+        codec = params.pop('codec', None)
+        self._codec = codec
+        self._enc = codec.codificar if codec is not None else _sem_codec
+        self._dec = codec.decodificar if codec is not None else _sem_codec
+        if codec is not None:
+            name = f"{name}[{codec.nome}]"
+            params['codec'] = codec.nome
         self.name = name
         self.params = params
         self.counters = Counters()
@@ -136,22 +203,38 @@ class BaseDataStructure:
         self._extras_current_op: Dict[str, Any] = {}
         self._metricas_ignorar = set()
         self._current_round_id = str(uuid.uuid4())  # gera ID único automaticamente
+        self._registros = None   # RegistrosColunares quando os valores são row ids
 
     # --------- Interface pública ---------
     def insert(self, key: str, value: Dict[str, Any]) -> bool:
-        return self._instrument("insert", key, lambda: self._insert_impl(key, value))
+        return self._instrument("insert", key, lambda: self._insert_impl(self._enc(key), value))
 
     def remove(self, key: str) -> bool:
-        return self._instrument("remove", key, lambda: self._remove_impl(key))
+        return self._instrument("remove", key, lambda: self._remove_impl(self._enc(key)))
 
-    def search(self, key: str) -> Optional[Dict[str, Any]]:
+    def search(self, key: str, materializar: bool = False) -> Optional[Dict[str, Any]]:
+        ''' materializar=True: se a estrutura guarda row ids (carregar_dados(colunar=True)),
+            devolve o dicionário do registro em vez do row id
+        '''
         result_ref: Dict[str, Any] = {"_ptr": None}
         def _do():
-            result_ref["_ptr"] = self._search_impl(key)
+            result_ref["_ptr"] = self._search_impl(self._enc(key))
             return result_ref["_ptr"] is not None
         self._instrument("search", key, _do)
+        if materializar and self._registros is not None and isinstance(result_ref["_ptr"], int):
+            return self._registros[result_ref["_ptr"]]
         return result_ref["_ptr"]
 
+    def update(self, key: str, value: Dict[str, Any]) -> bool:
+        """Troca o valor de uma chave existente (registra a operação 'update')."""
+        return self._instrument("update", key, lambda: self._update_impl(self._enc(key), value))
+
+    def _update_impl(self, key: str, value: Dict[str, Any]) -> bool:
+        # padrão: remove + insert (subclasses podem atualizar no lugar)
+        if not self._remove_impl(key):
+            return False
+        return self._insert_impl(key, value)
+
     # --------- Hooks obrigatórios nas subclasses ---------
     def _insert_impl(self, key: str, value: Dict[str, Any]) -> bool:  # pragma: no cover
         raise NotImplementedError
@@ -201,6 +284,10 @@ class BaseDataStructure:
         """Armazena par (k,v) extra para o OpRecord atual (será flatten como x_<k>)."""
         self._extras_current_op[key] = value
 
+    def note_extra_soma(self, key: str, value: float) -> None:
+        """Como note_extra, mas acumula quando o extra é registrado várias vezes na operação."""
+        self._extras_current_op[key] = self._extras_current_op.get(key, 0) + value
+
     # --------- Instrumentação ---------
     def _instrument(self, op: str, key: Any, fn) -> bool:
         self.counters.reset()
@@ -222,6 +309,9 @@ class BaseDataStructure:
         # tracemalloc
         _, _ = tracemalloc.get_traced_memory()
 
+        # coletas do gc (só no modo de isolamento, util_isolamento.isolar)
+        gc0 = MONITOR_GC.instantaneo() if MONITOR_GC.ativo else None
+
         # executa
         success = fn()
 
@@ -229,6 +319,11 @@ class BaseDataStructure:
         t1_proc = time.process_time_ns()
         t1_wall = time.perf_counter_ns()
 
+        if gc0 is not None:
+            coletas, pausa_ns = MONITOR_GC.instantaneo()
+            self._extras_current_op['gc_coletas'] = coletas - gc0[0]
+            self._extras_current_op['gc_pausa_ms'] = (pausa_ns - gc0[1]) / 1e6
+
         # CPU/mem (psutil)
         if self._proc is not None:
             cpu1 = self._proc.cpu_times()
@@ -395,27 +490,92 @@ class BaseDataStructure:
     ##################################################
     ## métodos para lote e métricas
 
-    def carregar_dados(self, qtd=1000, sorted = False):
+    def carregar_dados(self, qtd=1000, sorted = False, colunar = False, binario = False):
         ''' sorted só para o caso do método existir
+            colunar=True: usa o armazenamento colunar compartilhado (get_registros)
+                          e insere só o row id de cada registro como valor;
+                          search(key, materializar=True) devolve o dicionário
+            binario=True: como colunar, mas com o arquivo binário mapeado em memória
+                          (get_binario); as amostras de buscar_dados/remover_dados
+                          leem só as linhas sorteadas
         '''
-        dados = get_dados(qtd)
+        if colunar or binario:
+            dados = get_binario(qtd) if binario else get_registros(qtd)
+            self._registros = dados
+            pares = dados.pares()
+        else:
+            dados = get_dados(qtd)
+            pares = ((linha['Matricula'], linha) for linha in dados)
         self.__dados_lote  = dados
-        for linha in dados:
+        self._inserir_lote(pares, sorted=sorted)
+
+    def _inserir_lote(self, pares, sorted = False):
+        ''' insere o lote de pares (chave, valor) um a um
+            - subclasses podem sobrescrever para cargas em lote (ex.: bulk load)
+        '''
+        for key, value in pares:
             if sorted and 'insert_sorted' in self.params:
-                  self.params['insert_sorted'](key = linha['Matricula'], value = linha)
+                  self.params['insert_sorted'](key = key, value = value)
             else:
-               self.insert(key = linha['Matricula'], value = linha)
+               self.insert(key = key, value = value)
 
     def remover_dados(self, qtd=100):
         dados = random.sample(self.__dados_lote, qtd)
         for linha in dados:
             self.remove(key = linha['Matricula'])
 
-    def buscar_dados(self, qtd=100):
-        dados = random.sample(self.__dados_lote, qtd)
+    def buscar_dados(self, qtd=100, distribuicao='uniforme', zipf_s=1.0):
+        ''' distribuicao:
+              - 'uniforme': amostra sem reposição (padrão)
+              - 'zipf': amostra com reposição concentrada em poucas matrículas
+                 (o registro de rank r tem peso 1/r^zipf_s)
+        '''
+        if distribuicao == 'uniforme':
+            dados = random.sample(self.__dados_lote, qtd)
+        elif distribuicao == 'zipf':
+            dados = self._amostra_zipf(self.__dados_lote, qtd, zipf_s)
+        else:
+            raise ValueError("distribuicao deve ser 'uniforme' ou 'zipf'")
         for linha in dados:
             self.search(key = linha['Matricula'])
 
+    def executar_workload(self, operacoes) -> Dict[str, int]:
+        ''' reexecuta um fluxo de util_workload.Operacao, uma operação registrada por vez:
+              read -> search | insert -> insert | update -> update | delete -> remove
+              scan -> range_scan(inicio, fim) nas estruturas que o oferecem
+            retorna a contagem por tipo; scans sem suporte ficam em 'ignoradas'
+        '''
+        contagem = defaultdict(int)
+        range_scan = getattr(self, 'range_scan', None)
+        for o in operacoes:
+            if o.op == 'read':
+                self.search(o.key)
+            elif o.op == 'insert':
+                self.insert(o.key, o.value)
+            elif o.op == 'update':
+                self.update(o.key, o.value)
+            elif o.op == 'delete':
+                self.remove(o.key)
+            elif o.op == 'scan' and range_scan is not None:
+                range_scan(o.key, o.fim)
+            else:
+                contagem['ignoradas'] += 1
+                continue
+            contagem[o.op] += 1
+        return dict(contagem)
+
+    @staticmethod
+    def _amostra_zipf(lote, qtd, s=1.0):
+        ''' ranks embaralhados com semente fixa para que as matrículas quentes
+            não dependam da ordem do arquivo '''
+        n = len(lote)
+        ordem = random.Random(n).sample(range(n), n)
+        pesos, acc = [], 0.0
+        for r in range(1, n + 1):
+            acc += 1.0 / (r ** s)
+            pesos.append(acc)
+        return [lote[i] for i in random.choices(ordem, cum_weights=pesos, k=qtd)]
+
     def descarregar_dados(self):
         ''' limpa os dados carregados para liberar memória
             - útil quando os dados forem usados só para preparar as
@@ -424,6 +584,61 @@ class BaseDataStructure:
         '''
         self.__dados_lote = None
 
+    def carregar_com_checkpoints(self, tamanhos, qtd_busca=lambda n: n // 4,
+                                 qtd_remocao=lambda n: n // 10) -> List[Dict[str, Any]]:
+        ''' curva de crescimento em uma única carga: insere até max(tamanhos) e, a cada
+            N de tamanhos, roda as fases de busca e remoção e depois as desfaz
+            (os removidos são reinseridos sem registro de métricas)
+            - o conjunto de chaves em cada checkpoint é o mesmo de carregar_dados(N);
+              a ordem de inserção é a de dados_<N1>, depois os registros novos de
+              dados_<N2> e assim por diante
+            - a reinserção pode mudar a forma da estrutura (ex.: posição na lista,
+              folha da árvore não balanceada); estruturas que se reorganizam na busca
+              (Splay, auto_organizacao) seguem reorganizadas
+            - retorna um export_metrics_json por N (round_id próprio, com os inserts
+              até N e as buscas/remoções do checkpoint), compatível com rounds_summary_df
+        '''
+        saida, inserts, n_ant = [], [], 0
+        for n in builtins.sorted(set(tamanhos)):
+            dados = get_dados(n)
+            novos = (d for d in dados if int(d['Matricula']) >= n_ant)
+            self._inserir_lote(((d['Matricula'], d) for d in novos), sorted=False)
+            n_ant = n
+            n_inserts = len(self._log)
+            inserts.extend(rec.to_dict() for rec in self._log[len(inserts):])
+
+            round_id, self._current_round_id = self._current_round_id, str(uuid.uuid4())
+            self.__dados_lote = dados
+            self.buscar_dados(qtd_busca(n))
+            removidos = [(linha['Matricula'], linha) for linha in random.sample(dados, qtd_remocao(n))
+                         if self.remove(key = linha['Matricula'])]
+            rid = self._current_round_id
+            saida.append({
+                "ds_name": self.name,
+                "params": self.params.copy(),
+                "round_id": rid,
+                "metrics": [dict(m, round_id=rid) for m in inserts]
+                           + [rec.to_dict() for rec in self._log[n_inserts:]],
+                "metrics_out": list(self._metricas_ignorar),
+                "checkpoint": n,
+            })
+
+            # desfaz a fase de sondagem
+            del self._log[n_inserts:]
+            self._current_round_id = round_id
+            self._sem_metricas(lambda: [self._insert_impl(self._enc(k), v) for k, v in removidos])
+        self.__dados_lote = None
+        return saida
+
+    def _sem_metricas(self, fn):
+        ''' executa fn com contadores e extras descartáveis (nada entra no log) '''
+        counters, extras = self.counters, self._extras_current_op
+        self.counters, self._extras_current_op = Counters(), {}
+        try:
+            return fn()
+        finally:
+            self.counters, self._extras_current_op = counters, extras
+
     def print_summary(self, agg: str = "sum"):
         print('>---------------------------------------<')
         if agg.strip().lower() == 'sum':
@@ -443,10 +658,13 @@ class BaseDataStructure:
     @classmethod
     def rounds_summary_df(
         cls,
-        metrics_data: List[Dict[str, Any]],
+        metrics_data: Optional[List[Dict[str, Any]]] = None,
         metrics: Optional[Iterable[str]] = None,
         agg: str = "sum",
         op_filter: Tuple[str, ...] = ("insert",),
+        db: Any = None,
+        rejeitar_outliers: bool = False,
+        **filtros_db: Any,
     ):
         """
         Gera um DataFrame com uma linha por (ds_name, N, metric),
@@ -459,6 +677,9 @@ class BaseDataStructure:
           - mean_per_round  : float (média entre rodadas para esse N)
           - rounds          : int (quantidade de rodadas para esse N)
           - std_per_round   : float (desvio-padrão entre rodadas para esse N; 0 se rounds==1)
+          - ci95_low/high   : float (IC de 95% da média entre rodadas; NaN se rounds==1)
+          - ci95_rel_width  : float (largura do IC95 / média: precisão obtida)
+          - outliers        : int (rodadas descartadas pelo MAD; 0 sem rejeitar_outliers)
 
         Parâmetros:
           - metrics_data : lista de dicionários com dados das estruturas e suas métricas
@@ -466,6 +687,12 @@ class BaseDataStructure:
           - metrics  : lista de métricas a considerar; se None usa um conjunto padrão
           - agg      : como agregar dentro da rodada ("sum" ou "mean")
           - op_filter: quais operações entram dentro da rodada (default: só 'insert')
+          - db       : em vez de metrics_data, consulta o banco de resultados
+                       (ResultadosDB ou caminho do arquivo .sqlite3), sem reler JSON;
+                       filtros_db (experimento, modo, ds_names, run_id, ignorar_metrics_out)
+                       vão para ResultadosDB.valores_por_round
+          - rejeitar_outliers: descarta rodadas com z-score modificado (MAD) > 3,5
+                       antes de calcular média, desvio e IC
         """
         try:
             import numpy as np
@@ -477,6 +704,8 @@ class BaseDataStructure:
 
         if agg not in ("sum", "mean"):
             raise ValueError("agg deve ser 'sum' ou 'mean'.")
+        if filtros_db and db is None:
+            raise TypeError(f"filtros {sorted(filtros_db)} só valem com db=")
 
         # Métricas padrão conhecidas (mesmas do summary) + 'load_factor' opcional
         default_metrics = (
@@ -538,22 +767,35 @@ class BaseDataStructure:
                         return None
                 return None
 
-            vals = []
+            # soma exata por operação e depois entre operações (math.fsum): o valor não
+            # depende da ordem dos registros e é o mesmo que util_resultados guarda no banco
+            vals = defaultdict(list)
             for r in recs:
                 v = r.get(metric)
                 if v is None:
                     continue
                 try:
-                    vals.append(float(v))
+                    vals[r.get("op")].append(float(v))
                 except Exception:
                     pass
             if not vals:
                 return None
-            return sum(vals) if agg == "sum" else (sum(vals) / len(vals))
+            total = math.fsum(math.fsum(v) for v in vals.values())
+            return total if agg == "sum" else total / sum(len(v) for v in vals.values())
 
         # Acumulador de valores por (ds_name, N, metric) ao longo das rodadas
         by_key = defaultdict(list)  # key => list[valor_da_rodada]
 
+        if db is not None:
+            from util_resultados import ResultadosDB
+            banco = db if isinstance(db, ResultadosDB) else ResultadosDB(db)
+            try:
+                by_key = banco.valores_por_round(metrics, agg=agg, op_filter=op_filter, **filtros_db)
+            finally:
+                if banco is not db:
+                    banco.fechar()
+            metrics_data = []
+
         for data_item in metrics_data:
             if not isinstance(data_item, dict):
                 continue
@@ -581,6 +823,9 @@ class BaseDataStructure:
         for (ds_name, N, metric), values in by_key.items():
             if not values:
                 continue
+            outliers = []
+            if rejeitar_outliers:
+                values, outliers = remover_outliers_mad(values)
             rounds = len(values)
             mean_val = round(float(np.mean(values)), 5)
             
@@ -589,6 +834,7 @@ class BaseDataStructure:
                 std_val = round(float(np.std(values, ddof=1)), 5)
             else:
                 std_val = 0.0
+            ci_low, ci_high = ic95(values)
                 
             rows.append({
                 "ds_name": ds_name,
@@ -597,6 +843,10 @@ class BaseDataStructure:
                 "mean_per_round": mean_val,
                 "rounds": rounds,
                 "std_per_round": std_val,
+                "ci95_low": round(ci_low, 5),
+                "ci95_high": round(ci_high, 5),
+                "ci95_rel_width": round(largura_relativa_ic95(values), 5),
+                "outliers": len(outliers),
                 "values": values,  # para debug/inspeção
             })
 
@@ -604,14 +854,83 @@ class BaseDataStructure:
             # DataFrame vazio, mas com colunas esperadas
             return pd.DataFrame(columns=[
                 "ds_name", "instances", "metric",
-                "mean_per_round", "rounds", "std_per_round"
+                "mean_per_round", "rounds", "std_per_round",
+                "ci95_low", "ci95_high", "ci95_rel_width", "outliers"
             ])
 
         df = pd.DataFrame(rows)
         df.sort_values(by=["ds_name", "metric", "instances"], inplace=True, kind="stable")
         df.reset_index(drop=True, inplace=True)
         return df
-    
+
+
+# -----------------------------
+# Base para estruturas que envolvem outra (filtros, caches)
+# -----------------------------
+class EnvoltorioDS(BaseDataStructure):
+    """
+    Estrutura que delega a uma BaseDataStructure interna e registra as métricas
+    da interna nas próprias operações (counters e extras compartilhados).
+
+    - O nome fica "<prefixo>+<nome interno>" e os params somam os da interna
+    - Sem codec próprio, usa a codificação da estrutura interna
+    - Envoltórios podem ser empilhados (ex.: CacheDS(FiltroBloomDS(...)))
+    - Atributos não encontrados (to_list, items, length, ...) vêm da interna
+    """
+
+    def __init__(self, prefixo: str, estrutura: BaseDataStructure, **params: Any) -> None:
+        super().__init__(f"{prefixo}+{estrutura.name}", **params)
+        self.params = {**estrutura.params, **self.params}
+        self.estrutura = estrutura
+        if self._codec is None:
+            self._enc, self._dec = estrutura._enc, estrutura._dec
+        self._metricas_ignorar = set(estrutura._metricas_ignorar)
+
+    def __getattr__(self, nome: str) -> Any:
+        if nome == 'estrutura':
+            raise AttributeError(nome)
+        return getattr(self.estrutura, nome)
+
+    def _interna(self) -> BaseDataStructure:
+        """Direciona counters e extras da estrutura interna para o OpRecord atual."""
+        e = self.estrutura
+        e.counters = self.counters
+        e._extras_current_op = self._extras_current_op
+        return e
+
+    def _insert_impl(self, key: Any, value: Dict[str, Any]) -> bool:
+        return self._interna()._insert_impl(key, value)
+
+    def _remove_impl(self, key: Any) -> bool:
+        return self._interna()._remove_impl(key)
+
+    def _search_impl(self, key: Any) -> Optional[Dict[str, Any]]:
+        return self._interna()._search_impl(key)
+
+    @property
+    def range_scan(self):
+        """
+        range_scan registrado no próprio envoltório ('range'), só quando a estrutura de
+        base oferece _range_scan_impl; senão AttributeError (executar_workload ignora o scan).
+        """
+        base = self.estrutura
+        while isinstance(base, EnvoltorioDS):
+            base = base.estrutura
+        if not hasattr(base, '_range_scan_impl'):
+            raise AttributeError('range_scan')
+        return self._range_scan
+
+    def _range_scan(self, inicio: Any, fim: Any) -> List[Tuple[Any, Dict[str, Any]]]:
+        result_ref: Dict[str, Any] = {"_ptr": []}
+        def _do():
+            result_ref["_ptr"] = self._range_scan_impl(inicio, fim)
+            return len(result_ref["_ptr"]) > 0
+        self._instrument("range", (inicio, fim), _do)
+        return result_ref["_ptr"]
+
+    def _range_scan_impl(self, inicio: Any, fim: Any) -> List[Tuple[Any, Dict[str, Any]]]:
+        return self._interna()._range_scan_impl(inicio, fim)
+
 #############################################################################################    
 #############################################################################################    
 #############################################################################################    
@@ -635,6 +954,43 @@ class ArrayLinkedList(BaseDataStructure):
            k  -> inserir na posição k (0 <= k <= length)
       - sorted_insert: bool
           True -> insere mantendo ordem crescente de chave; ignora default_pos
+      - storage: str
+          'nodes' -> um objeto _Node por elemento, ligado por referência [padrão]
+          'array' -> pool de nós em arrays paralelos pré-alocados (chaves, valores
+                     e índice do próximo), com free-list para slots removidos
+      - capacidade: int
+          tamanho inicial do pool quando storage='array' (dobra ao encher)
+      - skip_index: bool
+          True -> mantém âncoras a cada ~sqrt(n) nós (handle, posição e chave);
+                  acesso por posição e, com sorted_insert, busca, inserção e
+                  remoção partem da âncora mais próxima: O(sqrt n) nós visitados.
+                  A manutenção das âncoras é contada no extra skip_updates.
+      - hash_index: bool
+          True -> dicionário chave -> nós e mapa nó -> anterior (linked hash map);
+                  busca e remoção localizam o nó em O(1) (1 probe no índice).
+                  Com skip_index também ativo, a remoção segue pelas âncoras,
+                  que precisam da posição do nó. A manutenção é contada no
+                  extra hash_updates. Duplicatas ficam no índice na ordem da
+                  lista (a busca devolve a mais próxima do head, como a
+                  varredura); inserções no meio (default_pos=k) sem vizinho
+                  de mesma chave procuram a duplicata mais próxima (nós
+                  visitados contados em node_visits).
+      - auto_organizacao: str | None
+          só sem sorted_insert; reorganiza a lista a cada busca bem-sucedida:
+          'mtf'       -> move o nó encontrado para o head (move-to-front)
+          'transpose' -> troca o nó encontrado com o anterior
+          'count'     -> conta acessos e mantém a lista em ordem decrescente de
+                         contagem (o nó sobe para o início do seu trecho de
+                         mesma contagem)
+          Os ponteiros reescritos na reorganização entram em shifts da busca.
+
+    Com sorted_insert=True, bulk_load(itens) (ou carregar_dados(n, sorted=True))
+    ordena o lote uma vez e o intercala com a lista em uma única passada,
+    produzindo exatamente a mesma lista das inserções ordenadas sequenciais.
+
+    Os algoritmos trabalham com "handles" de nó: o próprio _Node (NIL = None)
+    ou o índice do slot no pool (NIL = -1). Só as varreduras lineares têm versão
+    específica por modo; as contagens de shifts e node_visits são as mesmas.
     """
 
     class _Node:
@@ -644,131 +1000,265 @@ class ArrayLinkedList(BaseDataStructure):
             self.value = value
             self.next: Optional["ArrayLinkedList._Node"] = None
 
-    def __init__(self, default_pos: int = -1, sorted_insert: bool = False, **params: Any) -> None:
-        nome = f'ArrayLinkedList(def={default_pos}|{"sorted" if sorted_insert else "unsorted"})'
-        super().__init__(nome, default_pos=default_pos, sorted_insert=sorted_insert, **params)
-        self.head: Optional[ArrayLinkedList._Node] = None
-        self.tail: Optional[ArrayLinkedList._Node] = None
+    def __init__(self, default_pos: int = -1, sorted_insert: bool = False,
+                 storage: str = 'nodes', capacidade: int = 1024,
+                 skip_index: bool = False, hash_index: bool = False,
+                 auto_organizacao: Optional[str] = None, **params: Any) -> None:
+        if storage not in ('nodes', 'array'):
+            raise ValueError("storage deve ser 'nodes' ou 'array'")
+        if auto_organizacao not in (None, 'mtf', 'transpose', 'count'):
+            raise ValueError("auto_organizacao deve ser None, 'mtf', 'transpose' ou 'count'")
+        if auto_organizacao and (sorted_insert or hash_index):
+            raise ValueError("auto_organizacao exige lista não ordenada e sem hash_index")
+        nome = f'ArrayLinkedList(def={default_pos}|{"sorted" if sorted_insert else "unsorted"}'
+        nome += '' if storage == 'nodes' else '|array'
+        nome += '|skip' if skip_index else ''
+        nome += '|hash' if hash_index else ''
+        nome += f'|{auto_organizacao})' if auto_organizacao else ')'
+        super().__init__(nome, default_pos=default_pos, sorted_insert=sorted_insert, storage=storage,
+                         skip_index=skip_index, hash_index=hash_index,
+                         auto_organizacao=auto_organizacao, **params)
+        self.storage = storage
         self.length: int = 0
 
         self.default_pos = int(default_pos)
         self.sorted_insert = bool(sorted_insert)
         self._metricas_ignorar =  {'rotations', 'hash_collisions', 'hash_bucket_len_after', 'hash_cluster_len', 'hash_displacement'}
 
+        if storage == 'array':
+            self._nil = -1
+            cap = max(1, int(capacidade))
+            self._keys: List[Any] = [None] * cap
+            self._vals: List[Any] = [None] * cap
+            self._nxt = array('l', [-1]) * cap
+            self._usados = 0       # slots já entregues ao menos uma vez
+            self._livre = -1       # topo da free-list (encadeada por _nxt)
+            self._prox, self._set_prox = self._prox_arr, self._set_prox_arr
+            self._chave, self._valor = self._chave_arr, self._valor_arr
+            self._novo, self._descartar = self._novo_arr, self._descartar_arr
+            self._localizar, self._node_at = self._localizar_arr, self._node_at_arr
+            self._antecessor_ordenado = self._antecessor_ordenado_arr
+        else:
+            self._nil = None
+        self.head = self._nil
+        self.tail = self._nil
+
+        # índices auxiliares: recebem (nó, anterior, posição) após cada ligação/remoção
+        self.skip_index = bool(skip_index)
+        self.hash_index = bool(hash_index)
+        self._indexado = self.skip_index or self.hash_index
+        self._pos_ult = 0          # posição do último nó localizado (só com skip_index)
+        if self.skip_index:
+            self._anc_h: List[Any] = []      # handles das âncoras
+            self._anc_pos: List[int] = []    # posição de cada âncora (crescente, a 1ª é o head)
+            self._anc_key: List[Any] = []    # chave de cada âncora (ordenadas se sorted_insert)
+            self._anc_passo = 1              # distância alvo entre âncoras (~sqrt n)
+            self._anc_n = 0                  # length na última reconstrução
+            self._localizar, self._node_at = self._localizar_skip, self._node_at_skip
+            self._antecessor_ordenado = self._antecessor_ordenado_skip
+        if self.hash_index:
+            self._idx_chave: Dict[Any, List[Any]] = {}   # chave -> handles na ordem da lista
+            self._idx_ant: Dict[Any, Any] = {}           # handle -> handle anterior (NIL no head)
+            self._find_node = self._find_node_hash
+            if not self.skip_index:
+                self._localizar = self._localizar_hash
+
+        self.auto_organizacao = auto_organizacao
+        self._freq: Optional[Dict[Any, int]] = {} if auto_organizacao == 'count' else None
+        if auto_organizacao:
+            self._find_node = self._buscar_organizando
+
     # =========================
     # Implementações Base
     # =========================
     def _insert_impl(self, key: str, value: Dict[str, Any]) -> bool:
-        new_node = self._Node(key, value)
+        nil = self._nil
 
-        # 2) lista vazia → caso base
-        if self.head is None:
+        # 1) lista vazia → caso base
+        if self.head == nil:
+            new_node = self._novo(key, value)
             self.head = self.tail = new_node
             self.length = 1
             # writes: head, tail
             self.note_shift(2)
+            if self._indexado:
+                self._apos_inserir(new_node, nil, 0)
             return True
 
-        # 3) inserção ordenada (se habilitada)
+        # 2) inserção ordenada (se habilitada)
         if self.sorted_insert:
-            return self._insert_sorted(new_node)
+            return self._insert_sorted(self._novo(key, value))
 
-        # 4) inserção por posição
+        # 3) inserção por posição
         pos = self.default_pos
         if pos == -1:
             # fim (tail)
-            assert self.tail is not None
-            self.tail.next = new_node
+            new_node = self._novo(key, value)
+            prev = self.tail
+            self._set_prox(prev, new_node)
             self.note_shift(1)      # tail.next = new_node
             self.tail = new_node
             self.note_shift(1)      # tail = new_node
             self.length += 1
+            if self._indexado:
+                self._apos_inserir(new_node, prev, self.length - 1)
             return True
 
         if pos == 0:
             # início (head)
-            new_node.next = self.head
+            new_node = self._novo(key, value)
+            self._set_prox(new_node, self.head)
             self.note_shift(1)      # new_node.next = head
             self.head = new_node
             self.note_shift(1)      # head = new_node
             self.length += 1
+            if self._indexado:
+                self._apos_inserir(new_node, nil, 0)
             return True
 
         # inserir em posição intermediária: 0 < pos <= length
         if 0 <= pos <= self.length:
             prev = self._node_at(pos - 1)
-            if prev is None:
+            if prev == nil:
                 return False
-            new_node.next = prev.next
+            new_node = self._novo(key, value)
+            self._set_prox(new_node, self._prox(prev))
             self.note_shift(1)      # new_node.next = prev.next
-            prev.next = new_node
+            self._set_prox(prev, new_node)
             self.note_shift(1)      # prev.next = new_node
             # atualiza tail se inseriu no final (pos == length)
-            if prev is self.tail:
+            if prev == self.tail:
                 self.tail = new_node
                 self.note_shift(1)  # tail = new_node
             self.length += 1
+            if self._indexado:
+                self._apos_inserir(new_node, prev, pos)
             return True
 
         # posição inválida - não insere
         return False
 
     def _remove_impl(self, key: str) -> bool:
-        if self.head is None:
+        nil = self._nil
+        prev, cur = self._localizar(key)
+        if cur == nil:
             return False
 
-        # remover head
-        self.note_visit(1)
-        if self.cmp_keys(self.head.key, key) == 0:
-            old_head = self.head
-            self.head = self.head.next
+        if prev == nil:
+            # remover head
+            self.head = self._prox(cur)
             self.note_shift(1)          # head = head.next
-            if self.head is None:
+            if self.head == nil:
                 # lista ficou vazia; zera tail
-                self.tail = None
+                self.tail = nil
                 self.note_shift(1)      # tail = None
-            del old_head
-            self.length -= 1
-            return True
-
-        # remover no meio/fim
-        prev = self.head
-        cur = self.head.next
-        while cur is not None:
-            self.note_visit(1)
-            if self.cmp_keys(cur.key, key) == 0:
-                # religa: prev -> cur.next
-                prev.next = cur.next
-                self.note_shift(1)      # prev.next = cur.next
-                if cur is self.tail:
-                    self.tail = prev
-                    self.note_shift(1)  # tail = prev
-                del cur
-                self.length -= 1
-                return True
-            prev = cur
-            cur = cur.next
-
-        return False
+        else:
+            # remover no meio/fim: religa prev -> cur.next
+            self._set_prox(prev, self._prox(cur))
+            self.note_shift(1)          # prev.next = cur.next
+            if cur == self.tail:
+                self.tail = prev
+                self.note_shift(1)      # tail = prev
+        if self._indexado:
+            self._apos_remover(cur, prev, self._pos_ult)
+        if self._freq is not None:
+            self._freq.pop(cur, None)
+        self._descartar(cur)
+        self.length -= 1
+        return True
 
     def _search_impl(self, key: str) -> Optional[Dict[str, Any]]:
         node = self._find_node(key)
-        return node.value if node else None
+        return self._valor(node) if node != self._nil else None
+
+    # =========================
+    # Acesso aos nós (storage='nodes')
+    # =========================
+    def _prox(self, h):
+        return h.next
+    def _set_prox(self, h, nxt) -> None:
+        h.next = nxt
+    def _chave(self, h):
+        return h.key
+    def _valor(self, h):
+        return h.value
+    def _novo(self, key, value):
+        return self._Node(key, value)
+    def _descartar(self, h) -> None:
+        h.next = None
+
+    # =========================
+    # Acesso aos nós (storage='array')
+    # =========================
+    def _prox_arr(self, h: int) -> int:
+        return self._nxt[h]
+    def _set_prox_arr(self, h: int, nxt: int) -> None:
+        self._nxt[h] = nxt
+    def _chave_arr(self, h: int):
+        return self._keys[h]
+    def _valor_arr(self, h: int):
+        return self._vals[h]
+
+    def _novo_arr(self, key, value) -> int:
+        """Aloca um slot em O(1): reaproveita a free-list ou avança no pool."""
+        h = self._livre
+        if h != -1:
+            self._livre = self._nxt[h]
+        else:
+            if self._usados == len(self._keys):
+                self._crescer_pool()
+            h = self._usados
+            self._usados += 1
+        self._keys[h] = key
+        self._vals[h] = value
+        self._nxt[h] = -1
+        return h
+
+    def _descartar_arr(self, h: int) -> None:
+        self._keys[h] = None
+        self._vals[h] = None
+        self._nxt[h] = self._livre
+        self._livre = h
+
+    def _crescer_pool(self) -> None:
+        cap = len(self._keys)
+        self._keys.extend([None] * cap)
+        self._vals.extend([None] * cap)
+        self._nxt.extend(array('l', [-1]) * cap)
+
+    @property
+    def capacidade(self) -> int:
+        """Slots alocados no pool (storage='array') ou nº de nós (storage='nodes')."""
+        return len(self._keys) if self.storage == 'array' else self.length
 
     # =========================
-    # Helpers internos
+    # Helpers internos (varreduras lineares)
     # =========================
-    def _find_node(self, key: str) -> Optional[_Node]:
+    def _find_node(self, key: str):
         """Busca linear; conta visitas e comparações."""
-        cur = self.head
+        return self._localizar(key)[1]
+
+    def _localizar(self, key: str):
+        """Busca linear que devolve (anterior, nó); anterior None se for o head."""
+        prev, cur = None, self.head
         while cur is not None:
             self.note_visit(1)
             if self.cmp_keys(cur.key, key) == 0:
-                return cur
-            cur = cur.next
-        return None
+                return prev, cur
+            prev, cur = cur, cur.next
+        return prev, None
+
+    def _localizar_arr(self, key: str):
+        keys, nxt = self._keys, self._nxt
+        prev, cur = -1, self.head
+        while cur != -1:
+            self.note_visit(1)
+            if self.cmp_keys(keys[cur], key) == 0:
+                return prev, cur
+            prev, cur = cur, nxt[cur]
+        return prev, -1
 
-    def _node_at(self, index: int) -> Optional[_Node]:
+    def _node_at(self, index: int):
         """Retorna nó na posição index (0-based)."""
         if index < 0 or index >= self.length:
             return None
@@ -783,45 +1273,444 @@ class ArrayLinkedList(BaseDataStructure):
             self.note_visit(1)
         return cur
 
-    def _insert_sorted(self, new_node: _Node) -> bool:
+    def _node_at_arr(self, index: int) -> int:
+        if index < 0 or index >= self.length:
+            return -1
+        nxt = self._nxt
+        cur = self.head
+        i = 0
+        while cur != -1 and i < index:
+            self.note_visit(1)
+            cur = nxt[cur]
+            i += 1
+        if cur != -1:
+            self.note_visit(1)
+        return cur
+
+    def _antecessor_ordenado(self, key: str):
+        """A partir do head, avança enquanto o próximo tiver chave < key."""
+        prev = self.head
+        cur = self.head.next
+        while cur is not None and self.cmp_keys(cur.key, key) < 0:
+            self.note_visit(1)
+            prev = cur
+            cur = cur.next
+        return prev
+
+    def _antecessor_ordenado_arr(self, key: str) -> int:
+        keys, nxt = self._keys, self._nxt
+        prev = self.head
+        cur = nxt[prev]
+        while cur != -1 and self.cmp_keys(keys[cur], key) < 0:
+            self.note_visit(1)
+            prev = cur
+            cur = nxt[cur]
+        return prev
+
+    def _insert_sorted(self, new_node) -> bool:
         """Insere mantendo ordem crescente de chave (lexicográfica)."""
+        key = self._chave(new_node)
         # inserir no início?
-        if self.cmp_keys(new_node.key, self.head.key) < 0:
-            new_node.next = self.head
+        if self.cmp_keys(key, self._chave(self.head)) < 0:
+            self._set_prox(new_node, self.head)
             self.note_shift(1)      # new_node.next = head
             self.head = new_node
             self.note_shift(1)      # head = new_node
             self.length += 1
+            if self._indexado:
+                self._apos_inserir(new_node, self._nil, 0)
             return True
 
         # encontrar posição (prev < new <= cur)
-        prev = self.head
-        cur = self.head.next
-        while cur is not None and self.cmp_keys(cur.key, new_node.key) < 0:
-            self.note_visit(1)
-            prev = cur
-            cur = cur.next
+        prev = self._antecessor_ordenado(key)
 
-        new_node.next = prev.next
+        self._set_prox(new_node, self._prox(prev))
         self.note_shift(1)          # new_node.next = prev.next
-        prev.next = new_node
+        self._set_prox(prev, new_node)
         self.note_shift(1)          # prev.next = new_node
-        if prev is self.tail:
+        if prev == self.tail:
             self.tail = new_node
             self.note_shift(1)      # tail = new_node
         self.length += 1
+        if self._indexado:
+            self._apos_inserir(new_node, prev, self._pos_ult + 1)
+        return True
+
+    # =========================
+    # Auto-organização (auto_organizacao)
+    # =========================
+    def _buscar_organizando(self, key: str):
+        """Busca linear que reposiciona o nó encontrado conforme a política."""
+        nil = self._nil
+        politica = self.auto_organizacao
+        freq = self._freq
+        pp, prev, cur, pos = nil, nil, self.head, 0
+        trecho_prev, trecho_pos, trecho_f = nil, 0, None   # início do trecho de mesma contagem
+        f = 0
+        while cur != nil:
+            self.note_visit(1)
+            if freq is not None:
+                f = freq.get(cur, 0)
+                if f != trecho_f:
+                    trecho_prev, trecho_pos, trecho_f = prev, pos, f
+            if self.cmp_keys(self._chave(cur), key) == 0:
+                break
+            pp, prev, cur = prev, cur, self._prox(cur)
+            pos += 1
+        if cur == nil:
+            return nil
+
+        if politica == 'mtf':
+            destino, pos_novo = nil, 0
+        elif politica == 'transpose':
+            destino, pos_novo = pp, max(0, pos - 1)
+        else:
+            freq[cur] = f + 1
+            destino, pos_novo = trecho_prev, trecho_pos
+        if pos_novo < pos:
+            self._mover_apos(cur, prev, pos, destino, pos_novo)
+        return cur
+
+    def _mover_apos(self, cur, prev, pos: int, destino, pos_novo: int) -> None:
+        """Desliga cur (anterior prev) e o religa após destino (NIL = novo head)."""
+        self._set_prox(prev, self._prox(cur))
+        self.note_shift(1)          # prev.next = cur.next
+        if cur == self.tail:
+            self.tail = prev
+            self.note_shift(1)      # tail = prev
+        if self._indexado:
+            self._apos_remover(cur, prev, pos)
+        if destino == self._nil:
+            self._set_prox(cur, self.head)
+            self.head = cur
+        else:
+            self._set_prox(cur, self._prox(destino))
+            self._set_prox(destino, cur)
+        self.note_shift(2)          # cur.next e head/destino.next
+        if self._indexado:
+            self._apos_inserir(cur, destino, pos_novo)
+
+    # =========================
+    # Carga em lote ordenada
+    # =========================
+    def _inserir_lote(self, pares, sorted = False):
+        # sorted=True com sorted_insert -> ordena o lote e intercala (bulk load)
+        if sorted and self.sorted_insert:
+            self.bulk_load(pares)
+        else:
+            super()._inserir_lote(pares, sorted=sorted)
+
+    def bulk_load(self, itens: Iterable[Tuple[str, Dict[str, Any]]]) -> bool:
+        """
+        Insere pares (chave, valor) em O(m log m + n): ordena o lote (comparações
+        contadas) e intercala com a lista atual em uma passada, religando os nós.
+        Exige sorted_insert=True; registra uma operação 'bulk_load'.
+        """
+        if not self.sorted_insert:
+            raise ValueError("bulk_load exige sorted_insert=True")
+        return self._instrument("bulk_load", None,
+                                lambda: self._bulk_load_impl([(self._enc(k), v) for k, v in itens]))
+
+    def _bulk_load_impl(self, itens: List[Tuple[str, Dict[str, Any]]]) -> bool:
+        nil = self._nil
+        # ordenação estável: duplicatas do lote mantêm a ordem de chegada
+        lote = builtins.sorted(((k, v, i) for i, (k, v) in enumerate(itens)),
+                               key=functools.cmp_to_key(lambda a, b: self.cmp_keys(a[0], b[0])))
+
+        # Intercalação. Para reproduzir as inserções sequenciais com duplicatas:
+        # uma chave nova entra antes do seu grupo de iguais, exceto quando o
+        # grupo está no head (nenhuma chave menor na lista naquele momento),
+        # caso em que entra logo após o head.
+        saida: List[Any] = []
+        existe_menor = False          # já houve nó existente com chave menor
+        menor_idx = len(lote)         # menor ordem de chegada entre chaves menores do lote
+        cur, i, m = self.head, 0, len(lote)
+        while i < m or cur != nil:
+            if i < m and (cur == nil or self.cmp_keys(lote[i][0], self._chave(cur)) <= 0):
+                k = lote[i][0]
+            else:
+                k = self._chave(cur)
+            grupo: List[Any] = []
+            while cur != nil and self.cmp_keys(self._chave(cur), k) == 0:
+                self.note_visit(1)
+                grupo.append(cur)
+                cur = self._prox(cur)
+            tinha_existentes = bool(grupo)
+            primeiro_idx = menor_idx
+            while i < m and self.cmp_keys(lote[i][0], k) == 0:
+                key, value, idx = lote[i]
+                h = self._novo(key, value)
+                if not grupo or existe_menor or menor_idx < idx:
+                    grupo.insert(0, h)
+                else:
+                    grupo.insert(1, h)
+                primeiro_idx = min(primeiro_idx, idx)
+                i += 1
+            saida.extend(grupo)
+            existe_menor = existe_menor or tinha_existentes
+            menor_idx = primeiro_idx
+
+        # religa a lista na ordem final
+        self.head = saida[0] if saida else nil
+        self.note_shift(1)                  # head
+        for a, b in zip(saida, saida[1:]):
+            self._set_prox(a, b)
+        self.note_shift(max(0, len(saida) - 1))
+        if saida:
+            self._set_prox(saida[-1], nil)
+            self.note_shift(1)
+        self.tail = saida[-1] if saida else nil
+        self.note_shift(1)                  # tail
+        self.length = len(saida)
+
+        if self.hash_index:
+            self._idx_chave, self._idx_ant = {}, {}
+            ant = nil
+            for h in saida:
+                self._idx_chave.setdefault(self._chave(h), []).append(h)
+                self._idx_ant[h] = ant
+                ant = h
+            self.note_extra_soma("hash_updates", 2 * len(saida))
+        if self.skip_index:
+            self._skip_reconstruir()
         return True
 
+    # =========================
+    # Índice de âncoras (skip_index)
+    # =========================
+    def _apos_inserir(self, h, prev, pos: int) -> None:
+        """Atualiza os índices auxiliares após ligar o nó h na posição pos."""
+        if self.hash_index:
+            self._hash_inserido(h, prev, pos)
+        if self.skip_index:
+            self._skip_inserido(h, pos)
+
+    def _apos_remover(self, h, prev, pos: int) -> None:
+        """Atualiza os índices auxiliares após desligar o nó h (que estava em pos)."""
+        if self.hash_index:
+            self._hash_removido(h, prev)
+        if self.skip_index:
+            self._skip_removido(h, prev, pos)
+
+    def _skip_reconstruir(self) -> None:
+        """Recria as âncoras a cada isqrt(n) nós; O(n), amortizado pelo fator 4 de gatilho."""
+        passo = max(1, math.isqrt(self.length))
+        self._anc_h, self._anc_pos, self._anc_key = [], [], []
+        cur, i = self.head, 0
+        while cur != self._nil:
+            if i % passo == 0:
+                self._anc_h.append(cur)
+                self._anc_pos.append(i)
+                self._anc_key.append(self._chave(cur))
+            cur = self._prox(cur)
+            i += 1
+        self._anc_passo = passo
+        self._anc_n = self.length
+        self.note_extra_soma("skip_updates", self.length)
+
+    def _skip_verificar_densidade(self) -> bool:
+        """Reconstrói se n mudou 4x desde a última reconstrução."""
+        n, base = self.length, max(self._anc_n, 4)
+        if n >= 4 * base or 4 * n < self._anc_n:
+            self._skip_reconstruir()
+            return True
+        return False
+
+    def _skip_inserido(self, h, pos: int) -> None:
+        if self._skip_verificar_densidade():
+            return
+        anc_pos = self._anc_pos
+        if not anc_pos:
+            self._anc_h, self._anc_pos, self._anc_key = [h], [0], [self._chave(h)]
+            self.note_extra_soma("skip_updates", 1)
+            return
+        if pos == 0:
+            # novo head vira a âncora 0; o head antigo passa a pertencer ao 1º intervalo
+            self._anc_h[0] = h
+            self._anc_key[0] = self._chave(h)
+            inicio = 1
+        else:
+            inicio = bisect.bisect_left(anc_pos, pos)
+        for j in range(inicio, len(anc_pos)):
+            anc_pos[j] += 1
+        self.note_extra_soma("skip_updates", len(anc_pos) - inicio + (1 if pos == 0 else 0))
+
+        # divide o intervalo que recebeu o nó se ficou maior que 2 * passo
+        dono = max(0, inicio - 1)
+        fim = anc_pos[dono + 1] if dono + 1 < len(anc_pos) else self.length
+        passo = self._anc_passo
+        if fim - anc_pos[dono] > 2 * passo:
+            cur = self._anc_h[dono]
+            for _ in range(passo):
+                cur = self._prox(cur)
+            self._anc_h.insert(dono + 1, cur)
+            anc_pos.insert(dono + 1, anc_pos[dono] + passo)
+            self._anc_key.insert(dono + 1, self._chave(cur))
+            self.note_extra_soma("skip_updates", passo)
+
+    def _skip_removido(self, h, prev, pos: int) -> None:
+        anc_pos = self._anc_pos
+        prox = self._prox(h)
+        i = bisect.bisect_left(anc_pos, pos)
+        inicio = i
+        if i < len(anc_pos) and anc_pos[i] == pos:
+            # h era âncora: o sucessor herda a âncora, a menos que já seja a próxima
+            if prox != self._nil and (i + 1 == len(anc_pos) or anc_pos[i + 1] != pos + 1):
+                self._anc_h[i] = prox
+                self._anc_key[i] = self._chave(prox)
+                inicio = i + 1
+            else:
+                del self._anc_h[i], anc_pos[i], self._anc_key[i]
+        for j in range(inicio, len(anc_pos)):
+            anc_pos[j] -= 1
+        self.note_extra_soma("skip_updates", len(anc_pos) - i + 1)
+        self._skip_verificar_densidade()
+
+    def _ancora_antes(self, key: str) -> int:
+        """Índice da última âncora com chave < key (-1 se nenhuma); busca binária contada."""
+        lo, hi = 0, len(self._anc_key)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.cmp_keys(self._anc_key[mid], key) < 0:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo - 1
+
+    def _node_at_skip(self, index: int):
+        if index < 0 or index >= self.length:
+            return self._nil
+        i = bisect.bisect_right(self._anc_pos, index) - 1
+        cur = self._anc_h[i]
+        for _ in range(index - self._anc_pos[i]):
+            self.note_visit(1)
+            cur = self._prox(cur)
+        self.note_visit(1)
+        return cur
+
+    def _antecessor_ordenado_skip(self, key: str):
+        """Como _antecessor_ordenado, partindo da última âncora com chave < key."""
+        a = self._ancora_antes(key)
+        if a < 0:
+            prev, pos = self.head, 0
+        else:
+            prev, pos = self._anc_h[a], self._anc_pos[a]
+        cur = self._prox(prev)
+        while cur != self._nil and self.cmp_keys(self._chave(cur), key) < 0:
+            self.note_visit(1)
+            prev, cur = cur, self._prox(cur)
+            pos += 1
+        self._pos_ult = pos
+        return prev
+
+    def _localizar_skip(self, key: str):
+        """Localiza (anterior, nó) registrando a posição em _pos_ult.
+
+        Com sorted_insert parte da âncora e para no primeiro nó com chave maior;
+        sem ordenação a varredura continua linear a partir do head.
+        """
+        nil = self._nil
+        prev, cur, pos = nil, self.head, 0
+        if self.sorted_insert and self._anc_key:
+            a = self._ancora_antes(key)
+            if a >= 0:
+                prev, pos = self._anc_h[a], self._anc_pos[a] + 1
+                cur = self._prox(prev)
+        while cur != nil:
+            self.note_visit(1)
+            c = self.cmp_keys(self._chave(cur), key)
+            if c == 0:
+                self._pos_ult = pos
+                return prev, cur
+            if c > 0 and self.sorted_insert:
+                break
+            prev, cur = cur, self._prox(cur)
+            pos += 1
+        return prev, nil
+
+    # =========================
+    # Índice hash (hash_index)
+    # =========================
+    def _hash_inserido(self, h, prev, pos: int) -> None:
+        nil = self._nil
+        key = self._chave(h)
+        nxt = self._prox(h)
+        self._idx_ant[h] = prev
+        escritas = 2
+        if nxt != nil:
+            self._idx_ant[nxt] = h
+            escritas += 1
+        grupo = self._idx_chave.get(key)
+        if grupo is None:
+            self._idx_chave[key] = [h]
+        elif pos == 0:
+            grupo.insert(0, h)
+        elif h == self.tail:
+            grupo.append(h)
+        elif prev != nil and self._chave(prev) == key:
+            grupo.insert(grupo.index(prev) + 1, h)
+        elif nxt != nil and self._chave(nxt) == key:
+            grupo.insert(grupo.index(nxt), h)
+        else:
+            grupo.insert(self._hash_posicao_no_grupo(grupo, key, prev, nxt), h)
+        self.note_extra_soma("hash_updates", escritas)
+
+    def _hash_posicao_no_grupo(self, grupo, key, ant, prox) -> int:
+        """
+        Índice em grupo de um nó inserido entre ant e prox (ambos de outra chave):
+        anda para os dois lados ao mesmo tempo até a duplicata mais próxima ou uma ponta.
+        """
+        nil = self._nil
+        while True:
+            if ant == nil:
+                return 0                    # nenhuma duplicata antes: vira a primeira
+            if prox == nil:
+                return len(grupo)           # nenhuma duplicata depois: vira a última
+            self.note_visit(2)
+            if self._chave(ant) == key:
+                return grupo.index(ant) + 1
+            if self._chave(prox) == key:
+                return grupo.index(prox)
+            ant, prox = self._idx_ant[ant], self._prox(prox)
+
+    def _hash_removido(self, h, prev) -> None:
+        nxt = self._prox(h)
+        escritas = 2
+        if nxt != self._nil:
+            self._idx_ant[nxt] = prev
+            escritas += 1
+        del self._idx_ant[h]
+        key = self._chave(h)
+        grupo = self._idx_chave[key]
+        grupo.remove(h)
+        if not grupo:
+            del self._idx_chave[key]
+        self.note_extra_soma("hash_updates", escritas)
+
+    def _localizar_hash(self, key: str):
+        """(anterior, nó) da primeira ocorrência de key via índice: O(1)."""
+        self.note_probe(1)
+        grupo = self._idx_chave.get(key)
+        if not grupo:
+            return self._nil, self._nil
+        h = grupo[0]
+        self.note_visit(1)
+        return self._idx_ant[h], h
+
+    def _find_node_hash(self, key: str):
+        return self._localizar_hash(key)[1]
+
     # =========================
     # Utilidades opcionais
     # =========================
     def to_list(self) -> list[tuple[str, Dict[str, Any]]]:
         """Exporta como lista [(key, value), ...] (útil p/ depuração)."""
         out = []
+        nil = self._nil
         cur = self.head
-        while cur is not None:
-            out.append((cur.key, cur.value))
-            cur = cur.next
+        while cur != nil:
+            out.append((self._dec(self._chave(cur)), self._valor(cur)))
+            cur = self._prox(cur)
         return out
 
 ##########################################################################################    
@@ -1030,7 +1919,7 @@ class AVLTreeDS(BaseDataStructure):
         if node is None:
             return
         yield from self._inorder(node.left)
-        yield (node.key, node.value)
+        yield (self._dec(node.key), node.value)
         yield from self._inorder(node.right)
     
 ##########################################################################################    
@@ -1045,6 +1934,7 @@ class HashTableDS(BaseDataStructure):
     Parâmetros:
       - M: tamanho da tabela (ex.: 100, 1000, 5000)
       - hash_fn: "poly31" | "fnv1a" | "djb2"
+        (com codec, as chaves chegam como int e usam hashing multiplicativo)
     """
 
     # ---------------------------
@@ -1116,7 +2006,14 @@ class HashTableDS(BaseDataStructure):
             h &= 0xffffffffffffffff
         return h
 
+    @staticmethod
+    def _hash_int(x: int) -> int:
+        # hashing multiplicativo (Fibonacci) de 64 bits: chaves int vindas do codec
+        return ((x * 0x9E3779B97F4A7C15) & 0xffffffffffffffff) >> 32
+
     def _idx1(self, key: str) -> int:
+        if type(key) is int:
+            return self._hash_int(key) % self.M
         return self._hash1(key) % self.M
 
     # ---------------------------
@@ -0,0 +1,273 @@
+# util_estrutura_array.py
+from __future__ import annotations
+from typing import Any, Dict, Optional, List, Tuple, Iterator
+import math
+
+from util_estrutura import BaseDataStructure
+
+
+class SortedArrayDS(BaseDataStructure):
+    """
+    Array dinâmico ordenado (listas paralelas de chaves e valores) com busca binária.
+
+    - Chave: matrícula (str)
+    - Valor: dicionário do funcionário
+
+    Contraponto contíguo às listas ligadas e árvores: busca O(log n) e inserção/
+    remoção O(n) em movimentação de elementos. Chave repetida atualiza o valor.
+
+    Layouts (parâmetro layout):
+      - 'plain'  -> um único array; inserir/remover no índice i desloca n - i elementos
+      - 'gap'    -> gap buffer: um buraco livre acompanha a última posição editada;
+                    edições próximas umas das outras deslocam só a distância até o gap
+      - 'tiered' -> array em blocos de até ~2*sqrt(n) elementos (índice de primeiras
+                    chaves + blocos ordenados); cada edição desloca só dentro de um
+                    bloco, O(sqrt n)
+
+    Métricas:
+      - comparisons: cada sondagem da busca binária (via cmp_keys)
+      - shifts: elementos efetivamente movidos para abrir/fechar espaço
+      - extras: resize_moves (elementos copiados ao realocar o gap buffer),
+                block_splits (blocos divididos no layout 'tiered')
+    """
+
+    def __init__(self, layout: str = 'plain', capacidade: int = 16, **params: Any) -> None:
+        if layout not in ('plain', 'gap', 'tiered'):
+            raise ValueError("layout deve ser 'plain', 'gap' ou 'tiered'")
+        super().__init__(f"SortedArray({layout})", layout=layout, **params)
+        self.layout = layout
+        self.length = 0
+        self._metricas_ignorar = {
+            'node_visits', 'rotations', 'probes', 'swaps', 'hash_collisions',
+            'hash_bucket_len_after', 'hash_cluster_len', 'hash_displacement'
+        }
+
+        if layout == 'plain':
+            self._keys: List[Any] = []
+            self._vals: List[Optional[Dict[str, Any]]] = []
+        elif layout == 'gap':
+            cap = max(1, int(capacidade))
+            self._keys = [None] * cap
+            self._vals = [None] * cap
+            self._g = 0            # início do gap (posição física)
+            self._ge = cap         # fim do gap (exclusivo)
+            self._localizar, self._inserir_em, self._remover_em = \
+                self._localizar_gap, self._inserir_em_gap, self._remover_em_gap
+            self._valor_em, self._set_valor = self._valor_em_gap, self._set_valor_gap
+        else:
+            self._blocos_k: List[List[Any]] = []
+            self._blocos_v: List[List[Optional[Dict[str, Any]]]] = []
+            self._primeiras: List[Any] = []    # primeira chave de cada bloco
+            self._localizar, self._inserir_em, self._remover_em = \
+                self._localizar_tiered, self._inserir_em_tiered, self._remover_em_tiered
+            self._valor_em, self._set_valor = self._valor_em_tiered, self._set_valor_tiered
+
+    # ----------------------------
+    # Implementações exigidas pela Base
+    # ----------------------------
+    def _insert_impl(self, key: str, value: Dict[str, Any]) -> bool:
+        pos, achou = self._localizar(key)
+        if achou:
+            self._set_valor(pos, value)
+            return True
+        self._inserir_em(pos, key, value)
+        self.length += 1
+        return True
+
+    def _remove_impl(self, key: str) -> bool:
+        pos, achou = self._localizar(key)
+        if not achou:
+            return False
+        self._remover_em(pos)
+        self.length -= 1
+        return True
+
+    def _search_impl(self, key: str) -> Optional[Dict[str, Any]]:
+        pos, achou = self._localizar(key)
+        return self._valor_em(pos) if achou else None
+
+    # ----------------------------
+    # Busca binária contada
+    # ----------------------------
+    def _bisect(self, chaves, lo: int, hi: int, key: Any, fisica=None) -> Tuple[int, bool]:
+        """Retorna (índice, achou): índice da chave ou do ponto de inserção em [lo, hi)."""
+        while lo < hi:
+            mid = (lo + hi) // 2
+            c = self.cmp_keys(chaves[fisica(mid) if fisica else mid], key)
+            if c < 0:
+                lo = mid + 1
+            elif c > 0:
+                hi = mid
+            else:
+                return mid, True
+        return lo, False
+
+    # ----------------------------
+    # Layout 'plain'
+    # ----------------------------
+    def _localizar(self, key: Any) -> Tuple[int, bool]:
+        return self._bisect(self._keys, 0, len(self._keys), key)
+
+    def _inserir_em(self, i: int, key: Any, value: Dict[str, Any]) -> None:
+        self._keys.insert(i, key)
+        self._vals.insert(i, value)
+        self.note_shift(len(self._keys) - 1 - i)
+
+    def _remover_em(self, i: int) -> None:
+        del self._keys[i]
+        del self._vals[i]
+        self.note_shift(len(self._keys) - i)
+
+    def _valor_em(self, i: int) -> Optional[Dict[str, Any]]:
+        return self._vals[i]
+
+    def _set_valor(self, i: int, value: Dict[str, Any]) -> None:
+        self._vals[i] = value
+
+    # ----------------------------
+    # Layout 'gap' (índices lógicos; o gap fica entre _g e _ge)
+    # ----------------------------
+    def _fisica(self, i: int) -> int:
+        return i if i < self._g else i + (self._ge - self._g)
+
+    def _localizar_gap(self, key: Any) -> Tuple[int, bool]:
+        return self._bisect(self._keys, 0, self.length, key, self._fisica)
+
+    def _mover_gap(self, i: int) -> None:
+        """Leva o início do gap para a posição lógica i, movendo os elementos entre eles."""
+        g, ge = self._g, self._ge
+        if i < g:
+            n = g - i
+            self._keys[ge - n:ge] = self._keys[i:g]
+            self._vals[ge - n:ge] = self._vals[i:g]
+            livre = (i, min(g, ge - n))        # origem que não foi sobrescrita
+            self._g, self._ge = i, ge - n
+        elif i > g:
+            n = i - g
+            self._keys[g:i] = self._keys[ge:ge + n]
+            self._vals[g:i] = self._vals[ge:ge + n]
+            livre = (max(ge, i), ge + n)
+            self._g, self._ge = i, ge + n
+        else:
+            return
+        a, b = livre
+        if a < b:
+            self._keys[a:b] = [None] * (b - a)
+            self._vals[a:b] = [None] * (b - a)
+        self.note_shift(n)
+
+    def _crescer_gap(self) -> None:
+        """Dobra a capacidade; o novo espaço vira gap na posição atual."""
+        cap = len(self._keys)
+        extra = max(1, cap)
+        self._keys[self._g:self._g] = [None] * extra
+        self._vals[self._g:self._g] = [None] * extra
+        self._ge += extra
+        self.note_extra("resize_moves", cap - self._g)
+
+    def _inserir_em_gap(self, i: int, key: Any, value: Dict[str, Any]) -> None:
+        if self._g == self._ge:
+            self._crescer_gap()
+        self._mover_gap(i)
+        self._keys[self._g] = key
+        self._vals[self._g] = value
+        self._g += 1
+
+    def _remover_em_gap(self, i: int) -> None:
+        self._mover_gap(i)
+        self._keys[self._ge] = None
+        self._vals[self._ge] = None
+        self._ge += 1
+
+    def _valor_em_gap(self, i: int) -> Optional[Dict[str, Any]]:
+        return self._vals[self._fisica(i)]
+
+    def _set_valor_gap(self, i: int, value: Dict[str, Any]) -> None:
+        self._vals[self._fisica(i)] = value
+
+    # ----------------------------
+    # Layout 'tiered' (posição = (bloco, índice no bloco))
+    # ----------------------------
+    def _limite_bloco(self) -> int:
+        return max(32, 2 * math.isqrt(self.length))
+
+    def _localizar_tiered(self, key: Any) -> Tuple[Tuple[int, int], bool]:
+        if not self._primeiras:
+            return (0, 0), False
+        b, achou = self._bisect(self._primeiras, 0, len(self._primeiras), key)
+        if achou:
+            return (b, 0), True
+        b = max(0, b - 1)        # último bloco com primeira chave < key
+        j, achou = self._bisect(self._blocos_k[b], 1, len(self._blocos_k[b]), key) \
+            if self.cmp_keys(self._primeiras[b], key) < 0 else (0, False)
+        return (b, j), achou
+
+    def _inserir_em_tiered(self, pos: Tuple[int, int], key: Any, value: Dict[str, Any]) -> None:
+        b, j = pos
+        if not self._blocos_k:
+            self._blocos_k.append([key])
+            self._blocos_v.append([value])
+            self._primeiras.append(key)
+            return
+        bk, bv = self._blocos_k[b], self._blocos_v[b]
+        bk.insert(j, key)
+        bv.insert(j, value)
+        self.note_shift(len(bk) - 1 - j)
+        if j == 0:
+            self._primeiras[b] = key
+        if len(bk) > self._limite_bloco():
+            meio = len(bk) // 2
+            self._blocos_k.insert(b + 1, bk[meio:])
+            self._blocos_v.insert(b + 1, bv[meio:])
+            self._primeiras.insert(b + 1, bk[meio])
+            del bk[meio:], bv[meio:]
+            self.note_shift(len(self._blocos_k[b + 1]))
+            self.note_extra("block_splits", 1)
+
+    def _remover_em_tiered(self, pos: Tuple[int, int]) -> None:
+        b, j = pos
+        bk, bv = self._blocos_k[b], self._blocos_v[b]
+        del bk[j], bv[j]
+        self.note_shift(len(bk) - j)
+        if not bk:
+            del self._blocos_k[b], self._blocos_v[b], self._primeiras[b]
+        elif j == 0:
+            self._primeiras[b] = bk[0]
+
+    def _valor_em_tiered(self, pos: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        return self._blocos_v[pos[0]][pos[1]]
+
+    def _set_valor_tiered(self, pos: Tuple[int, int], value: Dict[str, Any]) -> None:
+        self._blocos_v[pos[0]][pos[1]] = value
+
+    # ----------------------------
+    # Utilidades opcionais
+    # ----------------------------
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Percorre os pares em ordem crescente de chave."""
+        dec = self._dec
+        if self.layout == 'plain':
+            for k, v in zip(self._keys, self._vals):
+                yield dec(k), v
+        elif self.layout == 'gap':
+            for i in range(self.length):
+                f = self._fisica(i)
+                yield dec(self._keys[f]), self._vals[f]
+        else:
+            for bk, bv in zip(self._blocos_k, self._blocos_v):
+                for k, v in zip(bk, bv):
+                    yield dec(k), v
+
+    def to_list(self) -> list[tuple[str, Dict[str, Any]]]:
+        """Exporta como lista [(key, value), ...] (útil p/ depuração)."""
+        return list(self.items())
+
+
+if __name__ == '__main__':
+    # Teste básico das funcionalidades
+    for layout in ('plain', 'gap', 'tiered'):
+        ds = SortedArrayDS(layout=layout)
+        ds.carregar_dados(1000)
+        ds.buscar_dados(250)
+        ds.remover_dados(100)
+        ds.print_summary('sum')
@@ -0,0 +1,602 @@
+# util_estrutura_bplus.py
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Dict, Optional, List, Tuple, Iterable, Iterator
+import builtins
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+from util_estrutura import BaseDataStructure
+
+# -----------------------------
+# Layout das páginas em disco
+# -----------------------------
+# Página 0 (cabeçalho do arquivo):
+#   magic(8s) page_size(I) key_size(I) root(I) n_pages(I) heap_pid(I) n_items(Q)
+# Demais páginas:
+#   tipo(B) pad(x) n(H) prox(I)  -> 8 bytes de cabeçalho
+#   FOLHA  : n entradas [chave(key_size) heap_pid(I) heap_off(H) heap_len(H)]
+#   INTERNA: filho0(I) + n entradas [chave(key_size) filho(I)]
+#   HEAP   : n = bytes ocupados; registros JSON a partir do offset 8
+_MAGIC = b"BPTREE01"
+_HDR_ARQUIVO = struct.Struct("<8sIIIIIQ")
+_HDR_PAGINA = struct.Struct("<BxHI")
+
+FOLHA = 1
+INTERNA = 2
+HEAP = 3
+
+
+class _Pagina:
+    """Página decodificada mantida no buffer pool."""
+    __slots__ = ("pid", "tipo", "chaves", "vals", "prox", "dados", "usado", "suja")
+
+    def __init__(self, pid: int, tipo: int) -> None:
+        self.pid = pid
+        self.tipo = tipo
+        self.chaves: List[str] = []
+        self.vals: List[Any] = []     # folha: (heap_pid, off, len) | interna: pids dos filhos
+        self.prox: int = 0            # folha: próxima folha (0 = nenhuma)
+        self.dados: Optional[bytearray] = None  # heap: conteúdo bruto da página
+        self.usado: int = 0           # heap: bytes ocupados
+        self.suja: bool = False
+
+
+class BPlusTreeDiskDS(BaseDataStructure):
+    """
+    Árvore B+ paginada em disco (arquivo único acessado via mmap).
+
+    - Chave: matrícula (str), gravada com largura fixa (key_size bytes)
+    - Valor: dicionário do funcionário, serializado em JSON em páginas de heap
+
+    Estrutura:
+      - páginas de tamanho fixo (page_size); página 0 guarda o cabeçalho
+      - folhas encadeadas (prox) permitindo varredura ordenada
+      - buffer pool pequeno (pool_pages) com descarte LRU; páginas sujas
+        são gravadas no mmap apenas quando descartadas ou no flush()
+      - bulk_load() monta a árvore de baixo para cima a partir de dados ordenados
+
+    Observações:
+      - chave repetida atualiza o valor (upsert)
+      - remoção não faz fusão/redistribuição de páginas e não recupera o espaço
+        do heap (páginas podem ficar subocupadas, como em muitos SGBDs)
+
+    Métricas:
+      - comparisons: via cmp_keys na busca binária dentro das páginas
+      - node_visits: páginas da árvore percorridas
+      - shifts: entradas deslocadas dentro das páginas (inserção, remoção e splits)
+      - extras por operação: page_reads, page_writes, buffer_hits,
+        buffer_misses e buffer_hit_rate
+    """
+
+    def __init__(
+        self,
+        arquivo: Optional[str] = None,
+        page_size: int = 4096,
+        pool_pages: int = 64,
+        key_size: int = 16,
+        **params: Any,
+    ) -> None:
+        nome = f"BPlusTreeDisk(ps={page_size}|pool={pool_pages})"
+        super().__init__(nome, page_size=page_size, pool_pages=pool_pages, key_size=key_size, **params)
+        if self._codec is not None:
+            raise ValueError("BPlusTreeDiskDS grava as chaves como texto; codec não é suportado")
+
+        assert page_size >= 256, "page_size deve ser >= 256"
+        # ocupação da página e offset/tamanho dos registros são gravados como uint16
+        assert page_size <= 0xFFFF, "page_size deve ser <= 65535"
+        assert pool_pages >= 4, "pool_pages deve ser >= 4"
+        self.page_size = int(page_size)
+        self.pool_pages = int(pool_pages)
+        self.key_size = int(key_size)
+
+        # capacidades por página
+        self._ent_folha = struct.Struct(f"<{self.key_size}sIHH")
+        self._ent_interna = struct.Struct(f"<{self.key_size}sI")
+        self.cap_folha = (self.page_size - _HDR_PAGINA.size) // self._ent_folha.size
+        self.cap_interna = (self.page_size - _HDR_PAGINA.size - 4) // self._ent_interna.size
+        assert self.cap_folha >= 3 and self.cap_interna >= 3, "page_size pequeno demais para key_size"
+
+        # buffer pool (LRU) e páginas fixadas durante a operação corrente
+        self._pool: "OrderedDict[int, _Pagina]" = OrderedDict()
+        self._fixadas: set = set()
+
+        # totais de E/S
+        self.page_reads = 0
+        self.page_writes = 0
+        self.buffer_hits = 0
+        self.buffer_misses = 0
+        self.evictions = 0
+
+        # arquivo
+        self._temporario = arquivo is None
+        if arquivo is None:
+            fd, arquivo = tempfile.mkstemp(suffix=".bpt")
+            os.close(fd)
+        self.arquivo = arquivo
+        existente = os.path.isfile(arquivo) and os.path.getsize(arquivo) >= self.page_size
+        self._f = open(arquivo, "r+b" if existente else "w+b")
+        if not existente:
+            self._f.truncate(self.page_size * 16)
+        self._mm = mmap.mmap(self._f.fileno(), 0)
+
+        if existente and self._ler_cabecalho():
+            pass
+        else:
+            self._root = 0
+            self._n_pages = 1
+            self._heap_pid = 0
+            self.n_items = 0
+            raiz = self._nova_pagina(FOLHA)
+            self._root = raiz.pid
+            self._liberar()
+            self._gravar_cabecalho()
+
+        self._metricas_ignorar = {
+            'rotations', 'probes', 'hash_collisions', 'hash_bucket_len_after',
+            'hash_cluster_len', 'hash_displacement'
+        }
+
+    # ----------------------------
+    # Implementações exigidas pela Base
+    # ----------------------------
+    def _insert_impl(self, key: str, value: Dict[str, Any]) -> bool:
+        io = self._io_inicio()
+        try:
+            folha, caminho = self._descer(key)
+            ref = self._gravar_registro(value)
+            i = self._bisect_left(folha.chaves, key)
+            if i < len(folha.chaves) and self.cmp_keys(folha.chaves[i], key) == 0:
+                # upsert: apenas troca a referência do registro
+                folha.vals[i] = ref
+                self._marcar_suja(folha)
+                return True
+            self.note_shift(len(folha.chaves) - i)
+            folha.chaves.insert(i, key)
+            folha.vals.insert(i, ref)
+            self._marcar_suja(folha)
+            self.n_items += 1
+            if len(folha.chaves) > self.cap_folha:
+                self._split_folha(folha, caminho)
+            return True
+        finally:
+            self._io_fim(io)
+
+    def _remove_impl(self, key: str) -> bool:
+        io = self._io_inicio()
+        try:
+            folha, _ = self._descer(key)
+            i = self._bisect_left(folha.chaves, key)
+            if i < len(folha.chaves) and self.cmp_keys(folha.chaves[i], key) == 0:
+                del folha.chaves[i]
+                del folha.vals[i]
+                self.note_shift(len(folha.chaves) - i)
+                self._marcar_suja(folha)
+                self.n_items -= 1
+                return True
+            return False
+        finally:
+            self._io_fim(io)
+
+    def _search_impl(self, key: str) -> Optional[Dict[str, Any]]:
+        io = self._io_inicio()
+        try:
+            folha, _ = self._descer(key)
+            i = self._bisect_left(folha.chaves, key)
+            if i < len(folha.chaves) and self.cmp_keys(folha.chaves[i], key) == 0:
+                return self._ler_registro(folha.vals[i])
+            return None
+        finally:
+            self._io_fim(io)
+
+    def _inserir_lote(self, pares, sorted = False):
+        # sorted=True -> carga em lote (bulk load) a partir dos dados ordenados
+        if sorted and self.n_items == 0:
+            self.bulk_load(builtins.sorted(pares, key=lambda p: p[0]))
+        else:
+            super()._inserir_lote(pares, sorted=sorted)
+
+    # ----------------------------
+    # Bulk load
+    # ----------------------------
+    def bulk_load(self, itens: Iterable[Tuple[str, Dict[str, Any]]], fill_factor: float = 0.9) -> bool:
+        """
+        Monta a árvore a partir de pares (chave, valor) em ordem crescente.
+        Só pode ser usado com a árvore vazia; registra uma operação 'bulk_load'.
+        """
+        if self.n_items != 0:
+            raise ValueError("bulk_load exige a árvore vazia")
+        if not (0.0 < fill_factor <= 1.0):
+            raise ValueError("fill_factor deve estar em (0, 1]")
+        return self._instrument("bulk_load", None, lambda: self._bulk_load_impl(itens, fill_factor))
+
+    def _bulk_load_impl(self, itens: Iterable[Tuple[str, Dict[str, Any]]], fill_factor: float) -> bool:
+        io = self._io_inicio()
+        try:
+            por_folha = max(1, int(self.cap_folha * fill_factor))
+            por_interna = max(2, int((self.cap_interna + 1) * fill_factor))
+
+            # 1) folhas: reaproveita a raiz vazia como primeira folha
+            nivel: List[Tuple[str, int]] = []   # (primeira chave, pid)
+            folha = self._get_page(self._root)
+            anterior: Optional[str] = None
+            n = 0
+            for key, value in itens:
+                if anterior is not None and self.cmp_keys(anterior, key) > 0:
+                    raise ValueError("bulk_load exige chaves em ordem crescente")
+                anterior = key
+                if len(folha.chaves) >= por_folha:
+                    nova = self._nova_pagina(FOLHA)
+                    folha.prox = nova.pid
+                    self._marcar_suja(folha)
+                    self._descartar_fixada(folha)
+                    folha = nova
+                if not folha.chaves:
+                    nivel.append((key, folha.pid))
+                folha.chaves.append(key)
+                folha.vals.append(self._gravar_registro(value))
+                self._marcar_suja(folha)
+                n += 1
+            self.n_items = n
+            if not nivel:
+                return True
+
+            # 2) níveis internos, de baixo para cima
+            while len(nivel) > 1:
+                superior: List[Tuple[str, int]] = []
+                grupos = [nivel[ini:ini + por_interna] for ini in range(0, len(nivel), por_interna)]
+                # evita um último nó interno com um único filho: junta ao grupo anterior se
+                # couber na página (fill_factor < 1), senão divide os dois grupos ao meio
+                if len(grupos) > 1 and len(grupos[-1]) == 1:
+                    juntos = grupos[-2] + grupos.pop()
+                    if len(juntos) <= self.cap_interna + 1:
+                        grupos[-1] = juntos
+                    else:
+                        meio = len(juntos) // 2
+                        grupos[-1:] = [juntos[:meio], juntos[meio:]]
+                for grupo in grupos:
+                    pg = self._nova_pagina(INTERNA)
+                    pg.vals = [pid for _, pid in grupo]
+                    pg.chaves = [k for k, _ in grupo[1:]]
+                    self._marcar_suja(pg)
+                    superior.append((grupo[0][0], pg.pid))
+                    self._descartar_fixada(pg)
+                nivel = superior
+            self._root = nivel[0][1]
+            self._gravar_cabecalho()
+            return True
+        finally:
+            self._io_fim(io)
+
+    # ----------------------------
+    # Navegação e splits
+    # ----------------------------
+    def _descer(self, key: str) -> Tuple[_Pagina, List[Tuple[_Pagina, int]]]:
+        """Desce da raiz até a folha; retorna a folha e o caminho (página, índice do filho)."""
+        caminho: List[Tuple[_Pagina, int]] = []
+        pg = self._get_page(self._root)
+        self.note_visit(1)
+        while pg.tipo == INTERNA:
+            i = self._bisect_right(pg.chaves, key)
+            caminho.append((pg, i))
+            pg = self._get_page(pg.vals[i])
+            self.note_visit(1)
+        return pg, caminho
+
+    def _bisect_left(self, chaves: List[str], key: str) -> int:
+        lo, hi = 0, len(chaves)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.cmp_keys(chaves[mid], key) < 0:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _bisect_right(self, chaves: List[str], key: str) -> int:
+        lo, hi = 0, len(chaves)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.cmp_keys(key, chaves[mid]) < 0:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _split_folha(self, folha: _Pagina, caminho: List[Tuple[_Pagina, int]]) -> None:
+        meio = len(folha.chaves) // 2
+        direita = self._nova_pagina(FOLHA)
+        direita.chaves = folha.chaves[meio:]
+        direita.vals = folha.vals[meio:]
+        del folha.chaves[meio:]
+        del folha.vals[meio:]
+        self.note_shift(len(direita.chaves))
+        direita.prox = folha.prox
+        folha.prox = direita.pid
+        self._marcar_suja(folha)
+        self._marcar_suja(direita)
+        self._inserir_no_pai(folha, direita.chaves[0], direita, caminho)
+
+    def _inserir_no_pai(self, esquerda: _Pagina, sep: str, direita: _Pagina,
+                        caminho: List[Tuple[_Pagina, int]]) -> None:
+        if not caminho:
+            # split da raiz: nova raiz interna
+            raiz = self._nova_pagina(INTERNA)
+            raiz.chaves = [sep]
+            raiz.vals = [esquerda.pid, direita.pid]
+            self._marcar_suja(raiz)
+            self._root = raiz.pid
+            return
+
+        pai, i = caminho.pop()
+        self.note_shift(len(pai.chaves) - i)
+        pai.chaves.insert(i, sep)
+        pai.vals.insert(i + 1, direita.pid)
+        self._marcar_suja(pai)
+        if len(pai.chaves) <= self.cap_interna:
+            return
+
+        # split de página interna: a chave do meio sobe
+        meio = len(pai.chaves) // 2
+        sobe = pai.chaves[meio]
+        nova = self._nova_pagina(INTERNA)
+        nova.chaves = pai.chaves[meio + 1:]
+        nova.vals = pai.vals[meio + 1:]
+        del pai.chaves[meio:]
+        del pai.vals[meio + 1:]
+        self.note_shift(len(nova.chaves) + len(nova.vals))
+        self._marcar_suja(nova)
+        self._inserir_no_pai(pai, sobe, nova, caminho)
+
+    # ----------------------------
+    # Heap de registros
+    # ----------------------------
+    def _gravar_registro(self, value: Dict[str, Any]) -> Tuple[int, int, int]:
+        raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        livre_max = self.page_size - _HDR_PAGINA.size
+        if len(raw) > livre_max:
+            raise ValueError(f"registro com {len(raw)} bytes não cabe em uma página ({livre_max})")
+        heap = self._get_page(self._heap_pid) if self._heap_pid else None
+        if heap is None or heap.usado + len(raw) > self.page_size:
+            if heap is not None:
+                # página cheia não é mais usada nesta operação: pode sair do pool
+                # (no bulk load, sem isso todas as páginas de heap ficariam fixadas)
+                self._descartar_fixada(heap)
+            heap = self._nova_pagina(HEAP)
+            self._heap_pid = heap.pid
+        off = heap.usado
+        heap.dados[off:off + len(raw)] = raw
+        heap.usado += len(raw)
+        self._marcar_suja(heap)
+        return (heap.pid, off, len(raw))
+
+    def _ler_registro(self, ref: Tuple[int, int, int]) -> Dict[str, Any]:
+        pid, off, tam = ref
+        heap = self._get_page(pid)
+        return json.loads(bytes(heap.dados[off:off + tam]).decode("utf-8"))
+
+    # ----------------------------
+    # Buffer pool (LRU)
+    # ----------------------------
+    def _get_page(self, pid: int) -> _Pagina:
+        pg = self._pool.get(pid)
+        if pg is not None:
+            self._pool.move_to_end(pid)
+            self.buffer_hits += 1
+        else:
+            self.buffer_misses += 1
+            pg = self._ler_pagina(pid)
+            self._pool[pid] = pg
+        self._fixadas.add(pid)
+        return pg
+
+    def _marcar_suja(self, pg: _Pagina) -> None:
+        pg.suja = True
+
+    def _descartar_fixada(self, pg: _Pagina) -> None:
+        """Libera uma página antes do fim da operação (usado no bulk load)."""
+        self._fixadas.discard(pg.pid)
+        self._ajustar_pool()
+
+    def _liberar(self) -> None:
+        """Fim da operação: solta as páginas fixadas e aplica o limite do pool."""
+        self._fixadas.clear()
+        self._ajustar_pool()
+
+    def _ajustar_pool(self) -> None:
+        if len(self._pool) <= self.pool_pages:
+            return
+        for pid in list(self._pool.keys()):
+            if len(self._pool) <= self.pool_pages:
+                break
+            if pid in self._fixadas:
+                continue
+            vitima = self._pool.pop(pid)
+            if vitima.suja:
+                self._escrever_pagina(vitima)
+            self.evictions += 1
+
+    def _nova_pagina(self, tipo: int) -> _Pagina:
+        pid = self._n_pages
+        self._n_pages += 1
+        self._garantir_capacidade(self._n_pages)
+        pg = _Pagina(pid, tipo)
+        if tipo == HEAP:
+            pg.dados = bytearray(self.page_size)
+            pg.usado = _HDR_PAGINA.size
+        pg.suja = True
+        self._pool[pid] = pg
+        self._fixadas.add(pid)
+        return pg
+
+    def flush(self) -> None:
+        """Grava todas as páginas sujas e o cabeçalho no arquivo."""
+        for pg in self._pool.values():
+            if pg.suja:
+                self._escrever_pagina(pg)
+        self._gravar_cabecalho()
+        self._mm.flush()
+
+    def close(self) -> None:
+        if self._mm is None:
+            return
+        self.flush()
+        self._mm.close()
+        self._f.close()
+        self._mm = None
+        if self._temporario and os.path.isfile(self.arquivo):
+            os.remove(self.arquivo)
+
+    # ----------------------------
+    # E/S de páginas no mmap
+    # ----------------------------
+    def _garantir_capacidade(self, n_pages: int) -> None:
+        necessario = n_pages * self.page_size
+        if necessario <= len(self._mm):
+            return
+        novo = max(necessario, len(self._mm) * 2)
+        self._mm.flush()
+        self._mm.close()
+        self._f.truncate(novo)
+        self._mm = mmap.mmap(self._f.fileno(), 0)
+
+    def _ler_pagina(self, pid: int) -> _Pagina:
+        self.page_reads += 1
+        off = pid * self.page_size
+        buf = self._mm[off:off + self.page_size]
+        tipo, n, prox = _HDR_PAGINA.unpack_from(buf, 0)
+        pg = _Pagina(pid, tipo)
+        if tipo == FOLHA:
+            pg.prox = prox
+            ent = self._ent_folha
+            pos = _HDR_PAGINA.size
+            for _ in range(n):
+                k, hp, ho, hl = ent.unpack_from(buf, pos)
+                pg.chaves.append(k.rstrip(b"\x00").decode("utf-8"))
+                pg.vals.append((hp, ho, hl))
+                pos += ent.size
+        elif tipo == INTERNA:
+            ent = self._ent_interna
+            pos = _HDR_PAGINA.size
+            pg.vals.append(struct.unpack_from("<I", buf, pos)[0])
+            pos += 4
+            for _ in range(n):
+                k, filho = ent.unpack_from(buf, pos)
+                pg.chaves.append(k.rstrip(b"\x00").decode("utf-8"))
+                pg.vals.append(filho)
+                pos += ent.size
+        elif tipo == HEAP:
+            pg.dados = bytearray(buf)
+            pg.usado = n
+        else:
+            raise ValueError(f"página {pid} com tipo inválido: {tipo}")
+        return pg
+
+    def _escrever_pagina(self, pg: _Pagina) -> None:
+        self.page_writes += 1
+        if pg.tipo == HEAP:
+            buf = pg.dados
+            _HDR_PAGINA.pack_into(buf, 0, HEAP, pg.usado, 0)
+        else:
+            buf = bytearray(self.page_size)
+            _HDR_PAGINA.pack_into(buf, 0, pg.tipo, len(pg.chaves), pg.prox)
+            pos = _HDR_PAGINA.size
+            if pg.tipo == FOLHA:
+                ent = self._ent_folha
+                for k, (hp, ho, hl) in zip(pg.chaves, pg.vals):
+                    ent.pack_into(buf, pos, self._codificar_chave(k), hp, ho, hl)
+                    pos += ent.size
+            else:
+                ent = self._ent_interna
+                struct.pack_into("<I", buf, pos, pg.vals[0])
+                pos += 4
+                for k, filho in zip(pg.chaves, pg.vals[1:]):
+                    ent.pack_into(buf, pos, self._codificar_chave(k), filho)
+                    pos += ent.size
+        off = pg.pid * self.page_size
+        self._mm[off:off + self.page_size] = bytes(buf)
+        pg.suja = False
+
+    def _codificar_chave(self, key: str) -> bytes:
+        raw = str(key).encode("utf-8")
+        if len(raw) > self.key_size:
+            raise ValueError(f"chave '{key}' excede key_size={self.key_size} bytes")
+        return raw
+
+    def _gravar_cabecalho(self) -> None:
+        _HDR_ARQUIVO.pack_into(self._mm, 0, _MAGIC, self.page_size, self.key_size,
+                               self._root, self._n_pages, self._heap_pid, self.n_items)
+
+    def _ler_cabecalho(self) -> bool:
+        magic, ps, ks, root, n_pages, heap_pid, n_items = _HDR_ARQUIVO.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            return False
+        if ps != self.page_size or ks != self.key_size:
+            raise ValueError(f"arquivo criado com page_size={ps} e key_size={ks}")
+        self._root, self._n_pages, self._heap_pid, self.n_items = root, n_pages, heap_pid, n_items
+        return True
+
+    # ----------------------------
+    # Métricas de E/S por operação
+    # ----------------------------
+    def _io_inicio(self) -> Tuple[int, int, int, int]:
+        return (self.page_reads, self.page_writes, self.buffer_hits, self.buffer_misses)
+
+    def _io_fim(self, antes: Tuple[int, int, int, int]) -> None:
+        self._liberar()
+        reads = self.page_reads - antes[0]
+        writes = self.page_writes - antes[1]
+        hits = self.buffer_hits - antes[2]
+        misses = self.buffer_misses - antes[3]
+        self.note_extra("page_reads", reads)
+        self.note_extra("page_writes", writes)
+        self.note_extra("buffer_hits", hits)
+        self.note_extra("buffer_misses", misses)
+        self.note_extra("buffer_hit_rate", hits / (hits + misses) if (hits + misses) else 1.0)
+
+    def buffer_hit_rate(self) -> float:
+        total = self.buffer_hits + self.buffer_misses
+        return self.buffer_hits / total if total else 1.0
+
+    # ----------------------------
+    # Utilidades opcionais
+    # ----------------------------
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Varre as folhas encadeadas em ordem crescente de chave."""
+        pg = self._get_page(self._root)
+        while pg.tipo == INTERNA:
+            pg = self._get_page(pg.vals[0])
+        while True:
+            for k, ref in zip(list(pg.chaves), list(pg.vals)):
+                yield k, self._ler_registro(ref)
+            prox = pg.prox
+            self._liberar()
+            if not prox:
+                break
+            pg = self._get_page(prox)
+
+    def height(self) -> int:
+        h, pg = 1, self._get_page(self._root)
+        while pg.tipo == INTERNA:
+            pg = self._get_page(pg.vals[0])
+            h += 1
+        self._liberar()
+        return h
+
+    @property
+    def n_pages(self) -> int:
+        return self._n_pages
+
+
+if __name__ == '__main__':
+    # Teste básico das funcionalidades
+    ds = BPlusTreeDiskDS(pool_pages=16)
+    ds.carregar_dados(1000)
+    ds.buscar_dados(100)
+    ds.remover_dados(100)
+    ds.print_summary('sum')
+    print(f'Páginas: {ds.n_pages} | altura: {ds.height()} | hit rate: {ds.buffer_hit_rate():.3f}')
+    ds.close()
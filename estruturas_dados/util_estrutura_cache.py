@@ -0,0 +1,375 @@
+# util_estrutura_cache.py
+from __future__ import annotations
+from typing import Any, Dict, Optional, List, Tuple
+import sys
+
+from util_estrutura import BaseDataStructure, EnvoltorioDS
+
+
+# -----------------------------
+# Lista LRU: dicionário + lista duplamente ligada (tudo O(1))
+# -----------------------------
+class _NoLRU:
+    __slots__ = ("key", "value", "prev", "next")
+    def __init__(self, key: Any = None, value: Any = None):
+        self.key = key
+        self.value = value
+        self.prev: Optional["_NoLRU"] = None
+        self.next: Optional["_NoLRU"] = None
+
+
+class _ListaLRU:
+    """Chaves em ordem de uso: sentinela.next é o MRU, sentinela.prev é o LRU."""
+
+    def __init__(self) -> None:
+        self._nos: Dict[Any, _NoLRU] = {}
+        self._s = _NoLRU()
+        self._s.prev = self._s.next = self._s
+
+    def __len__(self) -> int:
+        return len(self._nos)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._nos
+
+    def valor(self, key: Any) -> Any:
+        return self._nos[key].value
+
+    def inserir_mru(self, key: Any, value: Any = None) -> None:
+        no = _NoLRU(key, value)
+        s = self._s
+        no.prev, no.next = s, s.next
+        s.next.prev = no
+        s.next = no
+        self._nos[key] = no
+
+    def mover_mru(self, key: Any) -> None:
+        no = self._nos[key]
+        no.prev.next, no.next.prev = no.next, no.prev
+        s = self._s
+        no.prev, no.next = s, s.next
+        s.next.prev = no
+        s.next = no
+
+    def remover(self, key: Any) -> Any:
+        no = self._nos.pop(key)
+        no.prev.next, no.next.prev = no.next, no.prev
+        return no.value
+
+    def remover_lru(self) -> Tuple[Any, Any]:
+        key = self._s.prev.key
+        return key, self.remover(key)
+
+    def memoria_bytes(self) -> int:
+        return sys.getsizeof(self._nos) + (len(self._nos) + 1) * _TAM_NO
+
+
+_TAM_NO = sys.getsizeof(_NoLRU())
+
+
+# -----------------------------
+# Políticas de substituição
+# -----------------------------
+# Interface comum:
+#   buscar(key) -> (achou, valor)     registra o acesso
+#   guardar(key, valor) -> int        insere após um miss; devolve nº de despejos
+#   invalidar(key) -> bool            descarta a chave (True se estava em cache)
+#   __len__, memoria_bytes()
+
+class PoliticaLRU:
+    """Least Recently Used: despeja a chave acessada há mais tempo."""
+    nome = 'lru'
+
+    def __init__(self, capacidade: int) -> None:
+        self.capacidade = max(1, int(capacidade))
+        self._lista = _ListaLRU()
+
+    def __len__(self) -> int:
+        return len(self._lista)
+
+    def buscar(self, key: Any) -> Tuple[bool, Any]:
+        if key not in self._lista:
+            return False, None
+        self._lista.mover_mru(key)
+        return True, self._lista.valor(key)
+
+    def guardar(self, key: Any, value: Any) -> int:
+        if key in self._lista:
+            self._lista.remover(key)
+        despejos = 0
+        if len(self._lista) >= self.capacidade:
+            self._lista.remover_lru()
+            despejos = 1
+        self._lista.inserir_mru(key, value)
+        return despejos
+
+    def invalidar(self, key: Any) -> bool:
+        if key not in self._lista:
+            return False
+        self._lista.remover(key)
+        return True
+
+    def memoria_bytes(self) -> int:
+        return self._lista.memoria_bytes()
+
+
+class PoliticaCLOCK:
+    """
+    CLOCK (segunda chance): slots em círculo com bit de referência; o ponteiro
+    zera bits ligados até achar um slot com bit 0 e o despeja.
+    """
+    nome = 'clock'
+
+    def __init__(self, capacidade: int) -> None:
+        self.capacidade = max(1, int(capacidade))
+        self._keys: List[Any] = []
+        self._vals: List[Any] = []
+        self._ref = bytearray()
+        self._pos: Dict[Any, int] = {}
+        self._livres: List[int] = []     # slots liberados por invalidação
+        self._mao = 0
+
+    def __len__(self) -> int:
+        return len(self._pos)
+
+    def buscar(self, key: Any) -> Tuple[bool, Any]:
+        i = self._pos.get(key)
+        if i is None:
+            return False, None
+        self._ref[i] = 1
+        return True, self._vals[i]
+
+    def guardar(self, key: Any, value: Any) -> int:
+        i = self._pos.get(key)
+        if i is not None:
+            self._vals[i] = value
+            self._ref[i] = 1
+            return 0
+        despejos = 0
+        if self._livres:
+            i = self._livres.pop()
+        elif len(self._keys) < self.capacidade:
+            i = len(self._keys)
+            self._keys.append(None)
+            self._vals.append(None)
+            self._ref.append(0)
+        else:
+            n = len(self._keys)
+            while self._ref[self._mao]:
+                self._ref[self._mao] = 0
+                self._mao = (self._mao + 1) % n
+            i = self._mao
+            self._mao = (i + 1) % n
+            del self._pos[self._keys[i]]
+            despejos = 1
+        self._keys[i] = key
+        self._vals[i] = value
+        self._ref[i] = 1
+        self._pos[key] = i
+        return despejos
+
+    def invalidar(self, key: Any) -> bool:
+        i = self._pos.pop(key, None)
+        if i is None:
+            return False
+        self._keys[i] = self._vals[i] = None
+        self._ref[i] = 0
+        self._livres.append(i)
+        return True
+
+    def memoria_bytes(self) -> int:
+        return (sys.getsizeof(self._pos) + sys.getsizeof(self._keys) + sys.getsizeof(self._vals)
+                + sys.getsizeof(self._ref) + sys.getsizeof(self._livres))
+
+
+class PoliticaARC:
+    """
+    Adaptive Replacement Cache (Megiddo & Modha): T1 guarda chaves vistas uma vez,
+    T2 chaves vistas mais de uma vez; B1/B2 são "fantasmas" (só chaves) dos
+    despejos recentes de cada lado. Um acerto em B1 aumenta o alvo p de T1,
+    um acerto em B2 o diminui, adaptando entre recência e frequência.
+    """
+    nome = 'arc'
+
+    def __init__(self, capacidade: int) -> None:
+        self.capacidade = max(1, int(capacidade))
+        self.p = 0.0
+        self._t1, self._t2 = _ListaLRU(), _ListaLRU()
+        self._b1, self._b2 = _ListaLRU(), _ListaLRU()
+
+    def __len__(self) -> int:
+        return len(self._t1) + len(self._t2)
+
+    def buscar(self, key: Any) -> Tuple[bool, Any]:
+        if key in self._t1:
+            value = self._t1.remover(key)
+            self._t2.inserir_mru(key, value)
+            return True, value
+        if key in self._t2:
+            self._t2.mover_mru(key)
+            return True, self._t2.valor(key)
+        return False, None
+
+    def _substituir(self, em_b2: bool) -> None:
+        """Despeja o LRU de T1 ou de T2 (conforme p) para o fantasma correspondente."""
+        t1 = len(self._t1)
+        if t1 and (t1 > self.p or (em_b2 and t1 == self.p)):
+            key, _ = self._t1.remover_lru()
+            self._b1.inserir_mru(key)
+        else:
+            key, _ = self._t2.remover_lru()
+            self._b2.inserir_mru(key)
+
+    def guardar(self, key: Any, value: Any) -> int:
+        c = self.capacidade
+        if key in self._t1 or key in self._t2:
+            (self._t1 if key in self._t1 else self._t2).remover(key)
+            self._t2.inserir_mru(key, value)
+            return 0
+        cheio = len(self) >= c
+        if key in self._b1:
+            self.p = min(c, self.p + max(len(self._b2) / len(self._b1), 1))
+            self._b1.remover(key)
+            if cheio:
+                self._substituir(False)
+            self._t2.inserir_mru(key, value)
+            return int(cheio)
+        if key in self._b2:
+            self.p = max(0.0, self.p - max(len(self._b1) / len(self._b2), 1))
+            self._b2.remover(key)
+            if cheio:
+                self._substituir(True)
+            self._t2.inserir_mru(key, value)
+            return int(cheio)
+
+        despejos = 0
+        l1 = len(self._t1) + len(self._b1)
+        if l1 >= c:
+            if len(self._t1) < c:
+                self._b1.remover_lru()
+                if cheio:
+                    self._substituir(False)
+                    despejos = 1
+            else:
+                self._t1.remover_lru()
+                despejos = 1
+        else:
+            total = l1 + len(self._t2) + len(self._b2)
+            if total >= 2 * c:
+                self._b2.remover_lru()
+            if cheio:
+                self._substituir(False)
+                despejos = 1
+        self._t1.inserir_mru(key, value)
+        return despejos
+
+    def invalidar(self, key: Any) -> bool:
+        for lista in (self._t1, self._t2):
+            if key in lista:
+                lista.remover(key)
+                return True
+        return False
+
+    def memoria_bytes(self) -> int:
+        return sum(l.memoria_bytes() for l in (self._t1, self._t2, self._b1, self._b2))
+
+
+POLITICAS = {'lru': PoliticaLRU, 'clock': PoliticaCLOCK, 'arc': PoliticaARC}
+
+
+# -----------------------------
+# Cache read-through na frente de qualquer estrutura
+# -----------------------------
+class CacheDS(EnvoltorioDS):
+    """
+    Cache de leitura na frente de uma BaseDataStructure: search consulta primeiro
+    o cache; em um miss busca na estrutura interna e guarda o valor encontrado
+    (buscas sem resultado não são guardadas).
+
+    Parâmetros:
+      - estrutura: instância de BaseDataStructure
+      - capacidade: nº máximo de chaves em cache
+      - politica: 'lru' [padrão], 'clock', 'arc' ou um objeto com a mesma
+                  interface (buscar/guardar/invalidar/memoria_bytes)
+
+    insert e remove invalidam a chave antes de delegar, então o cache nunca
+    devolve um valor diferente do que a estrutura devolveria.
+
+    Um acerto não gera comparações; um miss registra as da estrutura interna.
+    Extras por operação:
+      - cache_hit: 1/0 (só em search)
+      - cache_hit_rate: acertos / buscas acumulados até esta operação
+      - cache_evictions: chaves despejadas nesta operação
+      - cache_invalidations: 1 quando insert/remove descartou uma chave em cache
+      - cache_bytes: memória estimada do índice e dos nós do cache (os valores
+        são referências compartilhadas com a estrutura e não entram na conta)
+    """
+
+    def __init__(self, estrutura: BaseDataStructure, capacidade: int = 1024,
+                 politica: Any = 'lru', **params: Any) -> None:
+        if isinstance(politica, str):
+            if politica not in POLITICAS:
+                raise ValueError(f"politica deve ser uma de {sorted(POLITICAS)}")
+            politica = POLITICAS[politica](capacidade)
+        nome_pol = getattr(politica, 'nome', type(politica).__name__)
+        super().__init__(f"Cache({nome_pol}|{capacidade})", estrutura,
+                         cache_politica=nome_pol, cache_capacidade=capacidade, **params)
+        self.politica = politica
+        self.acertos = 0
+        self.buscas = 0
+        self.despejos = 0
+
+    # ----------------------------
+    # Implementações exigidas pela Base
+    # ----------------------------
+    def _insert_impl(self, key: Any, value: Dict[str, Any]) -> bool:
+        self._invalidar(key)
+        ok = self._interna()._insert_impl(key, value)
+        self._notar_cache(0)
+        return ok
+
+    def _remove_impl(self, key: Any) -> bool:
+        self._invalidar(key)
+        ok = self._interna()._remove_impl(key)
+        self._notar_cache(0)
+        return ok
+
+    def _search_impl(self, key: Any) -> Optional[Dict[str, Any]]:
+        self.buscas += 1
+        achou, value = self.politica.buscar(key)
+        despejos = 0
+        if achou:
+            self.acertos += 1
+        else:
+            value = self._interna()._search_impl(key)
+            if value is not None:
+                despejos = self.politica.guardar(key, value)
+        self.note_extra("cache_hit", int(achou))
+        self._notar_cache(despejos)
+        return value
+
+    # ----------------------------
+    # Helpers internos
+    # ----------------------------
+    def _invalidar(self, key: Any) -> None:
+        if self.politica.invalidar(key):
+            self.note_extra("cache_invalidations", 1)
+
+    def _notar_cache(self, despejos: int) -> None:
+        self.despejos += despejos
+        self.note_extra("cache_hit_rate", self.taxa_acerto())
+        self.note_extra("cache_evictions", despejos)
+        self.note_extra("cache_bytes", self.politica.memoria_bytes())
+
+    def taxa_acerto(self) -> float:
+        return self.acertos / self.buscas if self.buscas else 0.0
+
+
+if __name__ == '__main__':
+    # Teste básico das funcionalidades
+    from util_estrutura import AVLTreeDS
+    for politica in POLITICAS:
+        ds = CacheDS(AVLTreeDS(), capacidade=100, politica=politica)
+        ds.carregar_dados(1000)
+        ds.buscar_dados(1000, distribuicao='zipf')
+        print(f"{ds.name}: taxa de acerto {ds.taxa_acerto():.1%}, despejos {ds.despejos}")
@@ -0,0 +1,210 @@
+# util_estrutura_filtros.py
+from __future__ import annotations
+from typing import Any, Dict, Optional, List
+import hashlib
+import math
+
+from util_estrutura import BaseDataStructure, Counters, EnvoltorioDS
+
+
+# -----------------------------
+# Filtro de Bloom
+# -----------------------------
+class BloomFilter:
+    """
+    Filtro de Bloom com double hashing sobre blake2b (determinístico entre execuções).
+
+    Parâmetros:
+      - n_esperado: quantidade de chaves prevista
+      - bits_por_chave: bits do vetor por chave (10 bits ≈ 1% de falsos positivos)
+    """
+
+    def __init__(self, n_esperado: int, bits_por_chave: float = 10.0) -> None:
+        self.m = max(64, int(math.ceil(max(1, n_esperado) * bits_por_chave)))
+        self.k = max(1, int(round(bits_por_chave * math.log(2))))
+        self.bits = bytearray((self.m + 7) // 8)
+        self.n = 0
+
+    def _posicoes(self, key: Any) -> List[int]:
+        d = hashlib.blake2b(str(key).encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        return [(h1 + i * h2) % self.m for i in range(self.k)]
+
+    def add(self, key: Any) -> None:
+        for p in self._posicoes(key):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.n += 1
+
+    def __contains__(self, key: Any) -> bool:
+        for p in self._posicoes(key):
+            if not self.bits[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
+    @property
+    def bits_por_chave(self) -> float:
+        return self.m / self.n if self.n else float(self.m)
+
+    def taxa_falso_positivo(self) -> float:
+        """Estimativa teórica (1 - e^(-kn/m))^k para o número atual de chaves."""
+        return (1.0 - math.exp(-self.k * self.n / self.m)) ** self.k
+
+
+class CountingBloomFilter(BloomFilter):
+    """
+    Filtro de Bloom com contadores de 8 bits no lugar de bits, o que permite remove.
+
+    Um contador que satura em 255 nunca é decrementado (evita falso negativo);
+    bits_por_chave continua se referindo às posições do vetor (a memória real é 8x).
+    """
+
+    SATURACAO = 255
+
+    def __init__(self, n_esperado: int, bits_por_chave: float = 10.0) -> None:
+        super().__init__(n_esperado, bits_por_chave)
+        self.bits = bytearray(self.m)
+
+    def add(self, key: Any) -> None:
+        for p in self._posicoes(key):
+            if self.bits[p] < self.SATURACAO:
+                self.bits[p] += 1
+        self.n += 1
+
+    def remove(self, key: Any) -> None:
+        """Só deve ser chamado para chaves que foram adicionadas (senão gera falsos negativos)."""
+        for p in self._posicoes(key):
+            if 0 < self.bits[p] < self.SATURACAO:
+                self.bits[p] -= 1
+        self.n = max(0, self.n - 1)
+
+    def __contains__(self, key: Any) -> bool:
+        for p in self._posicoes(key):
+            if not self.bits[p]:
+                return False
+        return True
+
+
+# -----------------------------
+# Front-end de Bloom para qualquer estrutura
+# -----------------------------
+class FiltroBloomDS(EnvoltorioDS):
+    """
+    Envolve qualquer BaseDataStructure com um filtro de Bloom que responde
+    buscas (e remoções) de chaves ausentes sem tocar na estrutura interna.
+
+    Parâmetros:
+      - estrutura: instância de BaseDataStructure (ex.: ArrayLinkedList())
+      - n_esperado / bits_por_chave: dimensionamento do filtro
+      - contagem: True -> CountingBloomFilter (remove limpa o filtro) [padrão]
+                  False -> BloomFilter de bits (remoções só deixam falsos positivos)
+      - medir_economia: True -> a cada negativo do filtro executa a busca interna
+                  "na sombra" (contadores separados, fora das métricas) para medir
+                  exatamente as comparações poupadas. Em estruturas que se
+                  reorganizam na busca (Splay, auto_organizacao) a sombra altera a
+                  estrutura; nesses casos prefira a estimativa.
+
+    As contagens da estrutura interna entram nas métricas do próprio wrapper
+    (ver EnvoltorioDS). Extras por operação:
+      - bloom_negative: 1 quando o filtro descartou a chave
+      - bloom_false_positive: 1 quando o filtro deixou passar uma chave ausente
+      - saved_comparisons: comparações poupadas pelo negativo (medidas ou, sem
+        medir_economia, a média das buscas malsucedidas já observadas)
+      - fpr: taxa teórica de falsos positivos do filtro na ocupação atual
+      - bits_per_key: bits do filtro por chave armazenada
+    """
+
+    def __init__(self, estrutura: BaseDataStructure, n_esperado: int = 100_000,
+                 bits_por_chave: float = 10.0, contagem: bool = True,
+                 medir_economia: bool = False, **params: Any) -> None:
+        prefixo = f"Bloom({bits_por_chave:g}b|{'count' if contagem else 'bits'})"
+        super().__init__(prefixo, estrutura, bloom_bits_por_chave=bits_por_chave,
+                         bloom_contagem=contagem, **params)
+        self.contagem = bool(contagem)
+        self.medir_economia = bool(medir_economia)
+        self.filtro = (CountingBloomFilter if contagem else BloomFilter)(n_esperado, bits_por_chave)
+
+        self.negativos = 0              # buscas/remoções descartadas pelo filtro
+        self.falsos_positivos = 0       # passaram pelo filtro e não existiam
+        self.positivos = 0              # passaram pelo filtro
+        self._cmp_misses = 0            # comparações somadas das buscas malsucedidas
+        self._n_misses = 0
+
+    # ----------------------------
+    # Implementações exigidas pela Base
+    # ----------------------------
+    def _insert_impl(self, key: Any, value: Dict[str, Any]) -> bool:
+        ok = self._interna()._insert_impl(key, value)
+        if ok:
+            self.filtro.add(key)
+        self._notar_filtro()
+        return ok
+
+    def _remove_impl(self, key: Any) -> bool:
+        if key not in self.filtro:
+            self.negativos += 1
+            self.note_extra("bloom_negative", 1)
+            self._notar_filtro()
+            return False
+        ok = self._interna()._remove_impl(key)
+        if ok and self.contagem:
+            self.filtro.remove(key)
+        self._notar_filtro()
+        return ok
+
+    def _search_impl(self, key: Any) -> Optional[Dict[str, Any]]:
+        if key not in self.filtro:
+            self.negativos += 1
+            self.note_extra("bloom_negative", 1)
+            self.note_extra("saved_comparisons", self._economia(key))
+            self._notar_filtro()
+            return None
+        self.positivos += 1
+        antes = self.counters.comparisons
+        res = self._interna()._search_impl(key)
+        if res is None:
+            self.falsos_positivos += 1
+            self._cmp_misses += self.counters.comparisons - antes
+            self._n_misses += 1
+            self.note_extra("bloom_false_positive", 1)
+        self._notar_filtro()
+        return res
+
+    # ----------------------------
+    # Helpers internos
+    # ----------------------------
+    def _notar_filtro(self) -> None:
+        self.note_extra("fpr", self.filtro.taxa_falso_positivo())
+        self.note_extra("bits_per_key", self.filtro.bits_por_chave)
+
+    def _economia(self, key: Any) -> float:
+        """Comparações que a busca interna teria feito para uma chave ausente."""
+        if not self.medir_economia:
+            return self._cmp_misses / self._n_misses if self._n_misses else 0.0
+        # busca na sombra: contadores e extras descartáveis
+        interna = self.estrutura
+        interna.counters, interna._extras_current_op = Counters(), {}
+        try:
+            interna._search_impl(key)
+            cmp = interna.counters.comparisons
+        finally:
+            interna.counters = self.counters
+        self._cmp_misses += cmp
+        self._n_misses += 1
+        return float(cmp)
+
+    def taxa_falso_positivo_observada(self) -> float:
+        """Falsos positivos / operações com chave ausente (negativos + falsos positivos)."""
+        ausentes = self.negativos + self.falsos_positivos
+        return self.falsos_positivos / ausentes if ausentes else 0.0
+
+
+if __name__ == '__main__':
+    # Teste básico das funcionalidades
+    from util_estrutura import ArrayLinkedList
+    ds = FiltroBloomDS(ArrayLinkedList(), n_esperado=1000)
+    ds.carregar_dados(1000)
+    ds.buscar_dados(100)
+    for i in range(100):
+        ds.search(f"X{i:05d}")
+    ds.print_summary('sum')
@@ -0,0 +1,442 @@
+# util_estrutura_lsm.py
+from __future__ import annotations
+from typing import Any, Dict, Optional, List, Tuple, Iterator
+import heapq
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from util_estrutura import BaseDataStructure
+from util_estrutura_filtros import BloomFilter
+
+
+# -----------------------------
+# Run imutável ordenado em disco (SSTable)
+# -----------------------------
+class _Run:
+    """
+    Arquivo JSONL ordenado por chave: cada linha é [chave, valor] (valor None = tombstone).
+    Mantém em memória os fence pointers (primeira chave + offset de cada bloco) e o filtro de Bloom.
+    """
+    __slots__ = ("path", "tier", "n", "tamanho", "fence_keys", "fence_offs", "bloom", "min_key", "max_key", "_f")
+
+    def __init__(self, path: str, tier: int) -> None:
+        self.path = path
+        self.tier = tier
+        self.n = 0
+        self.tamanho = 0
+        self.fence_keys: List[Any] = []
+        self.fence_offs: List[int] = []
+        self.bloom: Optional[BloomFilter] = None
+        self.min_key: Any = None
+        self.max_key: Any = None
+        self._f = None
+
+    def abrir(self):
+        if self._f is None:
+            self._f = open(self.path, "rb")
+        return self._f
+
+    def ler_bloco(self, idx: int) -> List[Tuple[Any, Any]]:
+        f = self.abrir()
+        ini = self.fence_offs[idx]
+        fim = self.fence_offs[idx + 1] if idx + 1 < len(self.fence_offs) else self.tamanho
+        f.seek(ini)
+        bruto = f.read(fim - ini)
+        return [tuple(json.loads(linha)) for linha in bruto.decode("utf-8").splitlines()]
+
+    def iterar(self) -> Iterator[Tuple[Any, Any]]:
+        with open(self.path, "rb") as f:
+            for linha in f:
+                k, v = json.loads(linha)
+                yield k, v
+
+    def fechar(self, apagar: bool = False) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+        if apagar and os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+class LSMTreeDS(BaseDataStructure):
+    """
+    LSM-tree (Log-Structured Merge tree) para cargas dominadas por escrita.
+
+    - Chave: matrícula (str)
+    - Valor: dicionário do funcionário
+
+    Estrutura:
+      - memtable: buffer ordenado em memória (listas paralelas + busca binária)
+      - ao atingir memtable_size entradas, a memtable vira um run imutável em disco (tier 0)
+      - compactação size-tiered: quando um tier acumula `fanout` runs, eles são
+        mesclados em um único run do tier seguinte (em cascata)
+      - cada run mantém filtro de Bloom e fence pointers (um a cada `bloco` entradas)
+      - inserção é escrita cega (sem leitura prévia)
+      - remoção grava tombstone (apenas se a chave existir); tombstones são
+        descartados quando a compactação alcança o run mais antigo
+      - chave repetida atualiza o valor (a versão mais recente vence)
+
+    Parâmetros:
+      - memtable_size: entradas na memtable antes do flush
+      - fanout: runs por tier que disparam a compactação
+      - bloco: entradas por bloco (granularidade dos fence pointers)
+      - bits_por_chave: dimensionamento dos filtros de Bloom
+      - background: True -> compactação em thread separada
+      - pasta: diretório dos runs (None -> diretório temporário)
+
+    Métricas:
+      - comparisons: via cmp_keys (memtable, fence pointers e blocos)
+      - node_visits: entradas examinadas na memtable e nos blocos lidos
+      - probes: runs consultados na leitura (amplificação de leitura)
+      - shifts: deslocamentos na memtable ordenada
+      - extras por operação: runs_probed, blocks_read, bloom_negatives, flushes,
+        bytes_logical (bytes da entrada recebida), bytes_written (flush e runs
+        mesclados na compactação) e compaction_ms; soma(bytes_written) /
+        soma(bytes_logical) de um round é a amplificação de escrita
+      - com background=True, os bytes e o tempo da compactação feita na thread
+        entram na primeira operação seguinte (o que terminar depois da última
+        operação do round fica de fora)
+    """
+
+    _TOMBSTONE = None
+
+    def __init__(
+        self,
+        memtable_size: int = 1000,
+        fanout: int = 4,
+        bloco: int = 32,
+        bits_por_chave: float = 10.0,
+        background: bool = False,
+        pasta: Optional[str] = None,
+        **params: Any,
+    ) -> None:
+        nome = f"LSMTree(mem={memtable_size}|fanout={fanout}{'|bg' if background else ''})"
+        super().__init__(nome, memtable_size=memtable_size, fanout=fanout, bloco=bloco,
+                         bits_por_chave=bits_por_chave, background=background, **params)
+        assert memtable_size > 0, "memtable_size deve ser > 0"
+        assert fanout >= 2, "fanout deve ser >= 2"
+        assert bloco > 0, "bloco deve ser > 0"
+        self.memtable_size = int(memtable_size)
+        self.fanout = int(fanout)
+        self.bloco = int(bloco)
+        self.bits_por_chave = float(bits_por_chave)
+        self.background = bool(background)
+
+        self._temporaria = pasta is None
+        self.pasta = pasta if pasta is not None else tempfile.mkdtemp(prefix="lsm_")
+        os.makedirs(self.pasta, exist_ok=True)
+
+        # memtable ordenada (valor None = tombstone)
+        self._mem_keys: List[Any] = []
+        self._mem_vals: List[Optional[Dict[str, Any]]] = []
+
+        # runs do mais novo para o mais antigo
+        self._runs: List[_Run] = []
+        self._obsoletos: List[_Run] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        # totais
+        self.bytes_usuario = 0        # bytes lógicos recebidos (insert/remove)
+        self.bytes_gravados = 0       # bytes gravados em disco (flush + compactação)
+        self.compaction_ms_total = 0.0
+        self.compactacoes = 0
+        self._bg_bytes = 0            # compactação em background ainda não atribuída a uma operação
+        self._bg_ms = 0.0
+        self.leituras = 0
+        self.runs_lidos = 0
+
+        self._metricas_ignorar = {
+            'rotations', 'swaps', 'hash_collisions', 'hash_bucket_len_after',
+            'hash_cluster_len', 'hash_displacement'
+        }
+
+    # ----------------------------
+    # Implementações exigidas pela Base
+    # ----------------------------
+    def _insert_impl(self, key: str, value: Dict[str, Any]) -> bool:
+        self._coletar_obsoletos()
+        self._atribuir_background()
+        # escrita cega: sem leitura prévia (a versão mais recente vence)
+        self._mem_put(key, value)
+        self._registrar_logico(len(json.dumps([key, value], ensure_ascii=False).encode("utf-8")) + 1)
+        self._talvez_flush()
+        return True
+
+    def _remove_impl(self, key: str) -> bool:
+        self._coletar_obsoletos()
+        self._atribuir_background()
+        if self._buscar(key) is None:
+            return False
+        self._mem_put(key, self._TOMBSTONE)
+        self._registrar_logico(len(json.dumps([key, None]).encode("utf-8")) + 1)
+        self._talvez_flush()
+        return True
+
+    def _search_impl(self, key: str) -> Optional[Dict[str, Any]]:
+        self._coletar_obsoletos()
+        self._atribuir_background()
+        return self._buscar(key)
+
+    def _atribuir_background(self) -> None:
+        """Soma à operação corrente os bytes e o tempo da compactação feita em background desde a anterior."""
+        if not self.background:
+            return
+        with self._lock:
+            bg_bytes, bg_ms, self._bg_bytes, self._bg_ms = self._bg_bytes, self._bg_ms, 0, 0.0
+        if bg_bytes or bg_ms:
+            self.note_extra_soma("bytes_written", bg_bytes)
+            self.note_extra_soma("compaction_ms", bg_ms)
+
+    def _registrar_logico(self, n_bytes: int) -> None:
+        self.bytes_usuario += n_bytes
+        self.note_extra("bytes_logical", n_bytes)
+
+    # ----------------------------
+    # Memtable
+    # ----------------------------
+    def _bisect_left(self, chaves: List[Any], key: Any) -> int:
+        lo, hi = 0, len(chaves)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            self.note_visit(1)
+            if self.cmp_keys(chaves[mid], key) < 0:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _bisect_right(self, chaves: List[Any], key: Any) -> int:
+        lo, hi = 0, len(chaves)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.cmp_keys(key, chaves[mid]) < 0:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _mem_put(self, key: Any, value: Optional[Dict[str, Any]]) -> None:
+        i = self._bisect_left(self._mem_keys, key)
+        if i < len(self._mem_keys) and self.cmp_keys(self._mem_keys[i], key) == 0:
+            self._mem_vals[i] = value
+            return
+        self.note_shift(len(self._mem_keys) - i)
+        self._mem_keys.insert(i, key)
+        self._mem_vals.insert(i, value)
+
+    # ----------------------------
+    # Leitura: memtable -> runs (mais novo primeiro)
+    # ----------------------------
+    def _buscar(self, key: Any, registrar: bool = True) -> Optional[Dict[str, Any]]:
+        """Retorna o valor vigente (None se inexistente ou removido)."""
+        i = self._bisect_left(self._mem_keys, key)
+        if i < len(self._mem_keys) and self.cmp_keys(self._mem_keys[i], key) == 0:
+            return self._mem_vals[i]
+
+        with self._lock:
+            runs = list(self._runs)
+        runs_probed = blocks_read = bloom_neg = 0
+        achado = None
+        for run in runs:
+            if self.cmp_keys(key, run.min_key) < 0 or self.cmp_keys(key, run.max_key) > 0:
+                continue
+            if key not in run.bloom:
+                bloom_neg += 1
+                continue
+            runs_probed += 1
+            self.note_probe(1)
+            idx = self._bisect_right(run.fence_keys, key) - 1
+            if idx < 0:
+                continue
+            blocks_read += 1
+            encontrado = False
+            for k, v in run.ler_bloco(idx):
+                self.note_visit(1)
+                c = self.cmp_keys(k, key)
+                if c == 0:
+                    achado, encontrado = v, True
+                    break
+                if c > 0:
+                    break
+            if encontrado:
+                break
+
+        if registrar:
+            self.leituras += 1
+            self.runs_lidos += runs_probed
+            self.note_extra("runs_probed", runs_probed)
+            self.note_extra("blocks_read", blocks_read)
+            self.note_extra("bloom_negatives", bloom_neg)
+        return achado
+
+    # ----------------------------
+    # Flush e compactação
+    # ----------------------------
+    def _talvez_flush(self) -> None:
+        if len(self._mem_keys) < self.memtable_size:
+            return
+        self.flush()
+
+    def flush(self) -> None:
+        """Grava a memtable como um novo run do tier 0 e dispara a compactação."""
+        if not self._mem_keys:
+            return
+        run = self._gravar_run(zip(self._mem_keys, self._mem_vals), tier=0, n_esperado=len(self._mem_keys))
+        self.note_extra("flushes", 1)
+        self._mem_keys, self._mem_vals = [], []
+        with self._lock:
+            self._runs.insert(0, run)
+        if self.background:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._compactar, daemon=True)
+                self._thread.start()
+        else:
+            t0 = time.perf_counter_ns()
+            if self._compactar():
+                self.note_extra_soma("compaction_ms", (time.perf_counter_ns() - t0) / 1e6)
+
+    def _gravar_run(self, itens, tier: int, n_esperado: int) -> _Run:
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        run = _Run(os.path.join(self.pasta, f"run_{seq:06d}_t{tier}.jsonl"), tier)
+        run.bloom = BloomFilter(n_esperado, self.bits_por_chave)
+        offset = 0
+        with open(run.path, "wb") as f:
+            for k, v in itens:
+                if run.n % self.bloco == 0:
+                    run.fence_keys.append(k)
+                    run.fence_offs.append(offset)
+                linha = (json.dumps([k, v], ensure_ascii=False) + "\n").encode("utf-8")
+                f.write(linha)
+                offset += len(linha)
+                run.bloom.add(k)
+                if run.min_key is None:
+                    run.min_key = k
+                run.max_key = k
+                run.n += 1
+        run.tamanho = offset
+        with self._lock:
+            self.bytes_gravados += offset
+            if self._na_thread_de_compactacao():
+                self._bg_bytes += offset
+                return run
+        self.note_extra_soma("bytes_written", offset)
+        return run
+
+    def _na_thread_de_compactacao(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _compactar(self) -> bool:
+        """Compactação size-tiered em cascata; retorna True se mesclou algum tier."""
+        houve = False
+        while True:
+            with self._lock:
+                por_tier: Dict[int, List[_Run]] = {}
+                for r in self._runs:
+                    por_tier.setdefault(r.tier, []).append(r)
+                alvo = next((rs for t, rs in sorted(por_tier.items()) if len(rs) >= self.fanout), None)
+                if alvo is None:
+                    return houve
+                inclui_mais_antigo = alvo[-1] is self._runs[-1]
+
+            t0 = time.perf_counter_ns()
+            novo = self._mesclar(alvo, descartar_tombstones=inclui_mais_antigo)
+            with self._lock:
+                pos = self._runs.index(alvo[0])
+                self._runs = self._runs[:pos] + ([novo] if novo.n else []) + self._runs[pos + len(alvo):]
+                self._obsoletos.extend(alvo)
+                self.compactacoes += 1
+                ms = (time.perf_counter_ns() - t0) / 1e6
+                self.compaction_ms_total += ms
+                if self._na_thread_de_compactacao():
+                    self._bg_ms += ms
+            if not novo.n:
+                novo.fechar(apagar=True)
+            houve = True
+
+    def _mesclar(self, runs: List[_Run], descartar_tombstones: bool) -> _Run:
+        """Mescla runs (o primeiro da lista é o mais novo) mantendo a versão mais recente."""
+        fontes = [((k, idade, v) for k, v in r.iterar()) for idade, r in enumerate(runs)]
+        def _itens():
+            anterior = object()
+            for k, _, v in heapq.merge(*fontes, key=lambda t: (t[0], t[1])):
+                if k == anterior:
+                    continue
+                anterior = k
+                if v is None and descartar_tombstones:
+                    continue
+                yield k, v
+        return self._gravar_run(_itens(), tier=runs[0].tier + 1, n_esperado=sum(r.n for r in runs))
+
+    def _coletar_obsoletos(self) -> None:
+        """Fecha e apaga runs substituídos pela compactação (feito fora de leituras)."""
+        if not self._obsoletos:
+            return
+        with self._lock:
+            obsoletos, self._obsoletos = self._obsoletos, []
+        for r in obsoletos:
+            r.fechar(apagar=True)
+
+    def aguardar_compactacao(self) -> None:
+        """Bloqueia até a thread de compactação (modo background) terminar."""
+        if self._thread is not None:
+            self._thread.join()
+        self._coletar_obsoletos()
+
+    def close(self) -> None:
+        self.aguardar_compactacao()
+        for r in self._runs:
+            r.fechar(apagar=self._temporaria)
+        self._runs = []
+        if self._temporaria and os.path.isdir(self.pasta):
+            shutil.rmtree(self.pasta, ignore_errors=True)
+
+    # ----------------------------
+    # Métricas agregadas
+    # ----------------------------
+    def write_amplification(self) -> float:
+        """Bytes gravados em disco / bytes lógicos recebidos."""
+        return self.bytes_gravados / self.bytes_usuario if self.bytes_usuario else 0.0
+
+    def read_amplification(self) -> float:
+        """Média de runs efetivamente lidos por consulta que passou da memtable."""
+        return self.runs_lidos / self.leituras if self.leituras else 0.0
+
+    @property
+    def n_runs(self) -> int:
+        return len(self._runs)
+
+    # ----------------------------
+    # Utilidades opcionais
+    # ----------------------------
+    def items(self) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Visão ordenada e consolidada (memtable + runs), sem tombstones."""
+        self.aguardar_compactacao()
+        fontes = [((k, 0, v) for k, v in zip(list(self._mem_keys), list(self._mem_vals)))]
+        fontes += [((k, idade, v) for k, v in r.iterar()) for idade, r in enumerate(self._runs, 1)]
+        anterior = object()
+        for k, _, v in heapq.merge(*fontes, key=lambda t: (t[0], t[1])):
+            if k == anterior:
+                continue
+            anterior = k
+            if v is not None:
+                yield self._dec(k), v
+
+
+if __name__ == '__main__':
+    # Teste básico das funcionalidades
+    ds = LSMTreeDS(memtable_size=200)
+    ds.carregar_dados(5000)
+    ds.buscar_dados(500)
+    ds.remover_dados(500)
+    ds.print_summary('sum')
+    print(f'Runs: {ds.n_runs} | compactações: {ds.compactacoes} | '
+          f'WA: {ds.write_amplification():.2f} | RA: {ds.read_amplification():.2f}')
+    ds.close()
@@ -0,0 +1,363 @@
+# util_estrutura_matricula.py
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Optional, List, Tuple, Iterator
+
+from util_estrutura import BaseDataStructure
+
+"""
+Estruturas especializadas no formato da matrícula (string decimal zero-padded).
+Nenhuma delas usa cmp_keys: a chave é tratada dígito a dígito (trie) ou como
+inteiro (tabela de endereçamento direto).
+"""
+
+
+class RadixTrieDS(BaseDataStructure):
+    """
+    Radix trie decimal (10 filhos por nó) com compressão de caminho.
+
+    - Chave: matrícula (str apenas com dígitos)
+    - Valor: dicionário do funcionário
+
+    Cada aresta guarda um rótulo (sequência de dígitos); nós com um único filho e
+    sem valor são fundidos ao filho na remoção. Chave repetida atualiza o valor.
+
+    Métricas:
+      - node_visits: nós percorridos
+      - shifts: ponteiros/rótulos reescritos (criação, split e fusão de nós)
+      - extras: digit_checks (dígitos comparados nos rótulos)
+    """
+
+    class _Node:
+        __slots__ = ("rotulo", "filhos", "value", "terminal")
+        def __init__(self, rotulo: str = ""):
+            self.rotulo = rotulo
+            self.filhos: Optional[List[Optional["RadixTrieDS._Node"]]] = None
+            self.value: Optional[Dict[str, Any]] = None
+            self.terminal = False
+
+    def __init__(self, **params: Any) -> None:
+        super().__init__("RadixTrie(10-way|compressed)", **params)
+        self.root = RadixTrieDS._Node()
+        self.length = 0
+        self.n_nodes = 1
+        self._metricas_ignorar = {
+            'comparisons', 'rotations', 'probes', 'swaps', 'hash_collisions',
+            'hash_bucket_len_after', 'hash_cluster_len', 'hash_displacement'
+        }
+
+    # ----------------------------
+    # Implementações exigidas pela Base
+    # ----------------------------
+    def _insert_impl(self, key: str, value: Dict[str, Any]) -> bool:
+        key = self._validar(key)
+        node, i, digitos = self.root, 0, 0
+        while True:
+            self.note_visit(1)
+            if i == len(key):
+                if not node.terminal:
+                    self.length += 1
+                node.terminal = True
+                node.value = value
+                break
+            d = ord(key[i]) - 48
+            filho = node.filhos[d] if node.filhos is not None else None
+            if filho is None:
+                folha = RadixTrieDS._Node(key[i:])
+                folha.terminal = True
+                folha.value = value
+                if node.filhos is None:
+                    node.filhos = [None] * 10
+                node.filhos[d] = folha
+                self.note_shift(1)
+                self.n_nodes += 1
+                self.length += 1
+                break
+            rot = filho.rotulo
+            j = 0
+            while j < len(rot) and i + j < len(key) and rot[j] == key[i + j]:
+                j += 1
+            digitos += j + (1 if j < len(rot) and i + j < len(key) else 0)
+            if j < len(rot):
+                # split: novo nó intermediário com o prefixo comum
+                meio = RadixTrieDS._Node(rot[:j])
+                meio.filhos = [None] * 10
+                filho.rotulo = rot[j:]
+                meio.filhos[ord(rot[j]) - 48] = filho
+                node.filhos[d] = meio
+                self.note_shift(3)
+                self.n_nodes += 1
+                filho = meio
+            node, i = filho, i + j
+        self.note_extra("digit_checks", digitos)
+        return True
+
+    def _remove_impl(self, key: str) -> bool:
+        key = self._validar(key)
+        caminho, node = self._localizar(key)
+        if node is None or not node.terminal:
+            return False
+        node.terminal = False
+        node.value = None
+        self.length -= 1
+
+        # poda: remove folhas vazias e funde nós de passagem
+        while caminho:
+            pai, d = caminho[-1]
+            filhos = [f for f in node.filhos or () if f is not None]
+            if node.terminal:
+                break
+            if not filhos:
+                pai.filhos[d] = None
+                self.note_shift(1)
+                self.n_nodes -= 1
+                caminho.pop()
+                node = pai
+                continue
+            if len(filhos) == 1:
+                unico = filhos[0]
+                unico.rotulo = node.rotulo + unico.rotulo
+                pai.filhos[d] = unico
+                self.note_shift(2)
+                self.n_nodes -= 1
+            break
+        return True
+
+    def _search_impl(self, key: str) -> Optional[Dict[str, Any]]:
+        key = self._validar(key)
+        _, node = self._localizar(key)
+        if node is not None and node.terminal:
+            return node.value
+        return None
+
+    # ----------------------------
+    # Helpers internos
+    # ----------------------------
+    def _validar(self, key: Any) -> str:
+        # com codec a chave chega como int: volta à forma decimal de largura fixa
+        key = self._dec(key) if type(key) is int else str(key)
+        if not key.isdigit():
+            raise ValueError(f"RadixTrieDS aceita apenas chaves decimais: '{key}'")
+        return key
+
+    def _localizar(self, key: str) -> Tuple[List[Tuple["RadixTrieDS._Node", int]], Optional["RadixTrieDS._Node"]]:
+        """Desce pela trie; retorna o caminho [(pai, dígito)] e o nó da chave (ou None)."""
+        caminho: List[Tuple[RadixTrieDS._Node, int]] = []
+        node, i, digitos = self.root, 0, 0
+        self.note_visit(1)
+        while i < len(key):
+            if node.filhos is None:
+                node = None
+                break
+            d = ord(key[i]) - 48
+            filho = node.filhos[d]
+            if filho is None:
+                node = None
+                break
+            self.note_visit(1)
+            rot = filho.rotulo
+            digitos += len(rot)
+            if not key.startswith(rot, i):
+                node = None
+                break
+            caminho.append((node, d))
+            node, i = filho, i + len(rot)
+        self.note_extra("digit_checks", digitos)
+        return caminho, node
+
+    # ----------------------------
+    # Utilidades opcionais
+    # ----------------------------
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Percorre a trie em ordem crescente (DFS por dígito)."""
+        pilha: List[Tuple[RadixTrieDS._Node, str]] = [(self.root, "")]
+        while pilha:
+            node, prefixo = pilha.pop()
+            prefixo += node.rotulo
+            if node.terminal:
+                yield prefixo, node.value
+            if node.filhos is not None:
+                for f in reversed(node.filhos):
+                    if f is not None:
+                        pilha.append((f, prefixo))
+
+
+class DirectAddressDS(BaseDataStructure):
+    """
+    Tabela de endereçamento direto sobre o universo inteiro das matrículas.
+
+    - Chave: matrícula (str decimal) convertida para int -> índice da tabela
+    - Valor: dicionário do funcionário
+
+    Busca, inserção e remoção são O(1). Para consultas de sucessor há um bitmap
+    de ocupação em palavras de 64 bits e um resumo (1 bit por palavra não vazia),
+    no estilo das camadas de resumo da van Emde Boas: sucessor(x) examina a
+    palavra de x, depois o resumo e só então a palavra alvo.
+    A tabela dobra de tamanho se surgir uma chave fora do universo atual.
+
+    Parâmetros:
+      - universo: tamanho inicial do universo (padrão 10^6 = 6 dígitos)
+      - largura: dígitos usados para reconstruir a chave (zero-padded)
+
+    Métricas:
+      - node_visits: posições da tabela acessadas
+      - probes: palavras do bitmap/resumo examinadas (sucessor)
+      - shifts: escritas na tabela e nos bitmaps
+    """
+
+    _BITS = 64
+
+    def __init__(self, universo: int = 10 ** 6, largura: int = 6, **params: Any) -> None:
+        super().__init__(f"DirectAddress(U={universo})", universo=universo, largura=largura, **params)
+        assert universo > 0, "universo deve ser > 0"
+        self.largura = int(largura)
+        self.length = 0
+        self._alocar(int(universo))
+        self._metricas_ignorar = {
+            'comparisons', 'rotations', 'swaps', 'hash_collisions',
+            'hash_bucket_len_after', 'hash_cluster_len', 'hash_displacement'
+        }
+
+    def _alocar(self, universo: int, antigos: Optional[List[Any]] = None) -> None:
+        B = self._BITS
+        self.universo = ((universo + B * B - 1) // (B * B)) * B * B
+        self._tabela: List[Optional[Dict[str, Any]]] = [None] * self.universo
+        self._bits = array('Q', bytes(8 * (self.universo // B)))
+        self._resumo = array('Q', bytes(8 * (self.universo // (B * B))))
+        for x, v in antigos or ():
+            self._tabela[x] = v
+            self._marcar(x)
+
+    # ----------------------------
+    # Implementações exigidas pela Base
+    # ----------------------------
+    def _insert_impl(self, key: str, value: Dict[str, Any]) -> bool:
+        x = self._indice(key)
+        if x >= self.universo:
+            antigos = [(i, v) for i, v in enumerate(self._tabela) if v is not None]
+            novo = self.universo
+            while novo <= x:
+                novo *= 2
+            self._alocar(novo, antigos)
+            self.note_shift(len(antigos))
+        self.note_visit(1)
+        if self._tabela[x] is None:
+            self.length += 1
+            self._marcar(x)
+        self._tabela[x] = value
+        self.note_shift(1)
+        return True
+
+    def _remove_impl(self, key: str) -> bool:
+        x = self._indice(key)
+        self.note_visit(1)
+        if x >= self.universo or self._tabela[x] is None:
+            return False
+        self._tabela[x] = None
+        B = self._BITS
+        w = x // B
+        self._bits[w] &= ~(1 << (x % B)) & 0xFFFFFFFFFFFFFFFF
+        self.note_shift(2)
+        if not self._bits[w]:
+            self._resumo[w // B] &= ~(1 << (w % B)) & 0xFFFFFFFFFFFFFFFF
+            self.note_shift(1)
+        self.length -= 1
+        return True
+
+    def _search_impl(self, key: str) -> Optional[Dict[str, Any]]:
+        x = self._indice(key)
+        self.note_visit(1)
+        if x >= self.universo:
+            return None
+        return self._tabela[x]
+
+    # ----------------------------
+    # Sucessor via bitmap + resumo
+    # ----------------------------
+    def successor(self, key: Any) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Menor chave estritamente maior que key (registra a operação 'successor')."""
+        result_ref: Dict[str, Any] = {"_ptr": None}
+        def _do():
+            y = self._proximo(self._indice(key) + 1)
+            if y is not None:
+                self.note_visit(1)
+                result_ref["_ptr"] = (self._formatar(y), self._tabela[y])
+            return y is not None
+        self._instrument("successor", key, _do)
+        return result_ref["_ptr"]
+
+    def _proximo(self, x: int) -> Optional[int]:
+        """Menor índice ocupado >= x (ou None)."""
+        B = self._BITS
+        if x >= self.universo:
+            return None
+        w = x // B
+        self.note_probe(1)
+        resto = self._bits[w] >> (x % B)
+        if resto:
+            return x + self._lsb(resto)
+        # próxima palavra não vazia via resumo
+        s = (w + 1) // B
+        if s >= len(self._resumo):
+            return None
+        self.note_probe(1)
+        marcas = self._resumo[s] >> ((w + 1) % B)
+        base = w + 1
+        if not marcas:
+            s += 1
+            while s < len(self._resumo) and not self._resumo[s]:
+                self.note_probe(1)
+                s += 1
+            if s >= len(self._resumo):
+                return None
+            self.note_probe(1)
+            marcas = self._resumo[s]
+            base = s * B
+        w2 = base + self._lsb(marcas)
+        self.note_probe(1)
+        return w2 * B + self._lsb(self._bits[w2])
+
+    @staticmethod
+    def _lsb(v: int) -> int:
+        return (v & -v).bit_length() - 1
+
+    def _marcar(self, x: int) -> None:
+        B = self._BITS
+        w = x // B
+        self._bits[w] |= 1 << (x % B)
+        self._resumo[w // B] |= 1 << (w % B)
+        self.note_shift(2)
+
+    # ----------------------------
+    # Helpers internos
+    # ----------------------------
+    @staticmethod
+    def _indice(key: Any) -> int:
+        if isinstance(key, int):
+            x = key
+        else:
+            if not str(key).isdigit():
+                raise ValueError(f"DirectAddressDS aceita apenas chaves decimais: '{key}'")
+            x = int(key)
+        if x < 0:
+            raise ValueError("chave negativa fora do universo")
+        return x
+
+    def _formatar(self, x: int) -> str:
+        return f"{x:0{self.largura}d}"
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Percorre as chaves em ordem crescente usando o bitmap."""
+        x = self._proximo(0)
+        while x is not None:
+            yield self._formatar(x), self._tabela[x]
+            x = self._proximo(x + 1)
+
+
+if __name__ == '__main__':
+    # Teste básico das funcionalidades
+    for ds in (RadixTrieDS(), DirectAddressDS()):
+        ds.carregar_dados(1000)
+        ds.buscar_dados(250)
+        ds.remover_dados(100)
+        ds.print_summary('sum')
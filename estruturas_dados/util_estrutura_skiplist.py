@@ -0,0 +1,209 @@
+# util_estrutura_skiplist.py
+from __future__ import annotations
+from typing import Any, Dict, Optional, List, Tuple, Iterator
+import random
+
+from util_estrutura import BaseDataStructure
+
+
+class SkipListDS(BaseDataStructure):
+    """
+    Skip list probabilística (mapa ordenado) como alternativa à AVLTreeDS.
+
+    - Chave: matrícula (str)
+    - Valor: dicionário do funcionário
+
+    Armazenamento:
+      - nós identificados por índice em listas paralelas (_keys, _vals)
+      - cada nó tem uma torre (lista de índices dos próximos nós por nível)
+      - índice 0 é o cabeçalho (torre com max_level níveis); NIL = -1
+      - slots removidos vão para uma free-list e são reaproveitados
+
+    Inserção não faz rotações: só sorteia a altura da torre e religa ponteiros.
+    Chave repetida atualiza o valor (upsert).
+
+    Parâmetros:
+      - p: probabilidade de promover a torre para o nível seguinte
+      - max_level: altura máxima das torres
+      - seed: semente do sorteio de níveis (reprodutibilidade)
+
+    Métricas:
+      - comparisons: via cmp_keys
+      - node_visits: cada salto por um ponteiro de avanço
+      - shifts: escritas de ponteiros ao religar torres
+    """
+
+    NIL = -1
+
+    def __init__(self, p: float = 0.5, max_level: int = 24, seed: int = 42, **params: Any) -> None:
+        nome = f"SkipList(p={p}|max={max_level})"
+        super().__init__(nome, p=p, max_level=max_level, seed=seed, **params)
+        assert 0.0 < p < 1.0, "p deve estar em (0, 1)"
+        assert max_level >= 1, "max_level deve ser >= 1"
+        self.p = float(p)
+        self.max_level = int(max_level)
+        self._rng = random.Random(seed)
+
+        self._keys: List[Any] = [None]
+        self._vals: List[Optional[Dict[str, Any]]] = [None]
+        self._fwd: List[Optional[List[int]]] = [[self.NIL] * self.max_level]
+        self._livres: List[int] = []
+        self.level = 1
+        self.length = 0
+
+        self._metricas_ignorar = {
+            'rotations', 'probes', 'swaps', 'hash_collisions', 'hash_bucket_len_after',
+            'hash_cluster_len', 'hash_displacement'
+        }
+
+    # ----------------------------
+    # Implementações exigidas pela Base
+    # ----------------------------
+    def _insert_impl(self, key: str, value: Dict[str, Any]) -> bool:
+        update, cand = self._descer(key)
+        if cand != self.NIL and self.cmp_keys(self._keys[cand], key) == 0:
+            self._vals[cand] = value
+            return True
+
+        lvl = self._random_level()
+        if lvl > self.level:
+            for i in range(self.level, lvl):
+                update[i] = 0
+            self.level = lvl
+
+        idx = self._alocar(key, value, lvl)
+        fwd = self._fwd
+        torre = fwd[idx]
+        for i in range(lvl):
+            torre[i] = fwd[update[i]][i]
+            fwd[update[i]][i] = idx
+        self.note_shift(2 * lvl)
+        self.length += 1
+        return True
+
+    def _remove_impl(self, key: str) -> bool:
+        update, cand = self._descer(key)
+        if cand == self.NIL or self.cmp_keys(self._keys[cand], key) != 0:
+            return False
+
+        fwd = self._fwd
+        torre = fwd[cand]
+        for i in range(len(torre)):
+            fwd[update[i]][i] = torre[i]
+        self.note_shift(len(torre))
+        self._liberar(cand)
+        while self.level > 1 and fwd[0][self.level - 1] == self.NIL:
+            self.level -= 1
+        self.length -= 1
+        return True
+
+    def _search_impl(self, key: str) -> Optional[Dict[str, Any]]:
+        x = self._predecessor(key)
+        cand = self._fwd[x][0]
+        if cand != self.NIL and self.cmp_keys(self._keys[cand], key) == 0:
+            return self._vals[cand]
+        return None
+
+    # ----------------------------
+    # Helpers internos
+    # ----------------------------
+    def _random_level(self) -> int:
+        lvl = 1
+        while lvl < self.max_level and self._rng.random() < self.p:
+            lvl += 1
+        return lvl
+
+    def _descer(self, key: Any) -> Tuple[List[int], int]:
+        """Desce pelos níveis guardando o último nó < key em cada nível (vetor update)."""
+        update = [0] * self.max_level
+        fwd, keys = self._fwd, self._keys
+        x = 0
+        for i in range(self.level - 1, -1, -1):
+            nxt = fwd[x][i]
+            while nxt != self.NIL:
+                self.note_visit(1)
+                if self.cmp_keys(keys[nxt], key) < 0:
+                    x = nxt
+                    nxt = fwd[x][i]
+                else:
+                    break
+            update[i] = x
+        return update, fwd[x][0]
+
+    def _predecessor(self, key: Any) -> int:
+        """Mesmo percurso de _descer, sem montar o vetor update (busca)."""
+        fwd, keys = self._fwd, self._keys
+        x = 0
+        for i in range(self.level - 1, -1, -1):
+            nxt = fwd[x][i]
+            while nxt != self.NIL:
+                self.note_visit(1)
+                if self.cmp_keys(keys[nxt], key) < 0:
+                    x = nxt
+                    nxt = fwd[x][i]
+                else:
+                    break
+        return x
+
+    def _alocar(self, key: Any, value: Dict[str, Any], lvl: int) -> int:
+        torre = [self.NIL] * lvl
+        if self._livres:
+            idx = self._livres.pop()
+            self._keys[idx] = key
+            self._vals[idx] = value
+            self._fwd[idx] = torre
+            return idx
+        self._keys.append(key)
+        self._vals.append(value)
+        self._fwd.append(torre)
+        return len(self._keys) - 1
+
+    def _liberar(self, idx: int) -> None:
+        self._keys[idx] = None
+        self._vals[idx] = None
+        self._fwd[idx] = None
+        self._livres.append(idx)
+
+    # ----------------------------
+    # Iteração ordenada e range scan
+    # ----------------------------
+    def items(self) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Percorre o nível 0 em ordem crescente de chave."""
+        x = self._fwd[0][0]
+        while x != self.NIL:
+            yield self._dec(self._keys[x]), self._vals[x]
+            x = self._fwd[x][0]
+
+    def range_scan(self, inicio: Any, fim: Any) -> List[Tuple[Any, Dict[str, Any]]]:
+        """Retorna os pares com inicio <= chave <= fim (registra a operação 'range')."""
+        result_ref: Dict[str, Any] = {"_ptr": []}
+        def _do():
+            result_ref["_ptr"] = self._range_scan_impl(inicio, fim)
+            return len(result_ref["_ptr"]) > 0
+        self._instrument("range", (inicio, fim), _do)
+        return result_ref["_ptr"]
+
+    def _range_scan_impl(self, inicio: Any, fim: Any) -> List[Tuple[Any, Dict[str, Any]]]:
+        chave_ini, chave_fim = self._enc(inicio), self._enc(fim)
+        pares = []
+        x = self._fwd[self._predecessor(chave_ini)][0]
+        while x != self.NIL:
+            self.note_visit(1)
+            if self.cmp_keys(self._keys[x], chave_fim) > 0:
+                break
+            pares.append((self._dec(self._keys[x]), self._vals[x]))
+            x = self._fwd[x][0]
+        return pares
+
+    def to_list(self) -> list[tuple[str, Dict[str, Any]]]:
+        """Exporta como lista [(key, value), ...] (útil p/ depuração)."""
+        return list(self.items())
+
+
+if __name__ == '__main__':
+    # Teste básico das funcionalidades
+    ds = SkipListDS()
+    ds.carregar_dados(1000)
+    ds.buscar_dados(250)
+    ds.remover_dados(100)
+    ds.print_summary('sum')
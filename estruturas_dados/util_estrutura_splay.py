@@ -0,0 +1,184 @@
+# util_estrutura_splay.py
+from __future__ import annotations
+from typing import Any, Dict, Optional, Iterator, Tuple
+
+from util_estrutura import BaseDataStructure
+
+
+class SplayTreeDS(BaseDataStructure):
+    """
+    Splay tree (árvore autoajustável) para acessos concentrados em poucas chaves.
+
+    - Chave: matrícula (str)
+    - Valor: dicionário do funcionário
+
+    Toda operação (inclusive a busca) faz splay top-down iterativo (sem recursão),
+    levando a chave acessada (ou a última visitada) para a raiz. Chaves "quentes"
+    ficam perto da raiz e o custo amortizado por operação é O(log n).
+    Chave repetida atualiza o valor (upsert).
+
+    Métricas:
+      - comparisons: via cmp_keys
+      - node_visits: nós percorridos durante o splay
+      - rotations: rotações zig-zig/zag-zag feitas no splay (via note_rotation)
+      - shifts: religações de ponteiros na montagem final (inserção/remoção)
+    """
+
+    class _Node:
+        __slots__ = ("key", "value", "left", "right")
+        def __init__(self, key: Any, value: Optional[Dict[str, Any]]):
+            self.key = key
+            self.value = value
+            self.left: Optional["SplayTreeDS._Node"] = None
+            self.right: Optional["SplayTreeDS._Node"] = None
+
+    def __init__(self, **params: Any) -> None:
+        super().__init__("SplayTree(top-down)", **params)
+        self.root: Optional[SplayTreeDS._Node] = None
+        self.length = 0
+        self._metricas_ignorar = {
+            'probes', 'swaps', 'hash_collisions', 'hash_bucket_len_after',
+            'hash_cluster_len', 'hash_displacement'
+        }
+
+    # ----------------------------
+    # Implementações exigidas pela Base
+    # ----------------------------
+    def _insert_impl(self, key: str, value: Dict[str, Any]) -> bool:
+        novo = SplayTreeDS._Node(key, value)
+        if self.root is None:
+            self.root = novo
+            self.length = 1
+            self.note_shift(1)          # root = novo
+            return True
+
+        self._splay(key)
+        c = self.cmp_keys(key, self.root.key)
+        if c == 0:
+            self.root.value = value
+            return True
+        if c < 0:
+            novo.left = self.root.left
+            novo.right = self.root
+            self.root.left = None
+        else:
+            novo.right = self.root.right
+            novo.left = self.root
+            self.root.right = None
+        self.root = novo
+        self.note_shift(4)              # novo.left, novo.right, antiga raiz, root
+        self.length += 1
+        return True
+
+    def _remove_impl(self, key: str) -> bool:
+        if self.root is None:
+            return False
+        self._splay(key)
+        if self.cmp_keys(key, self.root.key) != 0:
+            return False
+
+        direita = self.root.right
+        if self.root.left is None:
+            self.root = direita
+            self.note_shift(1)
+        else:
+            # o maior da subárvore esquerda sobe para a raiz (não tem filho direito)
+            self.root = self.root.left
+            self._splay(key)
+            self.root.right = direita
+            self.note_shift(2)
+        self.length -= 1
+        return True
+
+    def _search_impl(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.root is None:
+            return None
+        self._splay(key)
+        if self.cmp_keys(key, self.root.key) == 0:
+            return self.root.value
+        return None
+
+    # ----------------------------
+    # Splay top-down (Sleator & Tarjan), iterativo
+    # ----------------------------
+    def _splay(self, key: Any) -> None:
+        t = self.root
+        cabeca = SplayTreeDS._Node(None, None)   # raízes das árvores L (right) e R (left)
+        esq = dir_ = cabeca
+        while True:
+            self.note_visit(1)
+            c = self.cmp_keys(key, t.key)
+            if c < 0:
+                if t.left is None:
+                    break
+                self.note_visit(1)
+                if self.cmp_keys(key, t.left.key) < 0:
+                    # zig-zig: rotação à direita
+                    y = t.left
+                    t.left = y.right
+                    y.right = t
+                    t = y
+                    self.note_rotation(1)
+                    if t.left is None:
+                        break
+                # liga t à árvore R
+                dir_.left = t
+                dir_ = t
+                t = t.left
+            elif c > 0:
+                if t.right is None:
+                    break
+                self.note_visit(1)
+                if self.cmp_keys(key, t.right.key) > 0:
+                    # zag-zag: rotação à esquerda
+                    y = t.right
+                    t.right = y.left
+                    y.left = t
+                    t = y
+                    self.note_rotation(1)
+                    if t.right is None:
+                        break
+                # liga t à árvore L
+                esq.right = t
+                esq = t
+                t = t.right
+            else:
+                break
+        # remonta: L < t < R
+        esq.right = t.left
+        dir_.left = t.right
+        t.left = cabeca.right
+        t.right = cabeca.left
+        self.root = t
+
+    # ----------------------------
+    # Percursos (utilitários)
+    # ----------------------------
+    def inorder_items(self) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        pilha = []
+        cur = self.root
+        while pilha or cur is not None:
+            while cur is not None:
+                pilha.append(cur)
+                cur = cur.left
+            cur = pilha.pop()
+            yield (self._dec(cur.key), cur.value)
+            cur = cur.right
+
+    def height(self) -> int:
+        if self.root is None:
+            return 0
+        h, nivel = 0, [self.root]
+        while nivel:
+            h += 1
+            nivel = [f for n in nivel for f in (n.left, n.right) if f is not None]
+        return h
+
+
+if __name__ == '__main__':
+    # Teste básico das funcionalidades
+    ds = SplayTreeDS()
+    ds.carregar_dados(1000)
+    ds.buscar_dados(250, distribuicao='zipf')
+    ds.remover_dados(100)
+    ds.print_summary('sum')
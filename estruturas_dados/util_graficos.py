@@ -27,7 +27,7 @@ class GraficosMetricas:
     
     def plotar_metricas(
         self,
-        metrics_data: List[Dict[str, Any]],
+        metrics_data: Optional[List[Dict[str, Any]]] = None,
         metrics: Optional[Iterable[str]] = None,
         agg: str = "sum",
         op_filter: Tuple[str, ...] = ("insert",),
@@ -37,7 +37,10 @@ class GraficosMetricas:
         largura: int = 16,
         altura: int = 8,
         mostrar_comparacao: bool = False,
-        gravar_csv = True
+        gravar_csv = True,
+        rejeitar_outliers: bool = False,
+        db: Any = None,
+        **filtros_db: Any
     ) -> str:
         """
         Gera gráficos com controle explícito sobre a escala utilizada.
@@ -55,12 +58,15 @@ class GraficosMetricas:
             altura: Altura do gráfico
             mostrar_comparacao: Se True, gera lado a lado linear vs log
             gravar_csv: exporta um csv com os dados do gráfico
+            rejeitar_outliers: descarta rodadas atípicas (MAD) antes de média/desvio
+            db: banco de resultados (ResultadosDB ou caminho) consultado no lugar de metrics_data;
+                filtros_db (experimento, modo, ds_names, ...) vão para rounds_summary_df
             
         Returns:
             str: Caminho do arquivo gerado
         """
         try:
-            if not metrics_data:
+            if not metrics_data and db is None:
                 raise ValueError("Lista de métricas não pode estar vazia")
             
             # Obtém DataFrame usando o método refatorado
@@ -68,8 +74,13 @@ class GraficosMetricas:
                 metrics_data=metrics_data,
                 metrics=metrics,
                 agg=agg,
-                op_filter=op_filter
+                op_filter=op_filter,
+                db=db,
+                rejeitar_outliers=rejeitar_outliers,
+                **filtros_db
             )
+            if db is not None:
+                metrics_data = [{'ds_name': d} for d in df['ds_name'].unique()]
             
             if df.empty:
                 raise ValueError("Nenhum dado encontrado para plotar.")
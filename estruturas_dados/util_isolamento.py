@@ -0,0 +1,147 @@
+# arquivo: util_isolamento.py
+"""
+Modo de isolamento dos rounds (-isolar no rodar_experimento): controle do coletor de lixo
+durante as fases medidas, registro das coletas via gc.callbacks (extras gc_coletas e
+gc_pausa_ms de cada OpRecord), afinidade de CPU e a "impressão digital" do ambiente
+(Python, modelo da CPU, governador de frequência, carga) gravada junto do round.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+import gc
+import os
+import platform
+import time
+
+GC_MODOS = ('congelar', 'desligar', 'normal')
+
+
+class MonitorGC:
+    """
+    Conta as coletas do gc e o tempo gasto nelas enquanto ligado.
+    _instrument tira um instantaneo() antes e depois de cada operação e grava a diferença.
+    """
+
+    def __init__(self) -> None:
+        self.ativo = False
+        self.coletas = 0
+        self.pausa_ns = 0
+        self.coletados = 0
+        self._t0 = 0
+
+    def _callback(self, fase: str, info: Dict[str, Any]) -> None:
+        if fase == 'start':
+            self._t0 = time.perf_counter_ns()
+        else:
+            self.coletas += 1
+            self.pausa_ns += time.perf_counter_ns() - self._t0
+            self.coletados += info.get('collected', 0)
+
+    def ligar(self) -> None:
+        if not self.ativo:
+            gc.callbacks.append(self._callback)
+            self.ativo = True
+
+    def desligar(self) -> None:
+        if self.ativo:
+            gc.callbacks.remove(self._callback)
+            self.ativo = False
+
+    def instantaneo(self) -> Tuple[int, int]:
+        return self.coletas, self.pausa_ns
+
+
+MONITOR_GC = MonitorGC()
+
+
+def _ler(caminho: str) -> Optional[str]:
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def modelo_cpu() -> str:
+    """'model name' de /proc/cpuinfo (Linux); nas outras plataformas, platform.processor()."""
+    for linha in (_ler('/proc/cpuinfo') or '').splitlines():
+        if linha.startswith('model name'):
+            return linha.split(':', 1)[1].strip()
+    return platform.processor() or platform.machine()
+
+
+def afinidade() -> Optional[list]:
+    return sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else None
+
+
+def ambiente(gc_modo: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Impressão digital do ambiente de um round. Campos indisponíveis na plataforma ficam None
+    (governador sem cpufreq, carga sem os.getloadavg, afinidade fora do Linux).
+    """
+    cpus = afinidade()
+    cpu = cpus[0] if cpus else 0
+    governador = _ler(f'/sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_governor')
+    try:
+        carga = [round(c, 2) for c in os.getloadavg()]
+    except (AttributeError, OSError):
+        carga = None
+    return {
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "plataforma": platform.platform(),
+        "cpu_modelo": modelo_cpu(),
+        "cpus": os.cpu_count(),
+        "afinidade": cpus,
+        "governador": governador.strip() if governador else None,
+        "carga_1_5_15min": carga,
+        "gc_modo": gc_modo,
+        "gc_limiares": list(gc.get_threshold()),
+    }
+
+
+def fixar_cpu(cpu: Optional[int] = None) -> Optional[int]:
+    """
+    Prende o processo a um núcleo (padrão: o último permitido, em geral menos disputado
+    por interrupções que o 0). Devolve o núcleo, ou None sem os.sched_setaffinity.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    if cpu is None:
+        cpu = max(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cpu})
+    return cpu
+
+
+@contextmanager
+def isolar(gc_modo: Optional[str] = 'congelar'):
+    """
+    Envolve as fases medidas de um round e devolve ambiente(gc_modo) (None se gc_modo é None,
+    caso em que nada muda). Antes de medir, coleta tudo e então, conforme gc_modo:
+      - 'congelar': gc.freeze() move os objetos vivos para a geração permanente; as coletas
+        que ainda ocorrem só percorrem objetos novos (pausas curtas, memória sob controle)
+      - 'desligar': gc.disable(); nenhuma pausa, mas ciclos só são liberados no fim
+      - 'normal': gc inalterado, só o registro das coletas
+    Em todos os modos as coletas viram os extras gc_coletas/gc_pausa_ms das operações.
+    """
+    if gc_modo is None:
+        yield None
+        return
+    if gc_modo not in GC_MODOS:
+        raise ValueError(f"gc_modo deve ser um de {GC_MODOS}")
+    estava_ligado = gc.isenabled()
+    gc.collect()
+    info = ambiente(gc_modo)
+    if gc_modo == 'congelar':
+        gc.freeze()
+    elif gc_modo == 'desligar':
+        gc.disable()
+    MONITOR_GC.ligar()
+    try:
+        yield info
+    finally:
+        MONITOR_GC.desligar()
+        if gc_modo == 'congelar':
+            gc.unfreeze()
+        if estava_ligado:
+            gc.enable()
+        gc.collect()
@@ -0,0 +1,298 @@
+# arquivo: util_resultados.py
+"""
+Banco local (SQLite) com os resultados dos experimentos: execuções (runs),
+rounds e agregados por (round, operação, métrica). Os dois executores
+(estruturas_dados/rodar_experimento.py e grafos/rodar_experimento.py) gravam
+aqui em lotes; rounds_summary_df(db=...) e os gráficos consultam o banco sem
+reler os JSON de ./rounds.
+"""
+from __future__ import annotations
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import json
+import math
+import os
+import sqlite3
+
+# um banco para o repositório inteiro (os dois projetos), fora das pastas de cada um
+ARQUIVO_PADRAO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resultados.sqlite3')
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    experimento  TEXT NOT NULL,            -- 'estruturas_dados' | 'grafos'
+    iniciado_em  TEXT NOT NULL,            -- ISO 8601
+    config       TEXT                      -- JSON
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    round_pk     INTEGER PRIMARY KEY AUTOINCREMENT,
+    round_id     TEXT NOT NULL UNIQUE,     -- round_id dos OpRecord (uuid)
+    run_id       INTEGER REFERENCES runs(run_id) ON DELETE SET NULL,
+    experimento  TEXT NOT NULL,
+    modo         TEXT NOT NULL,            -- ex.: 'padrao', 'checkpoints', rota de um grafo
+    ds_name      TEXT NOT NULL,
+    params       TEXT NOT NULL,            -- JSON
+    n            INTEGER NOT NULL,         -- nº de inserts no round (como em rounds_summary_df)
+    metrics_out  TEXT NOT NULL,            -- JSON: métricas que a estrutura ignora
+    info         TEXT,                     -- JSON: dados não numéricos do round
+    arquivo      TEXT                      -- arquivo de origem (nome em ./rounds), se houver
+);
+CREATE INDEX IF NOT EXISTS ix_rounds_consulta ON rounds(experimento, modo, ds_name, n);
+CREATE INDEX IF NOT EXISTS ix_rounds_run ON rounds(run_id);
+CREATE INDEX IF NOT EXISTS ix_rounds_arquivo ON rounds(arquivo);
+CREATE TABLE IF NOT EXISTS op_agregados (
+    round_pk     INTEGER NOT NULL REFERENCES rounds(round_pk) ON DELETE CASCADE,
+    op           TEXT NOT NULL,
+    metric       TEXT NOT NULL,
+    qtd          INTEGER NOT NULL,         -- registros com valor para a métrica
+    soma         REAL NOT NULL,
+    minimo       REAL NOT NULL,
+    maximo       REAL NOT NULL,
+    PRIMARY KEY (round_pk, op, metric)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_op_agregados_metric ON op_agregados(metric, op);
+"""
+
+# campos do OpRecord.to_dict que não são métricas (param_* também não)
+_NAO_METRICAS = {'ds_name', 'params', 'op', 'key', 'extras', 'round_id'}
+
+
+def _numero(v: Any) -> Optional[float]:
+    if isinstance(v, bool):
+        return float(v)
+    if isinstance(v, (int, float)) and math.isfinite(v):
+        return float(v)
+    return None
+
+
+def agregar_registros(registros: Iterable[Dict[str, Any]]) -> Dict[Tuple[str, str], List[float]]:
+    """
+    (op, métrica) -> [qtd, soma, mínimo, máximo] dos valores numéricos dos registros.
+    A soma é exata (math.fsum), como em rounds_summary_df: não depende da ordem dos registros.
+    """
+    valores: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+    for rec in registros:
+        op = rec.get('op')
+        for metric, v in rec.items():
+            if metric in _NAO_METRICAS or metric.startswith('param_'):
+                continue
+            v = _numero(v)
+            if v is not None:
+                valores[(op, metric)].append(v)
+    return {chave: [len(vs), math.fsum(vs), min(vs), max(vs)] for chave, vs in valores.items()}
+
+
+def _json(obj: Any) -> str:
+    return json.dumps(obj, sort_keys=True, default=lambda o: getattr(o, '__qualname__', type(o).__name__))
+
+
+class ResultadosDB:
+    """
+    Acesso ao banco de resultados.
+
+    - Escritas ficam num buffer e vão para o banco numa única transação a cada
+      tamanho_lote rounds (ou em descarregar()/fechar()/saída do with)
+    - Rounds são identificados pelo round_id: gravar de novo um round conhecido não faz nada
+    - Leituras (valores_por_round, execucoes) descarregam o buffer antes
+    """
+
+    def __init__(self, arquivo: str = ARQUIVO_PADRAO, tamanho_lote: int = 64) -> None:
+        self.arquivo = arquivo
+        self.tamanho_lote = max(1, int(tamanho_lote))
+        self.con = sqlite3.connect(arquivo)
+        self.con.execute("PRAGMA foreign_keys = ON")
+        self.con.execute("PRAGMA journal_mode = WAL")
+        self.con.execute("PRAGMA synchronous = NORMAL")
+        self.con.executescript(_ESQUEMA)
+        self.run_id: Optional[int] = None
+        self._pendentes: List[Tuple[Dict[str, Any], Dict[Tuple[str, str], List[float]]]] = []
+        self._conhecidos = {r for (r,) in self.con.execute("SELECT round_id FROM rounds")}
+
+    def __enter__(self) -> "ResultadosDB":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.fechar()
+
+    # ----------------------------
+    # Escrita
+    # ----------------------------
+    def iniciar_run(self, experimento: str, config: Optional[Dict[str, Any]] = None) -> int:
+        """Registra uma execução do experimento; os rounds gravados depois ficam ligados a ela."""
+        with self.con:
+            cur = self.con.execute(
+                "INSERT INTO runs (experimento, iniciado_em, config) VALUES (?, ?, ?)",
+                (experimento, datetime.now().isoformat(timespec='seconds'), _json(config or {})))
+        self.run_id = cur.lastrowid
+        return self.run_id
+
+    def conhece(self, round_id: str) -> bool:
+        return round_id in self._conhecidos
+
+    def adicionar_round(self, round_id: str, ds_name: str, params: Dict[str, Any], n: int,
+                        agregados: Dict[Tuple[str, str], List[float]], experimento: str,
+                        modo: str = 'padrao', metrics_out: Iterable[str] = (),
+                        info: Optional[Dict[str, Any]] = None, arquivo: Optional[str] = None) -> bool:
+        """Enfileira um round já agregado; devolve False se o round_id já está no banco."""
+        if round_id in self._conhecidos:
+            return False
+        self._conhecidos.add(round_id)
+        linha = dict(round_id=round_id, run_id=self.run_id, experimento=experimento, modo=modo,
+                     ds_name=ds_name, params=_json(params), n=int(n),
+                     metrics_out=_json(sorted(metrics_out)), info=_json(info) if info else None,
+                     arquivo=os.path.basename(arquivo) if arquivo else None)
+        self._pendentes.append((linha, agregados))
+        if len(self._pendentes) >= self.tamanho_lote:
+            self.descarregar()
+        return True
+
+    def adicionar_export(self, metricas: Dict[str, Any], experimento: str = 'estruturas_dados',
+                         modo: str = 'padrao', arquivo: Optional[str] = None) -> int:
+        """
+        Enfileira os rounds de um export_metrics_json (um por round_id dos registros,
+        como em rounds_summary_df). Devolve quantos rounds eram novos.
+        """
+        por_round: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for rec in metricas.get("metrics", []):
+            por_round[rec.get("round_id") or metricas.get("round_id") or "unknown"].append(rec)
+        info = {k: metricas[k] for k in ("checkpoint", "ambiente") if k in metricas} or None
+        novos = 0
+        for round_id, registros in por_round.items():
+            if round_id in self._conhecidos:
+                continue
+            n = sum(1 for r in registros if r.get("op") == "insert")
+            novos += self.adicionar_round(
+                round_id, metricas.get("ds_name"), metricas.get("params", {}), n,
+                agregar_registros(registros), experimento, modo,
+                metricas.get("metrics_out", []), info, arquivo)
+        return novos
+
+    def descarregar(self) -> None:
+        """Grava o buffer numa única transação."""
+        if not self._pendentes:
+            return
+        with self.con:
+            for linha, agregados in self._pendentes:
+                cur = self.con.execute(
+                    "INSERT INTO rounds (round_id, run_id, experimento, modo, ds_name, params, n, metrics_out, info, arquivo) "
+                    "VALUES (:round_id, :run_id, :experimento, :modo, :ds_name, :params, :n, :metrics_out, :info, :arquivo)",
+                    linha)
+                pk = cur.lastrowid
+                self.con.executemany(
+                    "INSERT INTO op_agregados (round_pk, op, metric, qtd, soma, minimo, maximo) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(pk, op, metric, *a) for (op, metric), a in agregados.items()])
+        self._pendentes = []
+
+    def remover_arquivos(self, arquivos: Iterable[str]) -> int:
+        """Remove os rounds gravados a partir desses arquivos (ex.: rounds obsoletos do cache)."""
+        self.descarregar()
+        nomes = [(os.path.basename(a),) for a in arquivos]
+        with self.con:
+            ids = [r for (a,) in nomes for (r,) in self.con.execute("SELECT round_id FROM rounds WHERE arquivo = ?", (a,))]
+            self.con.executemany("DELETE FROM rounds WHERE arquivo = ?", nomes)
+        self._conhecidos.difference_update(ids)
+        return len(ids)
+
+    def fechar(self) -> None:
+        self.descarregar()
+        self.con.close()
+
+    # ----------------------------
+    # Consulta
+    # ----------------------------
+    def _filtro(self, experimento: Optional[str], modo: Optional[str], ds_names: Optional[Iterable[str]],
+                run_id: Optional[int]) -> Tuple[str, List[Any]]:
+        condicoes, args = [], []
+        if experimento is not None:
+            condicoes.append("r.experimento = ?")
+            args.append(experimento)
+        if modo is not None:
+            condicoes.append("r.modo = ?")
+            args.append(modo)
+        if ds_names is not None:
+            ds_names = list(ds_names)
+            condicoes.append(f"r.ds_name IN ({','.join('?' * len(ds_names))})")
+            args.extend(ds_names)
+        if run_id is not None:
+            condicoes.append("r.run_id = ?")
+            args.append(run_id)
+        return (" AND " + " AND ".join(condicoes)) if condicoes else "", args
+
+    def ds_names(self, experimento: Optional[str] = None, modo: Optional[str] = None) -> List[str]:
+        self.descarregar()
+        where, args = self._filtro(experimento, modo, None, None)
+        return [d for (d,) in self.con.execute(f"SELECT DISTINCT r.ds_name FROM rounds r WHERE 1=1{where} ORDER BY 1", args)]
+
+    def valores_por_round(self, metrics: Iterable[str], agg: str = "sum", op_filter: Tuple[str, ...] = ("insert",),
+                          experimento: Optional[str] = None, modo: Optional[str] = None,
+                          ds_names: Optional[Iterable[str]] = None, run_id: Optional[int] = None,
+                          ignorar_metrics_out: bool = False) -> Dict[Tuple[str, int, str], List[float]]:
+        """
+        (ds_name, N, métrica) -> valor de cada round, agregado dentro do round sobre as
+        operações de op_filter ("sum" ou "mean"), com as mesmas regras de rounds_summary_df.
+        'load_factor' é N/M dos rounds com params M.
+        ignorar_metrics_out=True descarta a métrica nos rounds das estruturas que a ignoram.
+        """
+        if agg not in ("sum", "mean"):
+            raise ValueError("agg deve ser 'sum' ou 'mean'.")
+        self.descarregar()
+        metrics = list(metrics)
+        ops = list(op_filter)
+        where, args = self._filtro(experimento, modo, ds_names, run_id)
+        por_chave: Dict[Tuple[str, int, str], List[float]] = defaultdict(list)
+
+        reais = [m for m in metrics if m != "load_factor"]
+        if reais and ops:
+            # as somas por operação são combinadas com math.fsum (o SUM do SQLite acumula em
+            # ordem arbitrária), para dar exatamente o valor de rounds_summary_df sobre os JSON
+            sql = (f"SELECT r.round_pk, r.ds_name, r.n, a.metric, a.soma, a.qtd, r.metrics_out "
+                   f"FROM rounds r JOIN op_agregados a ON a.round_pk = r.round_pk "
+                   f"WHERE a.op IN ({','.join('?' * len(ops))}) AND a.metric IN ({','.join('?' * len(reais))}){where} "
+                   f"ORDER BY r.round_pk")
+            por_round: Dict[Tuple[int, str], List[Any]] = {}
+            for round_pk, ds_name, n, metric, soma, qtd, metrics_out in self.con.execute(sql, ops + reais + args):
+                if ignorar_metrics_out and metric in json.loads(metrics_out):
+                    continue
+                r = por_round.setdefault((round_pk, metric), [ds_name, n, [], 0])
+                r[2].append(soma)
+                r[3] += qtd
+            for (_, metric), (ds_name, n, somas, qtd) in por_round.items():
+                soma = math.fsum(somas)
+                por_chave[(ds_name, n, metric)].append(soma if agg == "sum" else soma / qtd)
+
+        if "load_factor" in metrics and ops:
+            sql = (f"SELECT r.ds_name, r.n, r.params FROM rounds r WHERE EXISTS "
+                   f"(SELECT 1 FROM op_agregados a WHERE a.round_pk = r.round_pk AND a.op IN ({','.join('?' * len(ops))})){where} "
+                   f"ORDER BY r.round_pk")
+            for ds_name, n, params in self.con.execute(sql, ops + args):
+                m = json.loads(params).get("M")
+                if m:
+                    por_chave[(ds_name, n, "load_factor")].append(n / float(m))
+        return por_chave
+
+    def execucoes(self, experimento: str, modo: Optional[str] = None, op: Optional[str] = None,
+                  ultimo_run: bool = False) -> List[Dict[str, Any]]:
+        """
+        Um dicionário por round (na ordem de gravação): ds_name, params, n, info e a soma
+        de cada métrica (nas operações op, ou em todas). ultimo_run=True fica só com os
+        rounds do run mais recente que tem rounds nesse (experimento, modo).
+        """
+        self.descarregar()
+        where, args = self._filtro(experimento, modo, None, None)
+        if ultimo_run:
+            where += " AND r.run_id = (SELECT MAX(r.run_id) FROM rounds r WHERE 1=1" + where + ")"
+            args = args + args
+        rounds = {}
+        for pk, ds_name, params, n, info, run_id in self.con.execute(
+                f"SELECT r.round_pk, r.ds_name, r.params, r.n, r.info, r.run_id FROM rounds r WHERE 1=1{where} ORDER BY r.round_pk", args):
+            rounds[pk] = {"ds_name": ds_name, "params": json.loads(params), "n": n, "run_id": run_id,
+                          "info": json.loads(info) if info else {}}
+        if rounds:
+            filtro_op, args_op = ("AND op = ?", [op]) if op is not None else ("", [])
+            for pk, metric, soma in self.con.execute(
+                    f"SELECT round_pk, metric, SUM(soma) FROM op_agregados "
+                    f"WHERE round_pk IN ({','.join('?' * len(rounds))}) {filtro_op} GROUP BY round_pk, metric",
+                    list(rounds) + args_op):
+                rounds[pk][metric] = soma
+        return list(rounds.values())
@@ -0,0 +1,229 @@
+# arquivo: util_workload.py
+"""
+Gerador de cargas de trabalho no estilo YCSB: fluxos determinísticos (semente)
+de operações read/insert/update/delete/scan/rmw sobre as matrículas de um conjunto
+de dados, para reexecução em qualquer BaseDataStructure (executar_workload).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+import random
+
+from util_dados import get_dados
+
+OPERACOES = ('read', 'insert', 'update', 'delete', 'scan', 'rmw')
+DISTRIBUICOES = ('uniforme', 'zipfian', 'latest', 'hotspot')
+
+# Workloads centrais do YCSB (no F, cada read-modify-write vira read + update da mesma chave)
+WORKLOADS_YCSB: Dict[str, Dict[str, Any]] = {
+    'A': dict(proporcoes={'read': 0.5, 'update': 0.5}, distribuicao='zipfian'),
+    'B': dict(proporcoes={'read': 0.95, 'update': 0.05}, distribuicao='zipfian'),
+    'C': dict(proporcoes={'read': 1.0}, distribuicao='zipfian'),
+    'D': dict(proporcoes={'read': 0.95, 'insert': 0.05}, distribuicao='latest'),
+    'E': dict(proporcoes={'scan': 0.95, 'insert': 0.05}, distribuicao='zipfian'),
+    'F': dict(proporcoes={'read': 0.5, 'rmw': 0.5}, distribuicao='zipfian'),
+}
+
+
+@dataclass
+class Operacao:
+    op: str                                  # read | insert | update | delete | scan
+    key: str                                 # matrícula (início do intervalo no scan)
+    value: Optional[Dict[str, Any]] = None   # insert/update
+    fim: Optional[str] = None                # scan: fim do intervalo (inclusivo)
+    existe: bool = True                      # a chave existia quando a operação foi gerada
+
+
+class _Zipf:
+    """
+    Gerador Zipfiano do YCSB (Gray et al., "Quickly generating billion-record
+    synthetic databases"): rank em [0, n) com P(r) ~ 1/(r+1)^theta.
+    Quando n cresce, zeta(n) é atualizado só com os termos novos.
+    """
+
+    def __init__(self, theta: float = 0.99) -> None:
+        self.theta = theta
+        self.n = 0
+        self.zetan = 0.0
+        self.zeta2 = 1.0 + 0.5 ** theta
+        self.alpha = 1.0 / (1.0 - theta)
+
+    def _ajustar(self, n: int) -> None:
+        self.zetan += sum(1.0 / (i ** self.theta) for i in range(self.n + 1, n + 1))
+        self.n = n
+        self.eta = (1 - (2.0 / n) ** (1 - self.theta)) / (1 - self.zeta2 / self.zetan) if n > 2 else 0.0
+
+    def amostrar(self, rnd: random.Random, n: int) -> int:
+        if n > self.n:
+            self._ajustar(n)
+        u = rnd.random()
+        uz = u * self.zetan
+        if uz < 1.0 or n == 1:
+            return 0
+        if uz < self.zeta2:
+            return 1
+        return min(n - 1, int(n * (self.eta * u - self.eta + 1) ** self.alpha))
+
+
+def _fnv1a64(x: int) -> int:
+    h = 0xcbf29ce484222325
+    for _ in range(8):
+        h ^= x & 0xff
+        h = (h * 0x100000001b3) & 0xffffffffffffffff
+        x >>= 8
+    return h
+
+
+class GeradorWorkload:
+    """
+    Gera operações sobre um espaço de chaves que começa com chaves_iniciais
+    (na ordem de carga) e cresce com os inserts.
+
+    Parâmetros:
+      - proporcoes: pesos por operação, ex. {'read': 0.9, 'insert': 0.1}
+          ('rmw' gera um read seguido do update da mesma chave)
+      - distribuicao: como escolher a chave alvo entre as existentes
+          'uniforme' -> qualquer chave com a mesma chance
+          'zipfian'  -> poucas chaves muito populares, espalhadas pelo espaço (hash do rank)
+          'latest'   -> Zipf sobre a ordem de inserção: as mais recentes são as mais populares
+          'hotspot'  -> hotspot_ops das operações caem em hotspot_dados das chaves
+      - negativas: fração dos reads feitos com chaves ausentes
+      - scan_max: tamanho máximo (uniforme em [1, scan_max]) do intervalo de matrículas de um scan
+      - seed: mesma semente + mesmos parâmetros -> mesmo fluxo
+
+    Reads/updates/deletes escolhem chaves vivas (uma chave removida é sorteada de novo).
+    Inserts usam matrículas novas, a partir da maior matrícula inicial + 1.
+    """
+
+    def __init__(self, chaves_iniciais: Iterable[str], proporcoes: Optional[Dict[str, float]] = None,
+                 distribuicao: str = 'zipfian', negativas: float = 0.0, seed: int = 42,
+                 zipf_theta: float = 0.99, hotspot_dados: float = 0.2, hotspot_ops: float = 0.8,
+                 scan_max: int = 100) -> None:
+        proporcoes = dict(proporcoes or {'read': 1.0})
+        invalidas = set(proporcoes) - set(OPERACOES)
+        if invalidas:
+            raise ValueError(f"operações inválidas: {sorted(invalidas)}; use {OPERACOES}")
+        if distribuicao not in DISTRIBUICOES:
+            raise ValueError(f"distribuicao deve ser uma de {DISTRIBUICOES}")
+        if not 0.0 <= negativas <= 1.0:
+            raise ValueError("negativas deve estar em [0, 1]")
+        if not 0.0 < zipf_theta < 1.0:
+            raise ValueError("zipf_theta deve estar em (0, 1)")
+        self.ops = [op for op in OPERACOES if proporcoes.get(op, 0) > 0]
+        self.pesos = [proporcoes[op] for op in self.ops]
+        self.distribuicao = distribuicao
+        self.negativas = negativas
+        self.hotspot_dados = hotspot_dados
+        self.hotspot_ops = hotspot_ops
+        self.scan_max = max(1, int(scan_max))
+        self.rnd = random.Random(seed)
+        self._zipf = _Zipf(zipf_theta)
+
+        self.chaves: List[str] = list(chaves_iniciais)      # ordem de inserção
+        self.largura = max((len(k) for k in self.chaves), default=6)
+        self._vivas = list(self.chaves)                     # para sorteio uniforme O(1)
+        self._pos_viva = {k: i for i, k in enumerate(self._vivas)}
+        self.proxima = max((int(k) for k in self.chaves), default=-1) + 1
+        self._versao = 0
+        self._pendente: Optional[Operacao] = None           # update de um rmw já lido
+
+    # ----------------------------
+    # Escolha de chaves
+    # ----------------------------
+    def _indice(self) -> int:
+        n, rnd = len(self.chaves), self.rnd
+        if self.distribuicao == 'uniforme':
+            return rnd.randrange(n)
+        if self.distribuicao == 'zipfian':
+            return _fnv1a64(self._zipf.amostrar(rnd, n)) % n
+        if self.distribuicao == 'latest':
+            return n - 1 - self._zipf.amostrar(rnd, n)
+        quentes = max(1, int(n * self.hotspot_dados))
+        if rnd.random() < self.hotspot_ops or quentes >= n:
+            return rnd.randrange(quentes)
+        return quentes + rnd.randrange(n - quentes)
+
+    def _chave_viva(self) -> Optional[str]:
+        if not self._vivas:
+            return None
+        for _ in range(8):
+            k = self.chaves[self._indice()]
+            if k in self._pos_viva:
+                return k
+        return self._vivas[self.rnd.randrange(len(self._vivas))]
+
+    def _chave_ausente(self) -> str:
+        # acima da próxima matrícula de insert nada existe ainda
+        return self._formatar(self.proxima + self.rnd.randrange(max(1, len(self.chaves))))
+
+    def _formatar(self, m: int) -> str:
+        return f"{m:0{self.largura}d}"
+
+    def _valor(self, key: str) -> Dict[str, Any]:
+        self._versao += 1
+        return {"Matricula": key, "Versao": self._versao}
+
+    def _matar(self, key: str) -> None:
+        i = self._pos_viva.pop(key)
+        ultima = self._vivas.pop()
+        if ultima != key:
+            self._vivas[i] = ultima
+            self._pos_viva[ultima] = i
+
+    # ----------------------------
+    # Geração
+    # ----------------------------
+    def proxima_operacao(self) -> Operacao:
+        if self._pendente is not None:
+            pendente, self._pendente = self._pendente, None
+            return pendente
+        op = self.rnd.choices(self.ops, weights=self.pesos)[0]
+        if op == 'insert' or (op != 'read' and not self._vivas):
+            key = self._formatar(self.proxima)
+            self.proxima += 1
+            self.chaves.append(key)
+            self._pos_viva[key] = len(self._vivas)
+            self._vivas.append(key)
+            return Operacao('insert', key, self._valor(key), existe=False)
+        if op == 'read':
+            if self.rnd.random() < self.negativas or not self._vivas:
+                return Operacao('read', self._chave_ausente(), existe=False)
+            return Operacao('read', self._chave_viva())
+        key = self._chave_viva()
+        if op == 'update':
+            return Operacao('update', key, self._valor(key))
+        if op == 'delete':
+            self._matar(key)
+            return Operacao('delete', key)
+        if op == 'rmw':
+            self._pendente = Operacao('update', key, self._valor(key))
+            return Operacao('read', key)
+        fim = self._formatar(int(key) + self.rnd.randint(1, self.scan_max) - 1)
+        return Operacao('scan', key, fim=fim)
+
+    def gerar(self, qtd: int) -> List[Operacao]:
+        """Próximas qtd operações (chamadas seguidas continuam o mesmo fluxo)."""
+        return [self.proxima_operacao() for _ in range(qtd)]
+
+
+def chaves_do_dataset(qtd: int = 1000, path: str = './dados') -> List[str]:
+    """Matrículas na ordem em que carregar_dados(qtd) as insere."""
+    return [d['Matricula'] for d in get_dados(qtd, path)]
+
+
+def workload_ycsb(letra: str, qtd_dados: int = 1000, path: str = './dados', **params: Any) -> GeradorWorkload:
+    """GeradorWorkload com a mistura de um workload central do YCSB (A-F) sobre dados_<qtd_dados>."""
+    letra = letra.upper()
+    if letra not in WORKLOADS_YCSB:
+        raise ValueError(f"workload deve ser um de {sorted(WORKLOADS_YCSB)}")
+    config = {**WORKLOADS_YCSB[letra], **params}
+    return GeradorWorkload(chaves_do_dataset(qtd_dados, path), **config)
+
+
+if __name__ == "__main__":
+    # Exemplo: workload A (50% read / 50% update, Zipf) com 10% de buscas negativas
+    from collections import Counter
+    g = workload_ycsb('A', 1000, negativas=0.1, seed=1)
+    ops = g.gerar(10_000)
+    print(Counter(o.op for o in ops))
+    print(Counter(o.key for o in ops if o.op == 'read').most_common(5))
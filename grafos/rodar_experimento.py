@@ -6,12 +6,19 @@ Pode ser usado para comparar desempenho dos algoritmos em diferentes grafos.
 
 Utiliza o pacote util_graficos para gerar gráficos a partir dos dados coletados.
 Os arquivos são salvos na pasta "resultados".
+Cada execução também é gravada no banco de resultados compartilhado (estruturas_dados/util_resultados.py);
+com -graficos-db os gráficos são refeitos a partir do banco, sem rodar os algoritmos.
 '''
 
 import os
+import sys
 import time
+import uuid
 import statistics
 import pandas as pd
+# o banco de resultados é o mesmo do projeto de estruturas de dados
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'estruturas_dados'))
+from util_resultados import ResultadosDB
 from util_grafos import GrafosDijkstra
 from util_grafos_aestrela import GrafoAEstrela
 from util_grafos_outros import GrafoBFS, GrafoDFS, GrafoGananciosa
@@ -20,6 +27,9 @@ from util_visualizacao import VisualizacaoGrafo
 
 ARQUIVO_GRAFO = 'base_grafos/grafo_acai.json'
 NUM_EXECUCOES = 5  # Número de execuções para calcular média e desvio padrão
+# métricas numéricas de uma execução gravadas no banco de resultados (operação 'encontrar_caminho')
+METRICAS_EXECUCAO = ('encontrou_caminho', 'custo_total', 'num_nos_caminho', 'num_nos_visitados',
+                     'num_iteracoes', 'tempo_execucao', 'nos_expandidos', 'consumo_memoria')
 
 def executar_algoritmo(classe_grafo, nome_algoritmo, arquivo_grafo, origem, destino):
     """Executa um algoritmo específico e coleta suas métricas.
@@ -97,7 +107,51 @@ def nome_arquivo_visualizacao(arquivo_grafo, nome_algoritmo, origem, destino):
     """
     return f"./resultados/{os.path.splitext(os.path.basename(arquivo_grafo))[0]}_{nome_algoritmo}_{origem}_{destino}.html"
 
-def executar_experimento_completo(arquivo_grafo, origem, destino, num_execucoes=5):
+def rota_resultados(arquivo_grafo, origem, destino):
+    """Identificador da rota (mesmo nome base do CSV), usado como 'modo' no banco de resultados."""
+    return f"{os.path.splitext(os.path.basename(arquivo_grafo))[0]}_{origem}_{destino}"
+
+def gravar_execucoes(db, execucoes, arquivo_grafo, origem, destino):
+    """Enfileira as execuções no banco de resultados (um round por execução, sem N)."""
+    params = {'grafo': os.path.basename(arquivo_grafo), 'origem': origem, 'destino': destino}
+    for resultado in execucoes:
+        agregados = {}
+        for metrica in METRICAS_EXECUCAO:
+            valor = float(resultado[metrica])
+            if valor != float('inf'):
+                agregados[('encontrar_caminho', metrica)] = [1, valor, valor, valor]
+        db.adicionar_round(str(uuid.uuid4()), resultado['algoritmo'], params, 0, agregados,
+                           experimento='grafos', modo=rota_resultados(arquivo_grafo, origem, destino),
+                           info={'caminho': resultado['caminho']})
+
+def resumir_execucoes(execucoes):
+    """Resultado da primeira execução com médias/desvios de tempo e memória de todas."""
+    tempos = [e['tempo_execucao'] for e in execucoes]
+    memorias = [e['consumo_memoria'] for e in execucoes]
+
+    # Usa os dados da primeira execução como base (caminho, custo, etc. são determinísticos)
+    resultado_base = execucoes[0].copy()
+    resultado_base['tempo_execucao_medio'] = statistics.mean(tempos)
+    resultado_base['tempo_desvio_padrao'] = statistics.stdev(tempos) if len(tempos) > 1 else 0
+    resultado_base['consumo_memoria_medio'] = statistics.mean(memorias)
+    resultado_base['consumo_memoria_desvio_padrao'] = statistics.stdev(memorias) if len(memorias) > 1 else 0
+    resultado_base['num_execucoes'] = len(execucoes)
+    return resultado_base
+
+def resultados_do_banco(db, arquivo_grafo, origem, destino):
+    """DataFrame no formato de executar_experimento_completo, com as execuções do run mais recente da rota."""
+    por_algoritmo = {}
+    for r in db.execucoes('grafos', rota_resultados(arquivo_grafo, origem, destino), 'encontrar_caminho', ultimo_run=True):
+        # mesmas chaves (e ordem) de executar_algoritmo; custo infinito não vai para o banco
+        resultado = {'algoritmo': r['ds_name'], 'origem': origem, 'destino': destino,
+                     'encontrou_caminho': bool(r.get('encontrou_caminho', 0)),
+                     'caminho': r['info'].get('caminho', ''),
+                     'custo_total': r.get('custo_total', float('inf'))}
+        resultado.update({m: r.get(m, 0) for m in METRICAS_EXECUCAO if m not in resultado})
+        por_algoritmo.setdefault(r['ds_name'], []).append(resultado)
+    return pd.DataFrame([resumir_execucoes(execucoes) for execucoes in por_algoritmo.values()])
+
+def executar_experimento_completo(arquivo_grafo, origem, destino, num_execucoes=5, db=None):
     """Executa todos os algoritmos múltiplas vezes e calcula estatísticas.
     
     Args:
@@ -105,6 +159,7 @@ def executar_experimento_completo(arquivo_grafo, origem, destino, num_execucoes=
         origem: Nó de origem
         destino: Nó de destino
         num_execucoes: Número de execuções para estatísticas
+        db: ResultadosDB opcional; as execuções da rota são gravadas numa única transação
         
     Returns:
         pandas.DataFrame: DataFrame com todos os resultados
@@ -129,8 +184,6 @@ def executar_experimento_completo(arquivo_grafo, origem, destino, num_execucoes=
         print(f"Executando {nome_algoritmo}...")
         
         execucoes = []
-        tempos = []
-        memorias = []
         
         arq_vis = nome_arquivo_visualizacao(arquivo_grafo, nome_algoritmo, origem, destino)
         if os.path.isfile(arq_vis):
@@ -139,24 +192,13 @@ def executar_experimento_completo(arquivo_grafo, origem, destino, num_execucoes=
         for i in range(num_execucoes):
             resultado = executar_algoritmo(classe_grafo, nome_algoritmo, arquivo_grafo, origem, destino)
             execucoes.append(resultado)
-            tempos.append(resultado['tempo_execucao'])
-            memorias.append(resultado['consumo_memoria'])
-        
-        # Calcula estatísticas de tempo (que pode variar entre execuções)
-        tempo_medio = statistics.mean(tempos)
-        tempo_desvio = statistics.stdev(tempos) if len(tempos) > 1 else 0
+        if db is not None:
+            gravar_execucoes(db, execucoes, arquivo_grafo, origem, destino)
         
-        # Calcula estatísticas de memória
-        memoria_media = statistics.mean(memorias)
-        memoria_desvio = statistics.stdev(memorias) if len(memorias) > 1 else 0
-        
-        # Usa os dados da primeira execução como base (caminho, custo, etc. são determinísticos)
-        resultado_base = execucoes[0].copy()
-        resultado_base['tempo_execucao_medio'] = tempo_medio
-        resultado_base['tempo_desvio_padrao'] = tempo_desvio
-        resultado_base['consumo_memoria_medio'] = memoria_media
-        resultado_base['consumo_memoria_desvio_padrao'] = memoria_desvio
-        resultado_base['num_execucoes'] = num_execucoes
+        # Calcula estatísticas de tempo e memória (que podem variar entre execuções)
+        resultado_base = resumir_execucoes(execucoes)
+        tempo_medio, tempo_desvio = resultado_base['tempo_execucao_medio'], resultado_base['tempo_desvio_padrao']
+        memoria_media, memoria_desvio = resultado_base['consumo_memoria_medio'], resultado_base['consumo_memoria_desvio_padrao']
         
         resultados.append(resultado_base)
         
@@ -171,6 +213,8 @@ def executar_experimento_completo(arquivo_grafo, origem, destino, num_execucoes=
             print(f"  Caminho não encontrado")
         print()
     
+    if db is not None:
+        db.descarregar()
     return pd.DataFrame(resultados)
 
 def criar_pasta_resultados(limpar = True):
@@ -210,11 +254,25 @@ def main():
     """Função principal que executa o experimento completo."""
     print("=== EXPERIMENTO DE COMPARAÇÃO DE ALGORITMOS ===\n")
     
-    # Cria pasta de resultados
-    criar_pasta_resultados(True)
-    
     # Configurações do experimento
     rotas = [('A', 'J'), ('H', 'J'), ('A', 'K'), ('H', 'G'), ('L', 'K')]
+    db = ResultadosDB()
+
+    if '-graficos-db' in sys.argv:
+        # refaz os gráficos com as execuções já gravadas no banco
+        criar_pasta_resultados(False)
+        for origem, destino in rotas:
+            df_resultados = resultados_do_banco(db, ARQUIVO_GRAFO, origem, destino)
+            if df_resultados.empty:
+                print(f"Rota {origem} -> {destino} sem execuções no banco {db.arquivo}")
+                continue
+            gerar_graficos(df_resultados, ARQUIVO_GRAFO, origem, destino, mostrar=False)
+        db.fechar()
+        return
+
+    # Cria pasta de resultados
+    criar_pasta_resultados(True)
+    db.iniciar_run('grafos', {'grafo': ARQUIVO_GRAFO, 'rotas': rotas, 'num_execucoes': NUM_EXECUCOES})
     for origem, destino in rotas:
         print(f"\n--- Rota: {origem} -> {destino} ---")
         # Executa o experimento
@@ -227,7 +285,7 @@ def main():
         gerar_graficos(df_resultados, ARQUIVO_GRAFO, origem, destino, mostrar=False)
     
         # Executa o experimento
-        df_resultados = executar_experimento_completo(ARQUIVO_GRAFO, origem, destino, NUM_EXECUCOES)
+        df_resultados = executar_experimento_completo(ARQUIVO_GRAFO, origem, destino, NUM_EXECUCOES, db=db)
         
         # Salva os resultados em CSV
         arquivo_csv = salvar_csv(df_resultados, ARQUIVO_GRAFO, origem, destino)
@@ -243,6 +301,7 @@ def main():
         
         print(f"\n=== EXPERIMENTO CONCLUÍDO ===")
         print(f"Arquivo CSV: {arquivo_csv}")
+    db.fechar()
 
 def limpar_pasta_resultados():
     """Limpa a pasta 'resultados' removendo arquivos antigos."""